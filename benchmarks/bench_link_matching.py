@@ -0,0 +1,105 @@
+"""
+링크-줄 매칭 벤치마크.
+수천 개의 링크가 있는 합성 페이지(색인/참고문헌 페이지와 비슷한 형태)를 만들고,
+줄마다 모든 링크를 검사하던 기존 방식과 격자 공간 인덱스 방식을 비교합니다.
+
+    python -m benchmarks.bench_link_matching --lines 2000 --links 2000
+"""
+
+import argparse
+import time
+
+import fitz
+
+from benchmarks.synthetic_pdf import add_uri_links
+from src.common.spatial_index import GridSpatialIndex
+from src.infrastructure.pdf_parsing.layout_extractor import extract_page_layout
+
+
+def make_link_dense_page(line_count: int, link_count: int, columns: int = 4):
+    """여러 단에 짧은 줄이 빽빽하고, 줄마다 링크가 걸린 큰 페이지를 만듭니다."""
+    rows = -(-line_count // columns)
+    line_height = 10
+    column_width = 150
+    doc = fitz.open()
+    page = doc.new_page(
+        width=columns * column_width + 40, height=rows * line_height + 40
+    )
+    for i in range(line_count):
+        column, row = divmod(i, rows)
+        x = 20 + column * column_width
+        y = 30 + row * line_height
+        page.insert_text((x, y), f"Entry {i}, p. {i % 997}", fontsize=7)
+    rects = []
+    for i in range(link_count):
+        column, row = divmod(i % line_count, rows)
+        x = 20 + column * column_width
+        y = 30 + row * line_height
+        rects.append((x + 60, y - 7, x + 90, y + 1))
+    page = add_uri_links(doc, page, rects, "https://example.com/entry/")
+    return doc, page
+
+
+def naive_match(line_rects, links):
+    """기존 방식: 줄마다 모든 링크를 순서대로 검사합니다."""
+    matched = []
+    for line_rect in line_rects:
+        uri = None
+        for link_rect, link_uri in links:
+            if link_rect.intersects(line_rect):
+                uri = link_uri
+                break
+        matched.append(uri)
+    return matched
+
+
+def indexed_match(line_rects, links):
+    index = GridSpatialIndex.from_items((tuple(rect), uri) for rect, uri in links)
+    return [index.first(tuple(line_rect)) for line_rect in line_rects]
+
+
+def best_of(repeat, func, *args):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="링크-줄 매칭 벤치마크")
+    parser.add_argument("--lines", type=int, default=2000)
+    parser.add_argument("--links", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    doc, page = make_link_dense_page(args.lines, args.links)
+    links = [(fitz.Rect(link["from"]), link["uri"]) for link in page.get_links()]
+    line_rects = [
+        fitz.Rect(line["bbox"])
+        for block in page.get_text("dict")["blocks"]
+        if block["type"] == 0
+        for line in block["lines"]
+    ]
+
+    naive_time, naive_result = best_of(args.repeat, naive_match, line_rects, links)
+    indexed_time, indexed_result = best_of(
+        args.repeat, indexed_match, line_rects, links
+    )
+    if naive_result != indexed_result:
+        print("결과 불일치: 공간 인덱스가 기존 방식과 다른 링크를 찾았습니다.")
+        return 1
+    layout_time, _ = best_of(args.repeat, extract_page_layout, page, 0)
+    doc.close()
+
+    print(f"lines: {len(line_rects)}, links: {len(links)}")
+    print(f"naive matching:   {naive_time * 1000:9.1f} ms")
+    print(f"indexed matching: {indexed_time * 1000:9.1f} ms")
+    print(f"speedup:          {naive_time / indexed_time:9.1f}x")
+    print(f"full page parse:  {layout_time * 1000:9.1f} ms (with index)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
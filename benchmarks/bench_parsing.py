@@ -0,0 +1,270 @@
+"""
+페이지 파싱 벤치마크.
+합성 PDF(synthetic_pdf)로 여러 종류의 어려운 문서를 만들고, 문서마다
+PdfParsingService.parse_page의 페이지당 시간(p50/p95/최대), 문서 전체 시간,
+tracemalloc으로 잰 페이지 파싱 중 최대 메모리 사용량을 측정합니다.
+
+    python -m benchmarks.bench_parsing
+    python -m benchmarks.bench_parsing --profile link_dense --runs 9
+    python -m benchmarks.bench_parsing --pages 30 --links 500 --images 80
+
+--baseline을 지정하면 저장된 기준 결과보다 허용 범위 이상 느려지거나 메모리를 더 쓰는
+항목이 있을 때 종료 코드 1로 끝나므로 파서 변경을 검증하는 데 사용할 수 있습니다.
+--save-baseline으로 현재 결과를 기준으로 저장합니다. 절대 시간은 장비마다 다르므로
+기준 결과에는 같은 프로세스에서 잰 보정 작업(calibration) 시간에 대한 비율만 저장하고
+비교합니다. 문서마다 --runs번 측정하고 각 항목의 중앙값을 쓰므로, 한두 번의 측정이
+다른 프로세스 때문에 느려져도 결과가 흔들리지 않습니다.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+from benchmarks.bench_translation_throughput import percentile
+from benchmarks.synthetic_pdf import SyntheticPdfSpec, make_synthetic_pdf
+from src.core.use_cases.pdf_parsing_service import PdfParsingService
+
+# 실제로 느렸던 문서 유형을 흉내 낸 측정 대상
+PROFILES: Dict[str, SyntheticPdfSpec] = {
+    # 본문 위주의 논문/보고서
+    "text": SyntheticPdfSpec(pages=30, blocks=25, lines=4, spans=3),
+    # 링크가 빽빽한 색인/참고문헌 페이지
+    "link_dense": SyntheticPdfSpec(pages=10, blocks=60, lines=8, spans=2, links=400),
+    # 작은 이미지가 많은 카탈로그 (같은 이미지가 여러 번 배치됨)
+    "image_dense": SyntheticPdfSpec(pages=10, blocks=10, images=150, image_variants=12),
+    # 모든 요소가 섞인 문서
+    "mixed": SyntheticPdfSpec(pages=20, blocks=30, spans=4, links=80, images=30),
+}
+
+# 장비 속도를 재는 보정 작업에 쓰는 문서. 파서 코드를 거치지 않으므로 파서를
+# 바꿔도 보정 시간은 변하지 않습니다.
+# 한 번에 수십 ms가 걸리도록 넉넉하게 만들어 타이머와 스케줄링 오차를 줄입니다.
+CALIBRATION_SPEC = SyntheticPdfSpec(pages=12, blocks=25, lines=4, spans=3)
+# 보정 시간 한 번을 구할 때 보정 작업을 실행하는 횟수 (중앙값을 씁니다)
+CALIBRATION_PASSES = 3
+
+# 기준 결과와 비교할 항목. 시간 항목은 측정 오차가 크므로 허용 범위를 따로 둡니다.
+# 시간은 보정 시간에 대한 비율(*_ratio)로 비교하여 장비 차이를 상쇄합니다.
+TIME_METRICS = ("page_p50_ratio", "page_p95_ratio", "document_ratio")
+MEMORY_METRICS = ("peak_kib",)
+# 기준 결과 파일에 저장하는 항목 (장비마다 다른 절대 시간은 저장하지 않습니다)
+BASELINE_METRICS = ("pages",) + TIME_METRICS + MEMORY_METRICS
+
+
+def calibration_pass(doc) -> float:
+    """
+    보정 작업을 한 번 실행하고 걸린 시간(초)을 반환합니다. PyMuPDF의 텍스트 추출과
+    순수 파이썬 순회를 섞어 파싱과 비슷한 종류의 일을 하므로, 두 장비의 파싱 시간 비는
+    보정 시간 비와 비슷하게 움직입니다.
+    """
+    started = time.perf_counter()
+    words = 0
+    for page in doc:
+        for block in page.get_text("dict")["blocks"]:
+            for line in block.get("lines", ()):
+                for span in line["spans"]:
+                    words += len(span["text"].split())
+    return time.perf_counter() - started
+
+
+def measure_calibration(doc) -> float:
+    """보정 작업을 CALIBRATION_PASSES번 실행한 시간(초)의 중앙값"""
+    return statistics.median(calibration_pass(doc) for _ in range(CALIBRATION_PASSES))
+
+
+def measure_run(doc, calibration_doc, repeat: int) -> Dict[str, float]:
+    """
+    문서의 모든 페이지를 repeat번 파싱하여 페이지별 최소 시간을 측정합니다.
+    측정 앞뒤로 보정 시간을 재서 그 평균에 대한 비율도 구하므로, 측정 중에 장비 부하가
+    바뀌어도 양쪽이 같이 영향을 받습니다.
+    """
+    calibration = measure_calibration(calibration_doc)
+    page_times: List[float] = [float("inf")] * doc.page_count
+    for _ in range(max(1, repeat)):
+        for page_number in range(doc.page_count):
+            # 페이지 객체를 새로 불러와 PyMuPDF의 페이지 단위 캐시를 피합니다.
+            page = doc.load_page(page_number)
+            started = time.perf_counter()
+            PdfParsingService.parse_page(page, page_number, doc)
+            elapsed = time.perf_counter() - started
+            page_times[page_number] = min(page_times[page_number], elapsed)
+    calibration = (calibration + measure_calibration(calibration_doc)) / 2
+
+    times = {
+        "page_p50": percentile(page_times, 0.50),
+        "page_p95": percentile(page_times, 0.95),
+        "page_max": max(page_times),
+        "document": sum(page_times),
+    }
+    run = {f"{name}_ms": value * 1000 for name, value in times.items()}
+    run["calibration_ms"] = calibration * 1000
+    for name in ("page_p50", "page_p95", "document"):
+        run[f"{name}_ratio"] = times[name] / calibration
+    return run
+
+
+def measure_document(
+    spec: SyntheticPdfSpec, repeat: int, runs: int
+) -> Dict[str, float]:
+    """
+    문서를 runs번 측정(measure_run)하여 항목마다 중앙값을 구한 뒤,
+    tracemalloc을 켜고 한 번 더 파싱하여 페이지 파싱 중 최대 메모리 사용량을 잽니다.
+    (tracemalloc은 파싱을 느리게 하므로 시간 측정과 따로 실행합니다)
+    시간 항목은 ms 값과 함께 보정 시간에 대한 비율도 담습니다.
+    """
+    with (
+        make_synthetic_pdf(spec) as doc,
+        make_synthetic_pdf(CALIBRATION_SPEC) as calibration_doc,
+    ):
+        measured = [
+            measure_run(doc, calibration_doc, repeat) for _ in range(max(1, runs))
+        ]
+
+        peak = 0
+        tracemalloc.start()
+        try:
+            for page_number in range(doc.page_count):
+                page = doc.load_page(page_number)
+                tracemalloc.reset_peak()
+                PdfParsingService.parse_page(page, page_number, doc)
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    result: Dict[str, float] = {"pages": spec.pages}
+    for metric in measured[0]:
+        result[metric] = round(statistics.median(run[metric] for run in measured), 3)
+    result["peak_kib"] = round(peak / 1024, 1)
+    return result
+
+
+def baseline_of(results: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """결과에서 장비에 덜 의존하는 항목만 남겨 기준 결과로 저장할 형태를 만듭니다."""
+    return {
+        name: {metric: result[metric] for metric in BASELINE_METRICS}
+        for name, result in results.items()
+    }
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    time_tolerance: float,
+    memory_tolerance: float,
+) -> List[str]:
+    """기준 결과보다 (1 + 허용 범위)배를 넘는 항목을 설명하는 문장 목록"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metrics, tolerance in (
+            (TIME_METRICS, time_tolerance),
+            (MEMORY_METRICS, memory_tolerance),
+        ):
+            for metric in metrics:
+                if metric not in base or base[metric] <= 0:
+                    continue
+                limit = base[metric] * (1 + tolerance)
+                if result[metric] > limit:
+                    regressions.append(
+                        f"{name}.{metric}: {result[metric]} > {base[metric]} "
+                        f"(+{result[metric] / base[metric] - 1:.0%}, "
+                        f"허용 +{tolerance:.0%})"
+                    )
+    return regressions
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="페이지 파싱 벤치마크")
+    parser.add_argument(
+        "--profile",
+        action="append",
+        choices=sorted(PROFILES),
+        help="측정할 문서 유형 (여러 번 지정 가능, 기본: 전체)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=2,
+        help="한 번의 측정에서 페이지별 최소 시간을 구할 반복 횟수",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=7,
+        help="문서마다 측정할 횟수. 항목마다 중앙값을 씁니다",
+    )
+    custom = parser.add_argument_group(
+        "직접 지정한 문서", "하나라도 지정하면 'custom' 문서 하나만 측정합니다."
+    )
+    for field in SyntheticPdfSpec._fields:
+        custom.add_argument(f"--{field.replace('_', '-')}", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument(
+        "--baseline", help="비교할 기준 결과 JSON. 회귀가 있으면 종료 코드 1"
+    )
+    parser.add_argument("--save-baseline", help="현재 결과를 기준 결과로 저장할 경로")
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.35,
+        help="시간 항목의 허용 증가율 (기본 0.35 = 35%%)",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.10,
+        help="메모리 항목의 허용 증가율 (기본 0.10 = 10%%)",
+    )
+    return parser
+
+
+def selected_specs(args) -> Dict[str, SyntheticPdfSpec]:
+    overrides = {
+        field: getattr(args, field)
+        for field in SyntheticPdfSpec._fields
+        if getattr(args, field) is not None
+    }
+    if overrides:
+        return {"custom": SyntheticPdfSpec(**overrides)}
+    return {name: PROFILES[name] for name in args.profile or PROFILES}
+
+
+def main(argv=None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    results = {
+        name: measure_document(spec, args.repeat, args.runs)
+        for name, spec in selected_specs(args).items()
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, result in results.items():
+            summary = ", ".join(f"{key}={value}" for key, value in result.items())
+            print(f"{name:>12}: {summary}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline_of(results), f, indent=2)
+            f.write("\n")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = find_regressions(
+            results, baseline, args.time_tolerance, args.memory_tolerance
+        )
+        if regressions:
+            print("파싱 성능 저하:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+"""
+번역 파이프라인 처리량 벤치마크.
+로컬 가짜 번역 서버(translation_stub_server)를 띄우고 TranslationService.translate_segments로
+실제와 비슷한 크기의 페이지들을 번역하여 처리량과 페이지 지연 시간을 측정합니다.
+
+    python -m benchmarks.bench_translation_throughput --pages 40 --latency 0.08 \\
+        --error-rate 0.02 --rate-limit 60
+
+--min-rps를 지정하면 초당 요청 수가 그보다 낮을 때 종료 코드 1로 끝나므로
+CI 등에서 처리량 저하를 잡는 데 사용할 수 있습니다.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Dict, List, Sequence
+
+from benchmarks.translation_stub_server import add_server_arguments, server_from_args
+from src.adapters.gateways.google_translation_gateway import GoogleTranslationGateway
+from src.core.use_cases.document_translation_service import TextLine
+from src.core.use_cases.translation_service import TranslationService
+
+_WORDS = (
+    "the of and to in is that for it as with was on be by this are from at or an "
+    "which have not had their were been has more one can all its also than other "
+    "model data system results method analysis performance translation document "
+    "page section figure table value function network process structure layer "
+    "approach measurement evaluation parameter sample experiment distribution"
+).split()
+
+
+def make_pages(
+    page_count: int, blocks_per_page: int, lines_per_block: int, seed: int
+) -> List[List[TextLine]]:
+    """논문 페이지와 비슷하게, 블록마다 여러 줄의 영문 텍스트를 가진 페이지들을 만듭니다."""
+    rng = random.Random(seed)  # nosec B311 - 보안 용도가 아닌 데이터 생성
+    pages = []
+    for page in range(page_count):
+        lines = []
+        for block in range(blocks_per_page):
+            block_id = f"block_{page}_{block}"
+            line_count = rng.randint(1, lines_per_block * 2 - 1)
+            for line in range(line_count):
+                words = rng.choices(_WORDS, k=rng.randint(6, 14))
+                lines.append(
+                    TextLine(
+                        segment_id=f"orig_{page}_{block}_{line}",
+                        block_id=block_id,
+                        line_id=f"line_{page}_{block}_{line}",
+                        text=" ".join(words).capitalize(),
+                    )
+                )
+        pages.append(lines)
+    return pages
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """nearest-rank 방식의 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(fraction * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+async def run_benchmark(args) -> Dict[str, float]:
+    pages = make_pages(args.pages, args.blocks, args.lines, args.seed or 0)
+    server = server_from_args(args)
+    await server.start()
+    gateway = GoogleTranslationGateway(limit_per_host=args.connections, url=server.url)
+    service = TranslationService(gateway)
+    semaphore = asyncio.Semaphore(args.page_concurrency)
+    page_latencies: List[float] = []
+    failed_blocks = 0
+
+    async def translate_page(lines):
+        nonlocal failed_blocks
+        async with semaphore:
+            started = time.perf_counter()
+            translated = await service.translate_segments(
+                lines, args.source, args.target
+            )
+            page_latencies.append(time.perf_counter() - started)
+            failed_blocks += len(service.missing_blocks(lines, translated))
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(translate_page(lines) for lines in pages))
+        elapsed = time.perf_counter() - started
+        limiter_stats = gateway.client.stats()
+    finally:
+        await service.close()
+        await server.stop()
+
+    server_stats = server.stats()
+    return {
+        "pages": len(pages),
+        "blocks": sum(len({line.block_id for line in lines}) for lines in pages),
+        "elapsed_s": round(elapsed, 3),
+        "requests": server_stats["requests"],
+        "requests_per_s": round(server_stats["requests"] / elapsed, 2),
+        "pages_per_s": round(len(pages) / elapsed, 2),
+        "page_p50_s": round(percentile(page_latencies, 0.50), 3),
+        "page_p95_s": round(percentile(page_latencies, 0.95), 3),
+        "page_p99_s": round(percentile(page_latencies, 0.99), 3),
+        "server_errors": server_stats["injected_errors"],
+        "rate_limited": server_stats["rate_limited"],
+        "failed_blocks": failed_blocks,
+        "peak_in_flight": server_stats["peak_in_flight"],
+        "final_limit": limiter_stats["limit"],
+    }
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="번역 파이프라인 처리량 벤치마크")
+    parser.add_argument("--pages", type=int, default=20, help="번역할 페이지 수")
+    parser.add_argument("--blocks", type=int, default=25, help="페이지당 블록 수")
+    parser.add_argument("--lines", type=int, default=3, help="블록당 평균 줄 수")
+    parser.add_argument(
+        "--page-concurrency", type=int, default=4, help="동시에 번역할 페이지 수"
+    )
+    parser.add_argument(
+        "--connections", type=int, default=8, help="호스트당 최대 연결 수"
+    )
+    parser.add_argument("--source", default="en")
+    parser.add_argument("--target", default="ko")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument(
+        "--min-rps",
+        type=float,
+        default=None,
+        help="초당 요청 수가 이 값보다 낮으면 실패(종료 코드 1)로 처리",
+    )
+    add_server_arguments(parser)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    result = asyncio.run(run_benchmark(args))
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for name, value in result.items():
+            print(f"{name:>16}: {value}")
+    if args.min_rps is not None and result["requests_per_s"] < args.min_rps:
+        print(
+            f"처리량 저하: {result['requests_per_s']} req/s < {args.min_rps} req/s",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""
+벤치마크용 합성 PDF 생성기.
+페이지 수, 페이지당 블록/줄/스팬 수, 링크 수, 이미지 수를 지정하여
+파서가 다루기 어려운 문서(링크가 빽빽한 색인 페이지, 이미지가 많은 카탈로그 등)를
+실제 문서 없이 재현합니다. 같은 인자와 seed로는 항상 같은 문서가 만들어집니다.
+
+    python -m benchmarks.synthetic_pdf out.pdf --pages 50 --links 300 --images 40
+"""
+
+import argparse
+import random
+from typing import Dict, Iterable, List, NamedTuple, Sequence, Tuple
+
+import fitz
+
+_WORDS = (
+    "the of and to in is that for it as with was on be by this are from at or an "
+    "which have not had their were been has more one can all its also than other "
+    "model data system results method analysis performance translation document "
+    "page section figure table value function network process structure layer"
+).split()
+# 스팬마다 번갈아 쓰는 내장 글꼴 (일반, 굵게, 기울임, 세리프, 고정폭)
+_FONTS = ("helv", "hebo", "heit", "tiro", "cour")
+_COLORS = ((0, 0, 0), (0.1, 0.2, 0.6), (0.6, 0.1, 0.1), (0.2, 0.4, 0.2))
+
+_MARGIN = 36
+_LINE_HEIGHT = 11
+_FONT_SIZE = 8
+
+
+class SyntheticPdfSpec(NamedTuple):
+    pages: int = 10
+    blocks: int = 20  # 페이지당 텍스트 블록 수
+    lines: int = 4  # 블록당 줄 수
+    spans: int = 3  # 줄당 스팬(글꼴이 다른 조각) 수
+    links: int = 0  # 페이지당 URI 링크 수 (앞쪽 줄부터 차례로 걸림)
+    images: int = 0  # 페이지당 이미지 배치 수
+    # 문서 전체에서 서로 다른 이미지 수 (나머지 배치는 같은 xref를 재사용)
+    image_variants: int = 4
+    seed: int = 0
+
+
+def add_uri_links(doc, page, rects: Iterable[Sequence[float]], url_prefix: str):
+    """
+    (x0, y0, x1, y1) 영역마다 URI 링크를 겁니다. 새 페이지 객체를 반환합니다.
+    insert_link는 호출할 때마다 Annots 배열을 다시 쓰므로, 링크 객체를 직접 만들어
+    한 번에 연결합니다. (PDF 좌표는 아래에서 위로 증가합니다)
+    """
+    page_height = page.rect.height
+    annots = []
+    for i, (x0, y0, x1, y1) in enumerate(rects):
+        xref = doc.get_new_xref()
+        doc.update_object(
+            xref,
+            f"<</Type/Annot/Subtype/Link/Border[0 0 0]"
+            f"/Rect[{x0} {page_height - y1} {x1} {page_height - y0}]"
+            f"/A<</S/URI/URI({url_prefix}{i})>>>>",
+        )
+        annots.append(f"{xref} 0 R")
+    if annots:
+        doc.xref_set_key(page.xref, "Annots", f"[{' '.join(annots)}]")
+    return doc.reload_page(page)
+
+
+def _make_image(rng: random.Random, variant: int) -> fitz.Pixmap:
+    """작은 RGB/회색조/CMYK 이미지를 번갈아 만듭니다."""
+    colorspace = (fitz.csRGB, fitz.csGRAY, fitz.csCMYK)[variant % 3]
+    pixmap = fitz.Pixmap(colorspace, fitz.IRect(0, 0, 32, 24), False)
+    pixmap.clear_with(rng.randrange(40, 220))
+    return pixmap
+
+
+def _place_images(
+    doc,
+    page,
+    placements: List[Tuple[int, Tuple[float, float, float, float]]],
+    image_xrefs: Dict[int, int],
+    rng: random.Random,
+):
+    """
+    (variant, (x0, y0, x1, y1)) 목록대로 이미지를 배치합니다.
+    insert_image는 호출할 때마다 콘텐츠 스트림과 리소스를 다시 쓰므로, variant마다
+    처음 한 번만 insert_image로 넣고 나머지 배치는 그리기 명령을 모아 콘텐츠 스트림
+    하나로 덧붙입니다. 문서에 이미 있는 variant는 같은 xref를 재사용합니다.
+    """
+    placed = set()
+    for variant, rect in placements:
+        if variant in placed:
+            continue
+        placed.add(variant)
+        if variant in image_xrefs:
+            page.insert_image(rect, xref=image_xrefs[variant])
+        else:
+            image_xrefs[variant] = page.insert_image(
+                rect, pixmap=_make_image(rng, variant)
+            )
+    names = {image[0]: image[7] for image in page.get_images(full=True)}
+    page_height = page.rect.height
+    commands = []
+    drawn = set()
+    for variant, (x0, y0, x1, y1) in placements:
+        if variant not in drawn:
+            drawn.add(variant)  # 첫 배치는 insert_image가 이미 그렸습니다.
+            continue
+        commands.append(
+            f"q {x1 - x0} 0 0 {y1 - y0} {x0} {page_height - y1} cm "
+            f"/{names[image_xrefs[variant]]} Do Q"
+        )
+    if commands:
+        xref = doc.get_new_xref()
+        doc.update_object(xref, "<<>>")
+        doc.update_stream(xref, "\n".join(commands).encode())
+        contents = " ".join(f"{content} 0 R" for content in page.get_contents())
+        doc.xref_set_key(page.xref, "Contents", f"[{contents} {xref} 0 R]")
+
+
+def make_synthetic_pdf(spec: SyntheticPdfSpec) -> fitz.Document:
+    """spec에 맞는 메모리 내 PDF 문서를 만듭니다."""
+    rng = random.Random(spec.seed)  # nosec B311 - 보안 용도가 아닌 데이터 생성
+    text_height = spec.blocks * (spec.lines + 1) * _LINE_HEIGHT
+    image_rows = -(-spec.images // 10) if spec.images else 0
+    width = 612
+    height = max(792, 2 * _MARGIN + text_height + image_rows * 30)
+    fonts = [fitz.Font(fontname) for fontname in _FONTS]
+    space_widths = [font.text_length(" ", _FONT_SIZE) for font in fonts]
+    doc = fitz.open()
+    image_xrefs: Dict[int, int] = {}  # 이미 넣은 이미지 variant -> xref
+    for page_number in range(spec.pages):
+        page = doc.new_page(width=width, height=height)
+        # insert_text는 호출할 때마다 콘텐츠 스트림을 다시 쓰므로, 스팬을 색(블록마다
+        # 번갈아 씀)별 TextWriter에 모아 한 번에 씁니다.
+        writers = [fitz.TextWriter(page.rect) for _ in _COLORS]
+        line_rects = []
+        y = _MARGIN + _LINE_HEIGHT
+        for block in range(spec.blocks):
+            writer = writers[block % len(writers)]
+            for line in range(spec.lines):
+                x = _MARGIN
+                for span in range(spec.spans):
+                    text = " ".join(rng.choices(_WORDS, k=rng.randint(2, 5)))
+                    if span == 0 and line == 0:
+                        text = f"{page_number + 1}.{block + 1} {text.capitalize()}"
+                    font_index = (block + span) % len(fonts)
+                    font = fonts[font_index]
+                    _rect, end = writer.append(
+                        (x, y), text, font=font, fontsize=_FONT_SIZE
+                    )
+                    x = end.x + space_widths[font_index]
+                line_rects.append((_MARGIN, y - _FONT_SIZE, x, y + 2))
+                y += _LINE_HEIGHT
+            y += _LINE_HEIGHT  # 블록 사이 간격
+        for writer, color in zip(writers, _COLORS):
+            writer.write_text(page, color=color)
+        if spec.images:
+            placements = []
+            for i in range(spec.images):
+                row, column = divmod(i, 10)
+                x0, y0 = _MARGIN + column * 54, y + row * 30
+                variant = rng.randrange(max(1, spec.image_variants))
+                placements.append((variant, (x0, y0, x0 + 48, y0 + 24)))
+            _place_images(doc, page, placements, image_xrefs, rng)
+        if spec.links and line_rects:
+            rects = (line_rects[i % len(line_rects)] for i in range(spec.links))
+            add_uri_links(doc, page, rects, f"https://example.com/{page_number}/")
+    return doc
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 PDF 생성")
+    parser.add_argument("output", help="저장할 PDF 경로")
+    for field, default in SyntheticPdfSpec._field_defaults.items():
+        parser.add_argument(f"--{field.replace('_', '-')}", type=int, default=default)
+    args = parser.parse_args(argv)
+    spec = SyntheticPdfSpec(
+        **{field: getattr(args, field) for field in SyntheticPdfSpec._fields}
+    )
+    with make_synthetic_pdf(spec) as doc:
+        doc.save(args.output, garbage=1, deflate=True)
+    print(f"{args.output}: {spec}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,220 @@
+"""
+Google `translate_a/single` 엔드포인트를 흉내 내는 로컬 HTTP 서버.
+실제 번역 서버 없이 번역 파이프라인의 처리량과 장애 대응을 측정하기 위해 사용합니다.
+
+    python -m benchmarks.translation_stub_server --port 8765 --latency 0.08 --error-rate 0.02
+
+번역 결과는 각 줄 앞에 "<대상 언어>"를 붙인 텍스트이며, 묶음 요청의 "[[n]]" 표지 줄은
+그대로 돌려주므로 클라이언트의 묶음 분리 로직도 그대로 동작합니다.
+"""
+
+import argparse
+import asyncio
+import random
+import re
+import time
+from typing import Dict, Optional
+
+from aiohttp import web
+
+TRANSLATE_PATH = "/translate_a/single"
+_MARKER_LINE = re.compile(r"^\s*\[\[\s*\d+\s*\]\]\s*$")
+
+
+def fake_translate(text: str, target: str) -> str:
+    """표지 줄은 그대로 두고 나머지 줄 앞에 대상 언어를 붙입니다."""
+    return "\n".join(
+        line if _MARKER_LINE.match(line) or not line.strip() else f"<{target}> {line}"
+        for line in text.split("\n")
+    )
+
+
+def build_response(text: str, source: str, target: str) -> list:
+    """
+    translate_a/single(dt=t)와 같은 형태의 응답을 만듭니다.
+    실제 서버처럼 결과를 줄 단위 조각으로 나누어 data[0]에 담습니다.
+    """
+    translated_lines = fake_translate(text, target).split("\n")
+    original_lines = text.split("\n")
+    chunks = []
+    for index, (translated, original) in enumerate(
+        zip(translated_lines, original_lines)
+    ):
+        newline = "\n" if index + 1 < len(translated_lines) else ""
+        chunks.append([translated + newline, original + newline, None, None, 10])
+    detected = source if source != "auto" else "en"
+    return [chunks, None, detected, None, None, None, 1.0, [], [[detected], None]]
+
+
+class TokenBucket:
+    """초당 rate개의 요청을 허용하고, 최대 burst개까지 몰아서 허용하는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def try_take(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+class StubTranslationServer:
+    """
+    지연 시간, 오류율, 초당 요청 한도를 설정할 수 있는 가짜 번역 서버.
+    ``async with StubTranslationServer(...) as server:`` 로 띄우고 server.url로 요청합니다.
+    - latency/latency_jitter: 응답 지연(초). latency ± latency_jitter 사이에서 고릅니다.
+    - error_rate: 503을 돌려줄 확률
+    - rate_limit/burst: 초당 요청 한도. 넘으면 429를 돌려줍니다. (None이면 제한 없음)
+    - forced_status/forced_text: forced_status를 지정하면 모든 요청에 이 상태 코드와
+      본문으로 응답합니다. (400 응답, JSON이 아닌 200 응답 등을 시험할 때)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.05,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+        burst: Optional[int] = None,
+        seed: Optional[int] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.bucket = TokenBucket(rate_limit, burst) if rate_limit else None
+        self._random = random.Random(seed)  # nosec B311 - 보안 용도가 아닌 시뮬레이션
+        self._runner: Optional[web.AppRunner] = None
+        self.forced_status: Optional[int] = None
+        self.forced_text = ""
+        self.requests = 0
+        self.injected_errors = 0
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}{TRANSLATE_PATH}"
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "injected_errors": self.injected_errors,
+            "rate_limited": self.rate_limited,
+            "peak_in_flight": self.peak_in_flight,
+        }
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.bucket is not None and not self.bucket.try_take():
+            self.rate_limited += 1
+            return web.Response(status=429, text="Too Many Requests")
+        if self.forced_status is not None:
+            return web.Response(status=self.forced_status, text=self.forced_text)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            delay = self.latency + self._random.uniform(
+                -self.latency_jitter, self.latency_jitter
+            )
+            await asyncio.sleep(max(0.0, delay))
+            if self._random.random() < self.error_rate:
+                self.injected_errors += 1
+                return web.Response(status=503, text="Service Unavailable")
+            query = request.query
+            return web.json_response(
+                build_response(
+                    query.get("q", ""), query.get("sl", "auto"), query.get("tl", "en")
+                )
+            )
+        finally:
+            self.in_flight -= 1
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get(TRANSLATE_PATH, self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            # 포트 0으로 띄웠다면 운영체제가 고른 실제 포트를 기록합니다.
+            self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "StubTranslationServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+        return False
+
+
+def add_server_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency", type=float, default=0.05, help="응답 지연(초)")
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="응답 지연의 ± 변동폭(초)"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="503 응답 확률 (0~1)"
+    )
+    parser.add_argument(
+        "--rate-limit", type=float, default=None, help="초당 요청 한도 (넘으면 429)"
+    )
+    parser.add_argument("--burst", type=int, default=None, help="순간 허용 요청 수")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+
+
+def server_from_args(args, host="127.0.0.1", port=0) -> StubTranslationServer:
+    return StubTranslationServer(
+        host=host,
+        port=port,
+        latency=args.latency,
+        latency_jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        burst=args.burst,
+        seed=args.seed,
+    )
+
+
+async def _serve_forever(args):
+    async with server_from_args(args, args.host, args.port) as server:
+        print(f"Stub translation server listening on {server.url}")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            print(server.stats())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 가짜 번역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_server_arguments(parser)
+    try:
+        asyncio.run(_serve_forever(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
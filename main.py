@@ -1,10 +1,24 @@
 import sys
 import asyncio
-import qasync
-from src.ui.view.main_window_view import MainWindow
-from PySide6.QtWidgets import QApplication
+import logging
+
 
 def main():
+    # 백그라운드 작업(번역, 파싱, 렌더링)의 실패는 모듈별 logger로 stderr에 남깁니다.
+    logging.basicConfig(
+        level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    # `translate` 명령은 GUI 없이 문서 전체를 번역합니다. (디스플레이가 없는 서버용)
+    if len(sys.argv) > 1 and sys.argv[1] == "translate":
+        from src.ui.cli import main as cli_main
+
+        sys.exit(cli_main(sys.argv[2:]))
+
+    import qasync
+    from PySide6.QtWidgets import QApplication
+
+    from src.ui.view.main_window_view import MainWindow
+
     print("Hello from pdf-trans!")
     app = QApplication(sys.argv)
 
@@ -17,7 +31,10 @@ def main():
 
     # 통합된 asyncio 이벤트 루프를 실행합니다.
     with loop:
-        sys.exit(loop.run_forever())
+        exit_code = loop.run_forever()
+        # 루프가 닫히기 전에 번역 세션(커넥션 풀) 등 비동기 자원을 정리합니다.
+        loop.run_until_complete(window.controller.aclose())
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
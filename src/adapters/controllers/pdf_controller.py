@@ -1,21 +1,54 @@
+import asyncio
+import os
+import weakref
+from collections import deque
+
+from src.common.translation_priority import PRIORITY_VISIBLE, priority_for_distance
+from src.common.utils import LruCache
+from src.core.use_cases.document_search_index import (
+    KIND_TRANSLATED,
+    DocumentSearchIndex,
+)
+from src.core.use_cases.document_translation_service import TextLine
+from src.core.use_cases.page_translation_jobs import PageTranslationJobs
 from src.core.use_cases.pdf_page_service import PdfPageService
+from src.core.use_cases.repeated_block_analyzer import RepeatedBlockAnalyzer
 from src.core.use_cases.translation_service import TranslationService
 
+# 파싱된 페이지 뷰모델을 보관할 최대 페이지 수
+DEFAULT_VIEW_MODEL_CACHE_SIZE = 16
+
 
 class PdfController:
-    def __init__(self, pdf_doc=None, translation_service=None, pdf_parser=None):
+    def __init__(
+        self,
+        pdf_doc=None,
+        translation_service=None,
+        pdf_parser=None,
+        view_model_cache_size=DEFAULT_VIEW_MODEL_CACHE_SIZE,
+    ):
         self.pdf_doc = pdf_doc
+        self.document_key = None  # 열린 문서를 식별하는 키 (번역 작업/캐시 키에 사용)
         self.current_page = 0
         self.view_model = None
-        # TranslationService 인스턴스 주입(없으면 기본 GoogleTranslationGateway 사용)
+        # (문서 키, 페이지 번호) -> 파싱된 PageDisplayViewModel
+        # 페이지 이동, 프리페치, 번역이 함께 사용하여 같은 페이지를 다시 파싱하지 않습니다.
+        self.view_model_cache = LruCache(view_model_cache_size)
+        # TranslationService 인스턴스 주입
+        # (없으면 기본 GoogleTranslationGateway + 디스크 번역 메모리 사용)
         if translation_service is not None:
             self.translation_service = translation_service
         else:
             from src.adapters.gateways.google_translation_gateway import (
                 GoogleTranslationGateway,
             )
+            from src.infrastructure.persistence.translation_memory import (
+                SqliteTranslationMemory,
+            )
 
-            self.translation_service = TranslationService(GoogleTranslationGateway())
+            self.translation_service = TranslationService(
+                GoogleTranslationGateway(), memory=SqliteTranslationMemory()
+            )
         # PDF 파서 주입(없으면 기본 FitzPdfParserGateway 사용)
         if pdf_parser is not None:
             self.pdf_parser = pdf_parser
@@ -25,21 +58,194 @@ class PdfController:
             )
 
             self.pdf_parser = FitzPdfParserGateway()
+        # 같은 페이지의 번역 요청이 겹치지 않도록 하는 single-flight 번역 작업 관리자
+        self.translation_jobs = PageTranslationJobs(self.translation_service)
+        # 문서 전체 검색 색인 (start_document_analysis로 백그라운드에서 만듭니다)
+        self.search_index = DocumentSearchIndex()
+        self._analysis_task = None
+        self._search_indexed_jobs = weakref.WeakSet()
 
     def open_pdf(self, file_path):
         import fitz
 
         self.pdf_doc = fitz.open(file_path)
+        stat = os.stat(file_path)
+        self.document_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime)
         self.current_page = 0
+        self._cancel_document_analysis()
+        self.search_index.clear()
+        # 반복 블록 분석은 문서마다 새로 합니다. (start_document_analysis 참고)
+        self.translation_service.repeated_blocks = RepeatedBlockAnalyzer()
+        # 파서가 백그라운드 파싱을 지원하면 워커 프로세스가 새 문서를 열도록 합니다.
+        open_document = getattr(self.pdf_parser, "open_document", None)
+        if open_document is not None:
+            open_document(file_path, page_count=self.pdf_doc.page_count)
         return self.pdf_doc
 
+    def get_page_sizes(self):
+        """열린 문서의 페이지별 (너비, 높이). 회전이 반영된 크기입니다."""
+        if not self.pdf_doc:
+            return []
+        sizes = []
+        for page in self.pdf_doc:
+            rect = page.rect
+            sizes.append((rect.width, rect.height))
+        return sizes
+
     def get_page_view_model(self, page_number):
+        view_model = self.load_page_view_model(page_number)
+        if view_model is not None:
+            self.set_current_view_model(view_model)
+        return view_model
+
+    def set_current_view_model(self, view_model):
+        """화면에 표시할 페이지의 뷰모델을 현재 페이지로 지정합니다."""
+        self.current_page = view_model.page_number - 1
+        self.view_model = view_model
+
+    def load_page_view_model(self, page_number):
+        """
+        현재 페이지 상태를 바꾸지 않고 페이지의 뷰모델만 만듭니다. (프리페치 등)
+        최근에 파싱한 페이지는 캐시에서 꺼내므로 다시 파싱하지 않습니다.
+        """
+        if not self.pdf_doc:
+            return None
+        cached = self.view_model_cache.get((self.document_key, page_number))
+        if cached is None:
+            cached = self._parse_and_cache(page_number)
+        return self._fresh_view_model(cached) if cached is not None else None
+
+    async def load_page_view_model_async(self, page_number):
+        """
+        load_page_view_model의 비동기 버전.
+        파서가 parse_layout_async를 지원하면 페이지 파싱은 워커 프로세스에서 하고,
+        이 스레드에서는 파싱 결과로 뷰모델을 만드는 일만 합니다.
+        워커를 쓸 수 없으면 load_page_view_model과 같이 바로 파싱합니다.
+        """
         if not self.pdf_doc:
             return None
+        key = (self.document_key, page_number)
+        cached = self.view_model_cache.get(key)
+        parse_layout_async = getattr(self.pdf_parser, "parse_layout_async", None)
+        if cached is None and parse_layout_async is not None:
+            layout = await parse_layout_async(page_number)
+            if key[0] != self.document_key:
+                return None  # 기다리는 동안 다른 문서가 열렸습니다.
+            # 기다리는 동안 다른 호출이 같은 페이지를 캐시에 넣었을 수 있습니다.
+            cached = self.view_model_cache.pop(key)
+            if cached is None and layout is not None:
+                cached = self.pdf_parser.build_view_model(layout)
+            if cached is not None:
+                self.view_model_cache.put(key, cached)
+        if cached is None:
+            cached = self._parse_and_cache(page_number)
+        return self._fresh_view_model(cached) if cached is not None else None
+
+    def _parse_and_cache(self, page_number):
         page = self.pdf_doc[page_number]
-        self.current_page = page_number
-        self.view_model = self.pdf_parser.parse_page(page, page_number, self.pdf_doc)
-        return self.view_model
+        view_model = self.pdf_parser.parse_page(page, page_number, self.pdf_doc)
+        if view_model is not None:
+            self.view_model_cache.put((self.document_key, page_number), view_model)
+        return view_model
+
+    def prefetch_pages(self, page_numbers):
+        """아직 파싱하지 않은 페이지들을 백그라운드에서 미리 파싱합니다."""
+        prefetch = getattr(self.pdf_parser, "prefetch", None)
+        if prefetch is None or not self.pdf_doc:
+            return
+        prefetch(
+            page
+            for page in page_numbers
+            if 0 <= page < self.pdf_doc.page_count
+            and (self.document_key, page) not in self.view_model_cache
+        )
+
+    @staticmethod
+    def _fresh_view_model(cached):
+        """
+        캐시된 뷰모델을 화면에 쓸 수 있도록 세그먼트까지 복사해 돌려줍니다.
+        캐시 항목은 바꾸지 않으므로, 같은 페이지를 다시 꺼내도 이미 화면에 있는
+        세그먼트의 상태(하이라이트 등)가 바뀌지 않고, 화면에서 바꾼 상태도 캐시에
+        남지 않습니다.
+        """
+        return cached.copy()
+
+    def get_view_model_cache_stats(self) -> dict:
+        """뷰모델 캐시의 항목 수와 적중/실패 횟수를 반환합니다."""
+        return self.view_model_cache.stats()
+
+    def start_page_translation(
+        self,
+        page_number,
+        source_lang,
+        target_lang,
+        view_model=None,
+        priority=PRIORITY_VISIBLE,
+    ):
+        """
+        페이지 번역 작업을 시작하거나, 같은 페이지/언어의 작업이 이미 진행 중이면 그 작업을
+        반환합니다. 반환된 작업은 stream()으로 블록별 결과를, wait()로 전체 결과를 받습니다.
+        :param priority: 번역 요청의 우선순위 (translation_priority 참고)
+        """
+        if view_model is None:
+            view_model = self.load_page_view_model(page_number)
+        if view_model is None:
+            return None
+        key = PageTranslationJobs.make_key(
+            self.document_key, page_number, source_lang, target_lang
+        )
+        job = self.translation_jobs.start(
+            key, view_model.original_segments_view, source_lang, target_lang, priority
+        )
+        self._index_translations_when_done(page_number, job)
+        return job
+
+    def _index_translations_when_done(self, page_number, job):
+        """번역 작업이 끝나면 그 페이지의 번역문을 검색 색인에 넣습니다."""
+        if job in self._search_indexed_jobs:
+            return
+        self._search_indexed_jobs.add(job)
+        document_key = self.document_key
+
+        def index_translations(_task):
+            if self.document_key != document_key or not job.results:
+                return
+            self.search_index.add_page(
+                page_number,
+                [
+                    (f"trans_{block_id}", text)
+                    for block_id, text in job.results.items()
+                    if text
+                ],
+                KIND_TRANSLATED,
+            )
+
+        job.task.add_done_callback(index_translations)
+
+    def update_translation_window(
+        self, current_page, prefetch_count, source_lang, target_lang, visible_pages=()
+    ):
+        """
+        현재 페이지부터 prefetch_count 페이지 뒤까지를 번역 대상 범위로 보고,
+        범위 안의 진행 중인 작업은 현재 페이지와의 거리에 따라 우선순위를 다시 매기며
+        범위 밖(이전 페이지, 먼 페이지, 다른 언어, 다른 문서)의 작업은 취소합니다.
+        :param visible_pages: 현재 페이지와 함께 화면에 보이는 페이지 (연속 스크롤).
+            현재 페이지와 같은 우선순위를 주고, 프리페치 범위는 마지막 페이지 뒤부터 셉니다.
+        """
+        visible = set(visible_pages) | {current_page}
+        priorities = {}
+        for page_number in visible:
+            key = PageTranslationJobs.make_key(
+                self.document_key, page_number, source_lang, target_lang
+            )
+            priorities[key] = priority_for_distance(0)
+        last_page = max(visible)
+        for distance in range(1, prefetch_count + 1):
+            key = PageTranslationJobs.make_key(
+                self.document_key, last_page + distance, source_lang, target_lang
+            )
+            priorities.setdefault(key, priority_for_distance(distance))
+        self.translation_jobs.retain(priorities)
 
     async def translate_current_page(self, source_lang, target_lang):
         if not self.view_model:
@@ -51,6 +257,148 @@ class PdfController:
         )
         return translated_blocks
 
+    def start_document_analysis(self, on_progress=None):
+        """
+        열린 문서 전체를 백그라운드에서 한 번 훑어 검색 색인과 반복 블록 분석을 만듭니다.
+        페이지 파싱은 파서의 워커 프로세스(또는 디스크 캐시)에서 하고 이벤트 루프에서는
+        결과를 색인/분석에 넣는 일만 하므로, 끝나기 전에도 처리된 페이지부터 검색되고
+        반복 블록(머리말/꼬리말)은 문서에서 한 번만 번역됩니다.
+        :param on_progress: 페이지가 처리될 때마다 (처리된 페이지 수, 전체 페이지 수)로 호출
+        """
+        self._cancel_document_analysis()
+        if not self.pdf_doc:
+            return None
+        self._analysis_task = asyncio.ensure_future(
+            self._analyze_document(self.document_key, on_progress)
+        )
+        return self._analysis_task
+
+    def _cancel_document_analysis(self):
+        if self._analysis_task is not None:
+            self._analysis_task.cancel()
+            self._analysis_task = None
+
+    async def _analyze_document(self, document_key, on_progress):
+        page_count = self.pdf_doc.page_count
+        repeated_blocks = self.translation_service.repeated_blocks
+        pages = (
+            page
+            for page in range(page_count)
+            if page not in self.search_index.indexed_pages
+        )
+        # 워커 수만큼 페이지를 동시에 맡겨 두되, 그 이상은 쌓지 않아
+        # 화면에 표시할 페이지의 파싱이 분석 작업 뒤에서 오래 기다리지 않도록 합니다.
+        window = max(1, getattr(self.pdf_parser, "workers", 1))
+        pending = deque()
+        try:
+            while True:
+                while len(pending) < window:
+                    page = next(pages, None)
+                    if page is None:
+                        break
+                    pending.append(
+                        (
+                            page,
+                            asyncio.ensure_future(self._page_lines_for_analysis(page)),
+                        )
+                    )
+                if not pending:
+                    return
+                page, task = pending.popleft()
+                lines = await task
+                if self.document_key != document_key:
+                    return
+                self.search_index.add_page(
+                    page, [(line.segment_id, line.text) for line in lines]
+                )
+                if repeated_blocks is not None:
+                    repeated_blocks.add_page_segments(page, lines)
+                if on_progress is not None:
+                    on_progress(len(self.search_index.indexed_pages), page_count)
+        finally:
+            for _page, task in pending:
+                task.cancel()
+
+    async def _page_lines_for_analysis(self, page_number):
+        """분석할 페이지의 줄 목록 (segment_id, block_id, text, bounds를 가진 객체)"""
+        parse_layout_async = getattr(self.pdf_parser, "parse_layout_async", None)
+        if parse_layout_async is not None:
+            layout = await parse_layout_async(page_number, remember=False)
+            # 워커가 아직 준비 중이면 준비될 때까지 기다립니다.
+            while (
+                layout is None and getattr(self.pdf_parser, "is_ready", True) is False
+            ):
+                await asyncio.sleep(0.1)
+                layout = await parse_layout_async(page_number, remember=False)
+            if layout is not None:
+                return [
+                    TextLine(
+                        f"orig_{line.line_id}",
+                        line.block_id,
+                        line.line_id,
+                        line.text,
+                        (
+                            line.bbox[0],
+                            line.bbox[1],
+                            line.bbox[2] - line.bbox[0],
+                            line.bbox[3] - line.bbox[1],
+                        ),
+                    )
+                    for line in layout.lines
+                ]
+        # 백그라운드 파싱을 지원하지 않는 파서는 이 스레드에서 한 페이지씩 파싱합니다.
+        await asyncio.sleep(0)
+        view_model = self.pdf_parser.parse_page(
+            self.pdf_doc[page_number], page_number, self.pdf_doc
+        )
+        return view_model.original_segments_view
+
+    def search(self, query: str, limit: int = 500):
+        """색인된 페이지에서 검색어를 포함하는 세그먼트(SearchHit) 목록을 반환합니다."""
+        return self.search_index.search(query, limit)
+
+    def set_translation_connection_limit(self, limit_per_host: int):
+        """번역 게이트웨이의 호스트당 최대 연결 수를 설정합니다."""
+        client = getattr(self.translation_service.gateway, "client", None)
+        if client is not None:
+            client.set_limit_per_host(limit_per_host)
+
+    def set_layout_cache_enabled(self, enabled: bool):
+        """파서의 페이지 구조 디스크 캐시 사용 여부를 설정합니다."""
+        set_enabled = getattr(self.pdf_parser, "set_layout_cache_enabled", None)
+        if set_enabled is not None:
+            set_enabled(enabled)
+
+    def get_tile_renderer(self):
+        """
+        페이지 타일을 UI 스레드 밖에서 렌더링하는 코루틴 함수
+        (page_number, zoom, clip) -> RenderedTile. 파서가 지원하지 않으면 None.
+        """
+        return getattr(self.pdf_parser, "render_tile_async", None)
+
+    def get_image_decoder(self):
+        """
+        이미지를 UI 스레드 밖에서 디코딩하는 코루틴 함수
+        xref -> DecodedImage. 파서가 지원하지 않으면 None.
+        """
+        return getattr(self.pdf_parser, "decode_image_async", None)
+
+    def get_translation_stats(self) -> dict:
+        """번역 게이트웨이의 현재 동시 요청 한도, 진행 중/대기 중 요청 수를 반환합니다."""
+        client = getattr(self.translation_service.gateway, "client", None)
+        if client is None:
+            return {}
+        return client.stats()
+
+    async def aclose(self):
+        """애플리케이션 종료 시 번역 세션 등 비동기 자원을 정리합니다."""
+        self.translation_jobs.cancel_all()
+        self._cancel_document_analysis()
+        await self.translation_service.close()
+        close_parser = getattr(self.pdf_parser, "close", None)
+        if close_parser is not None:
+            close_parser()
+
     def get_highlight_update(self, all_segment_ids, hovered_segment_id, view_context):
         segments_to_update = PdfPageService.update_highlights(
             all_segment_ids, hovered_segment_id
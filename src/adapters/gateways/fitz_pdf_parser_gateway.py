@@ -1,8 +1,337 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import fitz
+
+from src.common.utils import LruCache
+from src.core.entities.page_layout import PageLayout
 from src.core.use_cases.pdf_parsing_service import PdfParsingService
+from src.infrastructure.pdf_parsing.image_decoder import (
+    DecodedImage,
+    decode_image_in_worker,
+)
+from src.infrastructure.pdf_parsing.layout_extractor import (
+    extract_page_layout_in_worker,
+    init_parse_worker,
+)
+from src.infrastructure.pdf_parsing.page_renderer import (
+    RenderedTile,
+    render_page_tile_in_worker,
+)
+from src.infrastructure.persistence.layout_cache import (
+    DEFAULT_LAYOUT_CACHE_DIR,
+    LayoutCache,
+    prune_layout_cache,
+)
 
 from .pdf_parser_gateway import PdfParserGateway
 
+logger = logging.getLogger(__name__)
+
+# 미리 파싱해 둔 페이지 데이터를 보관할 최대 페이지 수
+DEFAULT_LAYOUT_CACHE_SIZE = 32
+# 타일 렌더링/이미지 디코딩 워커 하나당 동시에 맡기는 작업 수.
+# 나머지는 이벤트 루프에서 기다리므로 취소되면 워커에 전달되지 않습니다.
+RENDER_JOBS_PER_WORKER = 2
+
+
+def _close_opened_cache(future: Future):
+    """더 이상 쓰지 않는 문서의 캐시가 뒤늦게 열렸으면 닫습니다."""
+    if not future.cancelled() and future.result() is not None:
+        future.result().close()
+
 
 class FitzPdfParserGateway(PdfParserGateway):
+    """
+    PyMuPDF 기반 페이지 파서.
+    parse_page는 호출한 스레드에서 바로 파싱하고, open_document로 문서 경로를 알려 주면
+    parse_layout_async/prefetch가 워커 프로세스 풀에서 페이지를 파싱합니다.
+    각 워커는 문서를 직접 열어 두고 페이지 번호만 받아 Qt 객체가 없는 PageLayout을
+    돌려주므로, UI 스레드는 build_view_model로 화면 데이터를 만드는 일만 합니다.
+    render_tile_async와 decode_image_async는 파싱과 따로 둔 렌더링 워커 풀에서 페이지
+    일부를 렌더링하거나 이미지를 디코딩하므로, 타일이 많이 쌓여도 페이지 파싱이 그 뒤에서
+    기다리지 않습니다. 렌더링 워커에 동시에 맡기는 작업 수도 제한합니다.
+    layout_cache_dir를 지정하면 파싱 결과를 문서별 디스크 캐시(LayoutCache)에도 저장해,
+    같은 문서를 다시 열었을 때 이미 파싱한 페이지는 파싱 없이 바로 읽어 옵니다.
+    처음 보는 문서의 캐시는 내용 해시를 계산해야 하므로 별도 스레드에서 열고,
+    열리기 전까지는 캐시 없이 파싱합니다. 캐시 디렉터리가 너무 커지지 않도록 문서를 열
+    때마다 같은 스레드에서 오래 쓰지 않은 캐시를 정리합니다.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        layout_cache_size: int = DEFAULT_LAYOUT_CACHE_SIZE,
+        layout_cache_dir: Optional[str] = DEFAULT_LAYOUT_CACHE_DIR,
+        render_workers: int = 1,
+    ):
+        self.workers = workers or max(1, min(2, (os.cpu_count() or 2) - 1))
+        self.render_workers = render_workers
+        self._pdf_path: Optional[str] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # 타일 렌더링/이미지 디코딩 전용 풀 (처음 요청할 때 띄웁니다)
+        self._render_pool: Optional[ProcessPoolExecutor] = None
+        self._render_slots: Optional[asyncio.Semaphore] = None
+        self._warmup: Optional[Future] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._layouts: LruCache[PageLayout] = LruCache(layout_cache_size)
+        self.layout_cache_dir = layout_cache_dir
+        self._disk_cache: Optional[LayoutCache] = None
+        # 백그라운드 스레드에서 여는 중인 디스크 캐시
+        self._disk_cache_future: Optional[Future] = None
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        # 캐시가 열리기 전에 파싱한 페이지 (열리면 저장합니다)
+        self._unsaved_layouts: List[PageLayout] = []
+
+    def set_layout_cache_enabled(self, enabled: bool):
+        """디스크 캐시 사용 여부를 바꿉니다. 다음에 여는 문서부터 적용됩니다."""
+        if not enabled:
+            self.layout_cache_dir = None
+        elif self.layout_cache_dir is None:
+            self.layout_cache_dir = DEFAULT_LAYOUT_CACHE_DIR
+
     def parse_page(self, page, page_number, pdf_doc):
-        return PdfParsingService.parse_page(page, page_number, pdf_doc)
+        layout = self._cached_layout(page_number)
+        if layout is None:
+            layout = PdfParsingService.extract_layout(page, page_number)
+            self._store_layout(layout)
+        return PdfParsingService.build_view_model(layout)
+
+    def build_view_model(self, layout: PageLayout):
+        return PdfParsingService.build_view_model(layout)
+
+    def open_document(self, pdf_path: str, page_count: Optional[int] = None):
+        """
+        백그라운드 파싱에 사용할 문서를 지정하고 워커 프로세스를 미리 띄웁니다.
+        이전 문서의 워커와 파싱 결과는 정리합니다.
+        :param page_count: 호출 측이 이미 연 문서의 페이지 수. 없으면 캐시를 여는
+            스레드에서 문서를 열어 셉니다.
+        """
+        self.close()
+        self._pdf_path = pdf_path
+        self._start_disk_cache(pdf_path, page_count)
+        # Qt 이벤트 루프가 도는 프로세스를 fork하지 않도록 spawn으로 워커를 만듭니다.
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_parse_worker,
+            initargs=(pdf_path,),
+        )
+        # 워커가 준비되기 전(모듈 임포트, 문서 열기)에는 호출 측이 직접 파싱합니다.
+        self._warmup = self._pool.submit(os.getpid)
+        self._render_slots = asyncio.Semaphore(
+            self.render_workers * RENDER_JOBS_PER_WORKER
+        )
+
+    def _start_disk_cache(self, pdf_path: str, page_count: Optional[int]):
+        if self.layout_cache_dir is None:
+            return
+        if page_count is not None:
+            # 전에 열었던 파일이면 해시 계산 없이 바로 찾습니다.
+            try:
+                self._disk_cache = LayoutCache.find_for_document(
+                    pdf_path, page_count, self.layout_cache_dir
+                )
+            except OSError as e:
+                logger.warning("레이아웃 캐시를 열 수 없습니다: %s", e)
+                return
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="layout-cache"
+            )
+        if self._disk_cache is not None:
+            self._io_pool.submit(
+                self._prune_disk_caches,
+                self.layout_cache_dir,
+                self._disk_cache.path,
+            )
+            return
+        self._disk_cache_future = self._io_pool.submit(
+            self._open_disk_cache, pdf_path, page_count, self.layout_cache_dir
+        )
+
+    @staticmethod
+    def _open_disk_cache(
+        pdf_path: str, page_count: Optional[int], cache_dir: str
+    ) -> Optional[LayoutCache]:
+        try:
+            if page_count is None:
+                with fitz.open(pdf_path) as doc:
+                    page_count = doc.page_count
+            cache = LayoutCache.for_document(pdf_path, page_count, cache_dir)
+        except (OSError, RuntimeError, ValueError) as e:
+            # 캐시는 보조 수단이므로 열 수 없으면 캐시 없이 계속합니다.
+            logger.warning("레이아웃 캐시를 열 수 없습니다: %s", e)
+            return None
+        FitzPdfParserGateway._prune_disk_caches(cache_dir, cache.path)
+        return cache
+
+    @staticmethod
+    def _prune_disk_caches(cache_dir: str, keep_path: str):
+        try:
+            prune_layout_cache(cache_dir, keep=(keep_path,))
+        except OSError as e:
+            logger.warning("레이아웃 캐시 정리 실패: %s", e)
+
+    def _current_disk_cache(self) -> Optional[LayoutCache]:
+        """디스크 캐시. 백그라운드에서 여는 중이면 None"""
+        future = self._disk_cache_future
+        if future is not None and future.done():
+            self._disk_cache_future = None
+            if not future.cancelled():
+                self._disk_cache = future.result()
+            unsaved, self._unsaved_layouts = self._unsaved_layouts, []
+            for layout in unsaved:
+                self._store_layout(layout, remember=False)
+        return self._disk_cache
+
+    def _cached_layout(
+        self, page_number: int, remember: bool = True
+    ) -> Optional[PageLayout]:
+        """메모리 캐시, 디스크 캐시 순으로 이미 파싱한 페이지를 찾습니다."""
+        layout = self._layouts.get(page_number)
+        disk_cache = self._current_disk_cache()
+        if layout is None and disk_cache is not None:
+            layout = disk_cache.get(page_number)
+            if layout is not None and remember:
+                self._layouts.put(page_number, layout)
+        return layout
+
+    def _store_layout(self, layout: PageLayout, remember: bool = True):
+        if remember:
+            self._layouts.put(layout.page_number, layout)
+        if self._disk_cache_future is not None and not self._disk_cache_future.done():
+            self._unsaved_layouts.append(layout)
+        elif self._current_disk_cache() is not None:
+            try:
+                self._disk_cache.put(layout)
+            except OSError as e:
+                logger.warning("레이아웃 캐시 저장 실패, 캐시를 끕니다: %s", e)
+                self._disk_cache.close()
+                self._disk_cache = None
+
+    @property
+    def is_ready(self) -> bool:
+        """워커 프로세스가 떠서 바로 파싱을 맡길 수 있는지 여부"""
+        return self._warmup is not None and self._warmup.done()
+
+    def _submit(self, page_number: int, remember: bool = True) -> asyncio.Future:
+        future = self._pending.get(page_number)
+        if future is None:
+            # 완료 콜백이 이벤트 루프 스레드에서 실행되도록 asyncio Future로 감쌉니다.
+            future = asyncio.wrap_future(
+                self._pool.submit(extract_page_layout_in_worker, page_number)
+            )
+            self._pending[page_number] = future
+            future.add_done_callback(
+                lambda done, page_number=page_number: self._on_parsed(
+                    page_number, done, remember
+                )
+            )
+        return future
+
+    def _on_parsed(self, page_number: int, future: asyncio.Future, remember: bool):
+        if self._pending.get(page_number) is future:
+            del self._pending[page_number]
+        if not future.cancelled() and future.exception() is None:
+            self._store_layout(future.result(), remember)
+
+    async def parse_layout_async(
+        self, page_number: int, remember: bool = True
+    ) -> Optional[PageLayout]:
+        """
+        워커 프로세스에서 페이지를 파싱합니다. 미리 파싱된 페이지는 바로 반환합니다.
+        디스크 캐시에 있는 페이지는 워커가 준비되기 전에도 바로 반환합니다.
+        워커를 사용할 수 없으면(문서 미지정, 준비 중) None을 반환하므로
+        호출 측은 parse_page로 직접 파싱해야 합니다.
+        :param remember: False이면 결과를 메모리 캐시에 남기지 않습니다.
+            (검색 색인처럼 문서 전체를 훑을 때 화면 근처 페이지가 밀려나지 않도록)
+        """
+        layout = self._cached_layout(page_number, remember)
+        if layout is not None:
+            return layout
+        if self._pool is None:
+            return None
+        future = self._pending.get(page_number)
+        if future is None:
+            if not self.is_ready:
+                return None
+            future = self._submit(page_number, remember)
+        return await asyncio.shield(future)
+
+    async def render_tile_async(
+        self, page_number: int, zoom: float, clip: Sequence[float]
+    ) -> Optional[RenderedTile]:
+        """
+        렌더링 워커에서 페이지의 clip 영역 (x0, y0, x1, y1)을 zoom 배율로 렌더링합니다.
+        워커를 사용할 수 없으면(문서 미지정) None을 반환합니다.
+        기다리는 쪽에서 취소하면 아직 시작하지 않은 렌더링은 실행하지 않습니다.
+        """
+        return await self._run_render_job(
+            render_page_tile_in_worker, page_number, zoom, tuple(clip)
+        )
+
+    async def decode_image_async(self, xref: int) -> Optional[DecodedImage]:
+        """
+        렌더링 워커에서 이미지 xref를 디코딩합니다.
+        워커를 사용할 수 없으면(문서 미지정) None을 반환합니다.
+        """
+        return await self._run_render_job(decode_image_in_worker, xref)
+
+    async def _run_render_job(self, fn, *args):
+        slots = self._render_slots
+        if slots is None:
+            return None
+        async with slots:
+            if slots is not self._render_slots:
+                # 자리를 기다리는 동안 문서가 닫혔거나 바뀌었습니다.
+                return None
+            if self._render_pool is None:
+                self._render_pool = ProcessPoolExecutor(
+                    max_workers=self.render_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_parse_worker,
+                    initargs=(self._pdf_path,),
+                )
+            return await asyncio.wrap_future(self._render_pool.submit(fn, *args))
+
+    def prefetch(self, page_numbers: Iterable[int]):
+        """
+        주어진 페이지들을 백그라운드에서 미리 파싱합니다.
+        이벤트 루프 안에서 호출해야 합니다.
+        """
+        if self._pool is None:
+            return
+        for page_number in page_numbers:
+            if page_number in self._pending:
+                continue
+            if self._cached_layout(page_number) is None:
+                self._submit(page_number)
+
+    def close(self):
+        """워커 프로세스를 종료하고 대기 중인 파싱과 렌더링을 취소합니다."""
+        for pool in (self._pool, self._render_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        for future in self._pending.values():
+            future.cancel()
+        self._pool = None
+        self._render_pool = None
+        self._render_slots = None
+        self._warmup = None
+        self._pending.clear()
+        self._layouts.clear()
+        if self._disk_cache_future is not None:
+            if not self._disk_cache_future.cancel():
+                # 이미 여는 중이면 다 열린 뒤 닫습니다.
+                self._disk_cache_future.add_done_callback(_close_opened_cache)
+            self._disk_cache_future = None
+        self._unsaved_layouts.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+        self._pdf_path = None
@@ -1,8 +1,26 @@
-from src.infrastructure.translation.google_translate_async import google_translate
+from src.infrastructure.translation.google_translate_async import (
+    DEFAULT_LIMIT_PER_HOST,
+    GoogleTranslateClient,
+)
 
 from .translation_gateway import TranslationGateway
 
 
 class GoogleTranslationGateway(TranslationGateway):
+    def __init__(self, limit_per_host: int = DEFAULT_LIMIT_PER_HOST, **client_options):
+        # 게이트웨이 하나가 커넥션 풀 하나를 소유하여 모든 번역 요청이 공유합니다.
+        self.client = GoogleTranslateClient(
+            limit_per_host=limit_per_host, **client_options
+        )
+
     async def translate(self, text, source, target):
-        return await google_translate(text, source, target)
+        return await self.client.translate(text, source, target)
+
+    async def translate_batch(self, texts, source, target):
+        return await self.client.translate_many(texts, source, target)
+
+    def iter_translate_batch(self, texts, source, target):
+        return self.client.iter_translate_many(texts, source, target)
+
+    async def close(self):
+        await self.client.close()
@@ -1,6 +1,19 @@
-from typing import Protocol
+from typing import AsyncIterator, List, Optional, Protocol, Sequence, Tuple
 
 
 class TranslationGateway(Protocol):
     async def translate(self, text: str, source: str, target: str) -> str:
         pass  # Interface method for translating text
+
+    async def translate_batch(
+        self, texts: Sequence[str], source: str, target: str
+    ) -> List[Optional[str]]:
+        pass  # Optional: translate many texts with as few requests as possible
+
+    def iter_translate_batch(
+        self, texts: Sequence[str], source: str, target: str
+    ) -> AsyncIterator[Tuple[int, Optional[str]]]:
+        pass  # Optional: like translate_batch, yielding (index, text) as they finish
+
+    async def close(self) -> None:
+        pass  # Interface method for releasing network resources
@@ -0,0 +1,106 @@
+import math
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# (x0, y0, x1, y1) 형식의 사각형
+Rect = Tuple[float, float, float, float]
+
+DEFAULT_CELL_SIZE = 64.0
+# 이보다 많은 칸에 걸치는 큰 항목은 칸에 등록하지 않고 매 질의마다 직접 검사합니다.
+_MAX_CELLS_PER_ITEM = 256
+
+
+def rects_intersect(a: Sequence[float], b: Sequence[float]) -> bool:
+    """두 사각형이 넓이가 있는 영역을 공유하는지 여부 (fitz.Rect.intersects와 같은 기준)"""
+    if a[0] >= a[2] or a[1] >= a[3] or b[0] >= b[2] or b[1] >= b[3]:
+        return False
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+class GridSpatialIndex:
+    """
+    균일 격자(uniform grid) 기반 공간 인덱스.
+    각 항목을 자신이 걸치는 격자 칸들에 등록해 두고, 질의 사각형이 걸치는 칸의 항목만
+    검사하므로 페이지의 링크, 텍스트 줄처럼 고르게 퍼진 작은 사각형을 찾는 데 적합합니다.
+    query()는 겹치는 항목을 추가한 순서대로 반환합니다.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._rects: List[Rect] = []
+        self._items: List[object] = []
+        self._large: List[int] = []
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[Tuple[Sequence[float], object]], cell_size=None
+    ) -> "GridSpatialIndex":
+        index = cls(cell_size or DEFAULT_CELL_SIZE)
+        for rect, item in items:
+            index.insert(rect, item)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _cell_range(self, rect: Sequence[float]):
+        size = self.cell_size
+        return (
+            range(math.floor(rect[0] / size), math.floor(rect[2] / size) + 1),
+            range(math.floor(rect[1] / size), math.floor(rect[3] / size) + 1),
+        )
+
+    def insert(self, rect: Sequence[float], item: object) -> None:
+        x0, y0, x1, y1 = rect
+        entry = len(self._items)
+        self._rects.append((x0, y0, x1, y1))
+        self._items.append(item)
+        if x0 >= x1 or y0 >= y1:
+            return  # 빈 사각형은 어떤 사각형과도 겹치지 않습니다.
+        if not all(map(math.isfinite, rect)):
+            self._large.append(entry)
+            return
+        columns, rows = self._cell_range(rect)
+        if len(columns) * len(rows) > _MAX_CELLS_PER_ITEM:
+            self._large.append(entry)
+            return
+        for column in columns:
+            for row in rows:
+                self._cells.setdefault((column, row), []).append(entry)
+
+    def _candidates(self, rect: Sequence[float]) -> List[int]:
+        if rect[0] >= rect[2] or rect[1] >= rect[3]:
+            return []
+        found = set(self._large)
+        if not all(map(math.isfinite, rect)):
+            return list(range(len(self._items)))
+        columns, rows = self._cell_range(rect)
+        if len(columns) * len(rows) > len(self._cells):
+            # 질의 영역이 넓으면 등록된 칸만 훑는 편이 빠릅니다.
+            for (column, row), entries in self._cells.items():
+                if column in columns and row in rows:
+                    found.update(entries)
+            return sorted(found)
+        for column in columns:
+            for row in rows:
+                found.update(self._cells.get((column, row), ()))
+        return sorted(found)
+
+    def query(self, rect: Sequence[float]) -> List[object]:
+        """rect와 겹치는 모든 항목을 추가한 순서대로 반환합니다."""
+        if not self._items:
+            return []
+        return [
+            self._items[entry]
+            for entry in self._candidates(rect)
+            if rects_intersect(self._rects[entry], rect)
+        ]
+
+    def first(self, rect: Sequence[float], default=None):
+        """rect와 겹치는 항목 중 가장 먼저 추가된 항목을 반환합니다."""
+        if not self._items:
+            return default
+        for entry in self._candidates(rect):
+            if rects_intersect(self._rects[entry], rect):
+                return self._items[entry]
+        return default
@@ -0,0 +1,71 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+
+# 값이 작을수록 먼저 처리됩니다.
+PRIORITY_VISIBLE = 0  # 사용자가 보고 있는 페이지
+PRIORITY_NEAR = 1  # 바로 다음 페이지
+PRIORITY_FAR = 2  # 그 뒤의 프리페치 페이지
+
+
+def priority_for_distance(distance: int) -> int:
+    """현재 페이지로부터의 거리(페이지 수)에 해당하는 우선순위를 반환합니다."""
+    if distance == 0:
+        return PRIORITY_VISIBLE
+    if distance == 1:
+        return PRIORITY_NEAR
+    return PRIORITY_FAR
+
+
+class PriorityToken:
+    """
+    번역 요청의 우선순위를 담는 변경 가능한 값.
+    한 페이지의 번역 작업에서 나온 모든 요청이 같은 토큰을 공유하므로,
+    사용자가 프리페치 중인 페이지로 이동하면 토큰 값만 바꿔 대기 중인 요청의
+    우선순위를 한꺼번에 올릴 수 있습니다.
+    """
+
+    def __init__(self, value: int = PRIORITY_VISIBLE):
+        self.value = value
+        self._listeners: List[Callable[[], None]] = []
+
+    def set(self, value: int):
+        if value == self.value:
+            return
+        self.value = value
+        for listener in list(self._listeners):
+            listener()
+
+    def add_listener(self, listener: Callable[[], None]):
+        """우선순위가 바뀔 때 호출할 콜백을 등록합니다. (대기열 재정렬용)"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+
+_current_token: ContextVar[Optional[PriorityToken]] = ContextVar(
+    "translation_priority", default=None
+)
+
+
+def current_priority_token() -> PriorityToken:
+    """
+    현재 작업의 우선순위 토큰을 반환합니다.
+    우선순위가 지정되지 않은 요청(CLI 등)은 보이는 페이지와 같은 우선순위로 처리합니다.
+    """
+    token = _current_token.get()
+    return token if token is not None else PriorityToken(PRIORITY_VISIBLE)
+
+
+@contextmanager
+def translation_priority(token: PriorityToken):
+    """
+    블록 안에서 시작된 번역 요청(과 그 안에서 만든 하위 작업)에 우선순위를 지정합니다.
+    """
+    reset_token = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset_token)
@@ -0,0 +1,41 @@
+from typing import List, NamedTuple, Optional, Tuple
+
+# (x0, y0, x1, y1) 형식의 PDF 좌표
+BBox = Tuple[float, float, float, float]
+
+
+class LineRecord(NamedTuple):
+    """
+    페이지에서 추출한 텍스트 한 줄.
+    Qt 객체를 포함하지 않으므로 프로세스 간에 가볍게 전달(pickle)할 수 있습니다.
+    """
+
+    line_id: str
+    block_id: str
+    text: str
+    bbox: BBox
+    font_family: str
+    font_size: float
+    is_bold: bool
+    is_italic: bool
+    link_uri: Optional[str] = None
+
+
+class ImageRecord(NamedTuple):
+    """페이지에 배치된 이미지 한 개. 이미지 데이터 대신 xref와 배치 정보만 담습니다."""
+
+    xref: int
+    bbox: BBox
+    width: int = 0  # 원본 이미지의 픽셀 크기
+    height: int = 0
+    colorspace: int = 0  # 색 성분 수 (1: 회색조, 3: RGB, 4: CMYK, 0: 알 수 없음)
+
+
+class PageLayout(NamedTuple):
+    """한 페이지의 파싱 결과. 화면용 뷰모델은 이 데이터로부터 UI 스레드에서 만듭니다."""
+
+    page_number: int  # 0부터 시작
+    width: float
+    height: float
+    lines: List[LineRecord]
+    images: List[ImageRecord]
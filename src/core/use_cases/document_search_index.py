@@ -0,0 +1,117 @@
+import bisect
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# 세그먼트 텍스트의 종류. 같은 페이지에서는 원문이 번역문보다 먼저 나옵니다.
+KIND_ORIGINAL = "original"
+KIND_TRANSLATED = "translated"
+_KIND_ORDER = {KIND_ORIGINAL: 0, KIND_TRANSLATED: 1}
+
+
+def tokenize(text: str) -> List[str]:
+    """대소문자를 구분하지 않도록 정규화한 단어 목록"""
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+
+class SearchHit(NamedTuple):
+    page_number: int  # 0부터 시작
+    segment_id: str
+    text: str
+    kind: str
+
+
+class DocumentSearchIndex:
+    """
+    문서 전체 세그먼트 텍스트의 역색인(inverted index).
+    페이지 단위로 추가/교체할 수 있어 색인을 만드는 도중에도 검색할 수 있으며,
+    번역이 도착하면 그 페이지의 번역문만 다시 색인합니다.
+    검색어의 각 단어는 색인된 단어의 접두어로 비교하고(예: "번역" → "번역기를"),
+    모든 단어를 포함하는 세그먼트를 페이지 순서대로 반환합니다.
+    이벤트 루프 스레드에서만 사용합니다.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self._entries: List[Optional[SearchHit]] = []
+        self._page_entries: Dict[Tuple[int, str], List[int]] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._vocabulary: List[str] = []  # 접두어 검색용으로 정렬된 단어 목록
+        self._vocabulary_dirty = False
+        self.indexed_pages: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries) - self._entries.count(None)
+
+    def add_page(
+        self,
+        page_number: int,
+        segments: Iterable[Tuple[str, str]],
+        kind: str = KIND_ORIGINAL,
+    ) -> None:
+        """
+        한 페이지의 (segment_id, 텍스트) 목록을 색인합니다.
+        같은 페이지/종류로 이미 색인된 내용은 새 내용으로 교체합니다.
+        """
+        self._remove_page(page_number, kind)
+        entry_ids = []
+        for segment_id, text in segments:
+            tokens = set(tokenize(text))
+            if not tokens:
+                continue
+            entry_id = len(self._entries)
+            self._entries.append(SearchHit(page_number, segment_id, text, kind))
+            entry_ids.append(entry_id)
+            for token in tokens:
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = set()
+                    self._vocabulary_dirty = True
+                postings.add(entry_id)
+        self._page_entries[(page_number, kind)] = entry_ids
+        if kind == KIND_ORIGINAL:
+            self.indexed_pages.add(page_number)
+
+    def _remove_page(self, page_number: int, kind: str):
+        for entry_id in self._page_entries.pop((page_number, kind), ()):
+            entry = self._entries[entry_id]
+            self._entries[entry_id] = None
+            for token in set(tokenize(entry.text)):
+                postings = self._postings.get(token)
+                if postings is None:
+                    continue
+                postings.discard(entry_id)
+                if not postings:
+                    del self._postings[token]
+                    self._vocabulary_dirty = True
+
+    def _matching_entries(self, term: str) -> Set[int]:
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+        matches: Set[int] = set()
+        vocabulary = self._vocabulary
+        position = bisect.bisect_left(vocabulary, term)
+        while position < len(vocabulary) and vocabulary[position].startswith(term):
+            matches.update(self._postings[vocabulary[position]])
+            position += 1
+        return matches
+
+    def search(self, query: str, limit: int = 500) -> List[SearchHit]:
+        """query의 모든 단어를 포함하는 세그먼트를 페이지 순서대로 최대 limit개 반환합니다."""
+        terms = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not terms:
+            return []
+        found: Optional[Set[int]] = None
+        # 긴 단어일수록 후보가 적으므로 먼저 교집합을 만듭니다.
+        for term in terms:
+            matches = self._matching_entries(term)
+            found = matches if found is None else found & matches
+            if not found:
+                return []
+        hits = [self._entries[entry_id] for entry_id in sorted(found)]
+        hits.sort(key=lambda hit: (hit.page_number, _KIND_ORDER.get(hit.kind, 2)))
+        return hits[:limit]
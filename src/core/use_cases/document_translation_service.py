@@ -0,0 +1,158 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Awaitable, Callable, Iterable, List, NamedTuple, Optional, Tuple
+
+import fitz
+
+from src.core.use_cases.repeated_block_analyzer import RepeatedBlockAnalyzer
+from src.core.use_cases.translation_service import TranslationService
+from src.infrastructure.pdf_parsing.layout_extractor import (
+    extract_page_layout_in_worker,
+    init_parse_worker,
+)
+
+
+class TextLine(NamedTuple):
+    """번역에 필요한 최소한의 줄 정보 (프로세스 간 전달을 위해 Qt 객체를 포함하지 않음)"""
+
+    segment_id: str
+    block_id: str
+    line_id: str
+    text: str
+    bounds: Optional[Tuple[float, float, float, float]] = None  # (x, y, 너비, 높이)
+
+
+class PageTranslationResult(NamedTuple):
+    page_number: int  # 0부터 시작
+    lines: List[TextLine]
+    translated_blocks: dict  # {block_id: translated_text 또는 None}
+    missing_blocks: List[str]
+
+
+def _parse_page_lines(page_number: int) -> List[TextLine]:
+    """워커 프로세스에서 페이지를 파싱하여 번역에 필요한 줄 정보만 돌려줍니다."""
+    layout = extract_page_layout_in_worker(page_number)
+    return [
+        TextLine(
+            f"orig_{line.line_id}",
+            line.block_id,
+            line.line_id,
+            line.text,
+            (
+                line.bbox[0],
+                line.bbox[1],
+                line.bbox[2] - line.bbox[0],
+                line.bbox[3] - line.bbox[1],
+            ),
+        )
+        for line in layout.lines
+    ]
+
+
+class DocumentTranslationService:
+    """
+    GUI 없이 문서 전체를 번역하는 파이프라인.
+    - 파싱: 프로세스 풀에서 페이지를 병렬로 파싱합니다.
+    - 번역: 파싱된 페이지를 제한된 개수의 번역 작업자가 이어받아 번역합니다.
+    파싱이 번역보다 너무 앞서가지 않도록 대기열 크기로 선행 파싱 페이지 수를 제한합니다.
+    파싱된 페이지는 반복 블록 분석에도 쓰여, 머리말/꼬리말 같은 반복 블록은
+    번역 서비스가 문서에서 한 번만 번역하고 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        translation_service: TranslationService,
+        parse_workers: Optional[int] = None,
+        translate_concurrency: int = 4,
+        max_pages_ahead: int = 8,
+    ):
+        self.translation_service = translation_service
+        self.parse_workers = parse_workers or max(1, min(4, os.cpu_count() or 1))
+        self.translate_concurrency = max(1, translate_concurrency)
+        self.max_pages_ahead = max(1, max_pages_ahead)
+
+    async def translate_document(
+        self,
+        pdf_path: str,
+        source_lang: str,
+        target_lang: str,
+        on_page_done: Callable[[PageTranslationResult], Awaitable[None]],
+        page_numbers: Optional[Iterable[int]] = None,
+    ) -> None:
+        """
+        문서를 번역하며 페이지 번역이 끝날 때마다 on_page_done을 호출합니다.
+        페이지는 완료 순서대로 전달되므로 순서가 필요하면 호출 측에서 정렬합니다.
+        :param page_numbers: 번역할 페이지 번호(0부터 시작). 없으면 전체 페이지.
+        """
+        if page_numbers is None:
+            with fitz.open(pdf_path) as doc:
+                page_numbers = range(doc.page_count)
+        page_numbers = list(page_numbers)
+        if not page_numbers:
+            return
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_pages_ahead)
+        # 번역보다 앞서 파싱되는 페이지들로 반복 블록을 미리 찾아 둡니다.
+        analyzer = RepeatedBlockAnalyzer()
+        previous_analyzer = self.translation_service.repeated_blocks
+        self.translation_service.repeated_blocks = analyzer
+
+        def analyze_parsed(page_number, parse_future):
+            if not parse_future.cancelled() and parse_future.exception() is None:
+                analyzer.add_page_segments(page_number, parse_future.result())
+
+        with ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            initializer=init_parse_worker,
+            initargs=(pdf_path,),
+        ) as pool:
+
+            async def produce():
+                for page_number in page_numbers:
+                    parse_future = loop.run_in_executor(
+                        pool, _parse_page_lines, page_number
+                    )
+                    parse_future.add_done_callback(
+                        lambda done, page_number=page_number: analyze_parsed(
+                            page_number, done
+                        )
+                    )
+                    await queue.put((page_number, parse_future))
+                for _ in range(self.translate_concurrency):
+                    await queue.put(None)
+
+            async def consume():
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    page_number, parse_future = item
+                    lines = await parse_future
+                    translated_blocks = (
+                        await self.translation_service.translate_segments(
+                            lines, source_lang, target_lang
+                        )
+                    )
+                    await on_page_done(
+                        PageTranslationResult(
+                            page_number=page_number,
+                            lines=lines,
+                            translated_blocks=translated_blocks,
+                            missing_blocks=self.translation_service.missing_blocks(
+                                lines, translated_blocks
+                            ),
+                        )
+                    )
+
+            workers = [asyncio.ensure_future(produce())] + [
+                asyncio.ensure_future(consume())
+                for _ in range(self.translate_concurrency)
+            ]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                self.translation_service.repeated_blocks = previous_analyzer
@@ -0,0 +1,187 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import AsyncIterator, Dict, Hashable, List, Optional, Tuple
+
+from src.common.translation_priority import (
+    PRIORITY_VISIBLE,
+    PriorityToken,
+    translation_priority,
+)
+from src.core.use_cases.translation_service import TranslationService
+
+logger = logging.getLogger(__name__)
+
+
+class PageTranslationJob:
+    """
+    한 페이지의 번역 작업.
+    번역 결과는 도착하는 대로 results에 쌓이며, 여러 호출자가 같은 작업에 붙어
+    stream()으로 블록 단위 결과를 받거나 wait()로 전체 결과를 기다릴 수 있습니다.
+    작업에서 나오는 모든 번역 요청은 priority 토큰의 우선순위로 처리됩니다.
+    """
+
+    def __init__(
+        self,
+        key: Hashable,
+        stream: AsyncIterator[Tuple[str, Optional[str]]],
+        priority: int = PRIORITY_VISIBLE,
+    ):
+        self.key = key
+        self.priority = PriorityToken(priority)
+        self.results: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._arrivals: List[str] = []  # 도착 순서대로의 block_id
+        self._updated = asyncio.Event()
+        self._stream = stream
+        self.task = asyncio.ensure_future(self._run())
+
+    @property
+    def done(self) -> bool:
+        return self.task.done()
+
+    async def _run(self):
+        try:
+            with translation_priority(self.priority):
+                async for block_id, translated_text in self._stream:
+                    self.results[block_id] = translated_text
+                    self._arrivals.append(block_id)
+                    self._notify()
+        finally:
+            await self._stream.aclose()
+            self._notify()
+
+    def _notify(self):
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+    async def stream(self) -> AsyncIterator[Tuple[str, Optional[str]]]:
+        """
+        이미 도착한 결과부터 시작하여 작업이 끝날 때까지 (block_id, 번역문)을 내보냅니다.
+        구독을 중단해도 작업 자체는 취소되지 않습니다.
+        """
+        index = 0
+        while True:
+            while index < len(self._arrivals):
+                block_id = self._arrivals[index]
+                index += 1
+                yield block_id, self.results[block_id]
+            if self.done:
+                if not self.task.cancelled() and self.task.exception() is not None:
+                    raise self.task.exception()
+                return
+            await self._updated.wait()
+
+    async def wait(self) -> dict:
+        """작업이 끝날 때까지 기다려 {block_id: 번역문}을 반환합니다."""
+        await asyncio.shield(self.task)
+        return dict(self.results)
+
+    def cancel(self):
+        self.task.cancel()
+
+
+class PageTranslationJobs:
+    """
+    (문서, 페이지, 원본 언어, 번역 언어)를 키로 하는 single-flight 페이지 번역 관리자.
+    같은 페이지를 번역 중이면 새 요청을 보내지 않고 진행 중인 작업을 돌려주며,
+    끝난 작업의 결과는 max_completed 개까지 보관합니다.
+    실패한 블록이 있는 결과를 다시 요청하면 누락된 블록만 번역하는 새 작업을 시작합니다.
+    """
+
+    def __init__(
+        self, translation_service: TranslationService, max_completed: int = 256
+    ):
+        self.translation_service = translation_service
+        self.max_completed = max_completed
+        self._in_flight: dict = {}
+        self._completed: "OrderedDict[Hashable, PageTranslationJob]" = OrderedDict()
+
+    @staticmethod
+    def make_key(document_key, page_number, source_lang, target_lang) -> tuple:
+        return (document_key, page_number, source_lang, target_lang)
+
+    def get(self, key) -> Optional[PageTranslationJob]:
+        """진행 중이거나 보관 중인 작업을 반환합니다."""
+        job = self._in_flight.get(key)
+        if job is None:
+            job = self._completed.get(key)
+            if job is not None:
+                self._completed.move_to_end(key)
+        return job
+
+    def in_flight_keys(self) -> List[Hashable]:
+        return list(self._in_flight)
+
+    def start(
+        self,
+        key,
+        segments,
+        source_lang,
+        target_lang,
+        priority: int = PRIORITY_VISIBLE,
+    ) -> PageTranslationJob:
+        """
+        key에 해당하는 번역 작업을 반환합니다.
+        - 진행 중인 작업이 있으면 그 작업에 합류합니다.
+          (요청한 우선순위가 더 높으면 작업의 우선순위를 올립니다)
+        - 모든 블록이 번역된 완료 작업이 있으면 그 작업을 그대로 돌려줍니다.
+        - 그 외에는 (이전 결과가 있으면 누락된 블록만) 새 작업을 시작합니다.
+        """
+        job = self._in_flight.get(key)
+        if job is not None:
+            if priority < job.priority.value:
+                job.priority.set(priority)
+            return job
+        previous = self._completed.get(key)
+        if previous is not None:
+            if not self.translation_service.missing_blocks(segments, previous.results):
+                self._completed.move_to_end(key)
+                return previous
+
+        job = PageTranslationJob(
+            key,
+            self.translation_service.iter_translations(
+                segments,
+                source_lang,
+                target_lang,
+                previous=dict(previous.results) if previous is not None else None,
+            ),
+            priority,
+        )
+        self._in_flight[key] = job
+        job.task.add_done_callback(lambda _task, job=job: self._on_job_done(job))
+        return job
+
+    def _on_job_done(self, job: PageTranslationJob):
+        if self._in_flight.get(job.key) is job:
+            del self._in_flight[job.key]
+        if not job.task.cancelled() and job.task.exception() is not None:
+            logger.warning("페이지 번역 실패 %s: %s", job.key, job.task.exception())
+        if not job.results:
+            return
+        # 취소되거나 일부 실패한 결과도 보관하여 다음 요청 때 누락된 블록만 번역합니다.
+        self._completed[job.key] = job
+        self._completed.move_to_end(job.key)
+        while len(self._completed) > self.max_completed:
+            self._completed.popitem(last=False)
+
+    def cancel(self, key):
+        job = self._in_flight.get(key)
+        if job is not None:
+            job.cancel()
+
+    def retain(self, priorities: Dict[Hashable, int]):
+        """
+        진행 중인 작업 중 priorities에 있는 작업은 우선순위를 갱신하고,
+        없는 작업(더 이상 필요 없는 페이지)은 취소합니다.
+        취소된 작업의 부분 결과는 보관되므로 나중에 누락된 블록만 다시 요청합니다.
+        """
+        for key, job in list(self._in_flight.items()):
+            if key in priorities:
+                job.priority.set(priorities[key])
+            else:
+                job.cancel()
+
+    def cancel_all(self):
+        for job in list(self._in_flight.values()):
+            job.cancel()
@@ -0,0 +1,115 @@
+import re
+from typing import Dict, Iterable, Optional, Sequence, Set, Tuple
+
+_NUMBER_PATTERN = re.compile(r"\d+")
+# 글자(문자)가 하나도 없는 텍스트: 쪽 번호, 날짜, 구분선 등
+_NO_LETTERS_PATTERN = re.compile(r"[\W\d_]+")
+
+# 같은 위치로 볼 세로 위치 구간의 높이 (PDF 포인트)
+DEFAULT_POSITION_BAND = 12.0
+# 이 페이지 수 이상에서 같은 위치/형태로 나오는 블록을 반복 블록(머리말/꼬리말)으로 봅니다.
+DEFAULT_MIN_PAGES = 3
+
+BlockKey = Tuple[str, int]
+
+
+def block_template(text: str) -> str:
+    """공백을 정규화하고 숫자를 #으로 가린 텍스트. ("Page 3 of 120" → "Page # of #")"""
+    return _NUMBER_PATTERN.sub("#", " ".join(text.split()))
+
+
+def needs_translation(text: str) -> bool:
+    """글자가 없는 텍스트(숫자, 기호만 있는 블록)는 번역하지 않고 그대로 사용합니다."""
+    return _NO_LETTERS_PATTERN.fullmatch(text.strip() or " ") is None
+
+
+def fill_numbers(sample_text: str, sample_translation: str, text: str) -> Optional[str]:
+    """
+    숫자만 다른 블록(sample_text)의 번역으로 text의 번역을 만듭니다.
+    번역문에 원문의 숫자가 모두 그대로 남아 있고 숫자의 대응이 하나로 정해질 때만
+    숫자를 바꿔 넣으며, 그렇지 않으면 None을 반환합니다.
+    """
+    sample_numbers = _NUMBER_PATTERN.findall(sample_text)
+    numbers = _NUMBER_PATTERN.findall(text)
+    if len(sample_numbers) != len(numbers):
+        return None
+    mapping: Dict[str, str] = {}
+    for sample_number, number in zip(sample_numbers, numbers):
+        if mapping.setdefault(sample_number, number) != number:
+            return None  # 같은 숫자가 서로 다른 숫자로 바뀌어야 하는 경우
+    if sorted(_NUMBER_PATTERN.findall(sample_translation)) != sorted(sample_numbers):
+        return None
+    return _NUMBER_PATTERN.sub(lambda match: mapping[match.group()], sample_translation)
+
+
+def segments_bbox(segments) -> Optional[Tuple[float, float, float, float]]:
+    """세그먼트들의 bounds (x, y, 너비, 높이)를 합친 (x0, y0, x1, y1). 위치 정보가 없으면 None."""
+    if any(getattr(seg, "bounds", None) is None for seg in segments):
+        return None
+    return (
+        min(seg.bounds[0] for seg in segments),
+        min(seg.bounds[1] for seg in segments),
+        max(seg.bounds[0] + seg.bounds[2] for seg in segments),
+        max(seg.bounds[1] + seg.bounds[3] for seg in segments),
+    )
+
+
+class RepeatedBlockAnalyzer:
+    """
+    문서 전체에서 여러 페이지의 같은 위치에 같은 형태로 나오는 블록
+    (머리말, 꼬리말, 쪽 번호, 저작권 문구 등)을 찾습니다.
+    블록은 (숫자를 가린 텍스트, 세로 위치 구간)으로 구분하므로
+    "Page 3 of 120"과 "Page 4 of 120"처럼 숫자만 다른 블록도 같은 반복 블록으로 봅니다.
+    페이지는 색인하는 순서대로 하나씩 추가할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        min_pages: int = DEFAULT_MIN_PAGES,
+        position_band: float = DEFAULT_POSITION_BAND,
+    ):
+        self.min_pages = min_pages
+        self.position_band = position_band
+        self._pages_by_key: Dict[BlockKey, Set[int]] = {}
+
+    def block_key(self, text: str, bbox: Sequence[float]) -> BlockKey:
+        center_y = (bbox[1] + bbox[3]) / 2
+        return block_template(text), round(center_y / self.position_band)
+
+    def add_page(
+        self, page_number: int, blocks: Iterable[Tuple[str, Sequence[float]]]
+    ) -> None:
+        """한 페이지의 (블록 텍스트, (x0, y0, x1, y1)) 목록을 추가합니다."""
+        for text, bbox in blocks:
+            if not text.strip():
+                continue
+            self._pages_by_key.setdefault(self.block_key(text, bbox), set()).add(
+                page_number
+            )
+
+    def add_page_segments(self, page_number: int, segments) -> None:
+        """
+        한 페이지의 세그먼트(block_id, text, bounds를 가진 줄) 목록을 블록으로 묶어 추가합니다.
+        블록 텍스트는 번역할 때와 같이 줄을 줄바꿈으로 이어 만듭니다.
+        """
+        blocks: Dict[str, list] = {}
+        for seg in segments:
+            blocks.setdefault(seg.block_id, []).append(seg)
+        block_texts = []
+        for block in blocks.values():
+            bbox = segments_bbox(block)
+            if bbox is not None:
+                block_texts.append(("\n".join(seg.text for seg in block), bbox))
+        self.add_page(page_number, block_texts)
+
+    def is_repeated(self, text: str, bbox: Sequence[float]) -> bool:
+        pages = self._pages_by_key.get(self.block_key(text, bbox))
+        return pages is not None and len(pages) >= self.min_pages
+
+    def repeated_templates(self) -> Dict[str, int]:
+        """반복 블록의 템플릿과 나오는 페이지 수 (분석 결과 확인용)"""
+        counts: Dict[str, int] = {}
+        for (template, _band), pages in self._pages_by_key.items():
+            if len(pages) >= self.min_pages:
+                counts[template] = max(counts.get(template, 0), len(pages))
+        return counts
@@ -1,51 +1,280 @@
 import asyncio
 from collections import OrderedDict
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
 import fitz
 
 from src.adapters.gateways.translation_gateway import TranslationGateway
-from src.infrastructure.dtos.pdf_view_dtos import SegmentViewData
+from src.common.translation_priority import PriorityToken, current_priority_token
+from src.common.utils import LruCache
+from src.core.use_cases.repeated_block_analyzer import (
+    block_template,
+    fill_numbers,
+    needs_translation,
+    segments_bbox,
+)
+
+# 재사용할 반복 블록 번역(템플릿별 대표 번역)의 최대 개수
+DEFAULT_TEMPLATE_CACHE_SIZE = 256
+
+
+class _PendingTemplate:
+    """대표 블록을 번역 중인 반복 블록 템플릿"""
+
+    def __init__(self, priority: PriorityToken):
+        # 번역이 끝나면 (원문, 번역문), 모두 실패하면 None
+        self.result: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.priority = priority  # 처음 대표로 번역을 시작한 작업의 우선순위
+        self.translators = 1  # 이 템플릿을 번역 중인 호출 수
 
 
 class TranslationService:
-    def __init__(self, gateway: TranslationGateway):
+    def __init__(self, gateway: TranslationGateway, memory=None, repeated_blocks=None):
+        """
+        :param gateway: 실제 번역 요청을 수행하는 TranslationGateway
+        :param memory: 번역 메모리(get_many/put_many 제공). 지정하면 게이트웨이 호출 전에
+            조회하고, 새로 번역된 결과를 저장합니다.
+        :param repeated_blocks: 문서의 반복 블록 분석 결과(RepeatedBlockAnalyzer).
+            지정하면 반복 블록은 문서에서 한 번만 번역하여 재사용합니다.
+        """
         self.gateway = gateway
+        self.memory = memory
+        self.repeated_blocks = repeated_blocks
+        # (템플릿, 원본 언어, 번역 언어) -> 대표 블록의 (원문, 번역문)
+        self._template_translations = LruCache(DEFAULT_TEMPLATE_CACHE_SIZE)
+        # 대표 블록을 번역 중인 템플릿
+        self._pending_templates: Dict[tuple, _PendingTemplate] = {}
 
-    async def translate_segments(self, segments, source_lang, target_lang) -> dict:
+    async def translate_segments(
+        self, segments, source_lang, target_lang, previous: Optional[dict] = None
+    ) -> dict:
         """
         SegmentViewData 리스트를 받아 번역 결과를 반환합니다.
         번역 품질을 위해 세그먼트를 블록 단위로 묶어 번역 API에 요청합니다.
-        :return: {block_id: translated_text} 형태의 딕셔너리
+        번역 메모리가 있으면 이미 번역된 블록은 요청하지 않습니다.
+        :param previous: 이전에 받은 (일부 실패한) 번역 결과. 지정하면 번역된 블록은
+            그대로 사용하고 누락된 블록만 다시 요청합니다.
+        :return: {block_id: translated_text} 형태의 딕셔너리.
+            번역에 실패한 블록의 값은 None입니다. (missing_blocks 참고)
         """
         if not segments:
             return {}
+        # 블록 순서를 유지하기 위해 먼저 모든 block_id를 채워 둡니다.
+        translated_blocks = dict.fromkeys(self.group_by_block(segments))
+        async for block_id, translated_text in self.iter_translations(
+            segments, source_lang, target_lang, previous=previous
+        ):
+            translated_blocks[block_id] = translated_text
+        return translated_blocks
+
+    async def iter_translations(
+        self, segments, source_lang, target_lang, previous: Optional[dict] = None
+    ) -> AsyncIterator[Tuple[str, Optional[str]]]:
+        """
+        translate_segments와 같은 방식으로 번역하되, 블록의 번역이 끝나는 대로
+        (block_id, translated_text)를 내보냅니다. 모든 블록이 정확히 한 번씩 나오며,
+        실패한 블록의 번역문은 None입니다.
+        이전 결과와 번역 메모리에 있는 블록이 먼저 나오고, 나머지는 응답 도착 순서대로 나옵니다.
+        반복을 중간에 멈추면 남은 번역 요청은 취소됩니다.
+        """
+        if not segments:
+            return
 
         # 1. block_id를 기준으로 세그먼트를 순서대로 그룹화합니다.
-        blocks = OrderedDict()
-        for seg in segments:
-            if seg.block_id not in blocks:
-                blocks[seg.block_id] = []
-            blocks[seg.block_id].append(seg)
+        blocks = self.group_by_block(segments)
 
-        # 2. 블록별로 텍스트를 합치고 번역을 요청합니다.
+        # 2. 블록별로 텍스트를 합칩니다.
         #    줄바꿈(\n)으로 텍스트를 연결하여 문단 구조를 유지합니다.
-        block_texts_to_translate = [
-            "\n".join(s.text for s in block_segments)
-            for block_segments in blocks.values()
-        ]
+        block_texts = {
+            block_id: "\n".join(s.text for s in block_segments)
+            for block_id, block_segments in blocks.items()
+        }
+
+        # 3. 이전 결과에서 이미 번역된 블록은 그대로 사용합니다.
+        if previous:
+            for block_id in list(block_texts):
+                if previous.get(block_id):
+                    del block_texts[block_id]
+                    yield block_id, previous[block_id]
 
-        tasks = [
-            self.gateway.translate(text, source_lang, target_lang)
-            for text in block_texts_to_translate
+        # 4. 글자가 없는 블록(쪽 번호 등)은 번역하지 않고 그대로 사용합니다.
+        for block_id, text in list(block_texts.items()):
+            if not needs_translation(text):
+                del block_texts[block_id]
+                yield block_id, text
+
+        # 5. 반복 블록(머리말/꼬리말)은 문서에서 한 번만 번역하고 숫자만 바꿔 재사용합니다.
+        #    다른 페이지에서 같은 반복 블록을 번역 중이면 그 결과를 기다리되, 그 페이지의
+        #    우선순위가 더 낮으면(예: 보이는 페이지가 먼 프리페치를 기다리게 되면)
+        #    기다리지 않고 직접 번역하여, 먼저 끝나는 쪽의 결과를 함께 씁니다.
+        priority = current_priority_token()
+        reused = []  # 이미 번역된 반복 블록으로 만든 (block_id, 번역문)
+        waiting = []  # (block_id, 원문, 대표 번역 Future)
+        # 이번 호출이 대표로 번역하는 원문 -> (템플릿 키, _PendingTemplate)
+        representatives = {}
+        if self.repeated_blocks is not None:
+            for block_id, text in list(block_texts.items()):
+                bbox = segments_bbox(blocks[block_id])
+                if bbox is None or not self.repeated_blocks.is_repeated(text, bbox):
+                    continue
+                key = (block_template(text), source_lang, target_lang)
+                sample = self._template_translations.get(key)
+                if sample is not None:
+                    translated_text = fill_numbers(*sample, text)
+                    if translated_text is not None:
+                        del block_texts[block_id]
+                        reused.append((block_id, translated_text))
+                    continue
+                pending = self._pending_templates.get(key)
+                if pending is not None and pending.priority.value <= priority.value:
+                    del block_texts[block_id]
+                    waiting.append((block_id, text, pending.result))
+                elif text not in representatives:
+                    if pending is None:
+                        pending = self._pending_templates[key] = _PendingTemplate(
+                            priority
+                        )
+                    else:
+                        pending.translators += 1
+                    representatives[text] = (key, pending)
+
+        try:
+            for block_id, translated_text in reused:
+                yield block_id, translated_text
+            # 6. 나머지 블록을 번역 메모리와 게이트웨이로 번역합니다.
+            block_ids_by_text = OrderedDict()
+            for block_id, text in block_texts.items():
+                block_ids_by_text.setdefault(text, []).append(block_id)
+            async for text, translated_text in self._iter_texts(
+                list(block_ids_by_text), source_lang, target_lang
+            ):
+                self._resolve_template(representatives, text, translated_text)
+                for block_id in block_ids_by_text[text]:
+                    yield block_id, translated_text
+        finally:
+            # 번역하지 못한 대표 블록을 기다리는 다른 페이지는 직접 번역하도록 합니다.
+            for text in list(representatives):
+                self._resolve_template(representatives, text, None)
+
+        # 7. 다른 페이지가 번역한 반복 블록의 결과를 재사용합니다.
+        retry = OrderedDict()
+        for block_id, text, pending in waiting:
+            sample = await asyncio.shield(pending)
+            translated_text = fill_numbers(*sample, text) if sample else None
+            if translated_text is not None:
+                yield block_id, translated_text
+            else:
+                retry.setdefault(text, []).append(block_id)
+        if retry:
+            async for text, translated_text in self._iter_texts(
+                list(retry), source_lang, target_lang
+            ):
+                for block_id in retry[text]:
+                    yield block_id, translated_text
+
+    async def _iter_texts(self, texts, source_lang, target_lang):
+        """
+        번역 메모리에 있는 텍스트는 바로, 나머지는 게이트웨이로 번역하여
+        (원문, 번역문)을 내보냅니다. 새로 번역된 결과는 번역 메모리에 저장합니다.
+        """
+        if not texts:
+            return
+        cached = {}
+        if self.memory is not None:
+            cached = self.memory.get_many(texts, source_lang, target_lang)
+        for text in texts:
+            if text in cached:
+                yield text, cached[text]
+        # 메모리에 없는 텍스트만 번역을 요청합니다. (같은 텍스트는 한 번만 요청)
+        texts_to_translate = [text for text in texts if text not in cached]
+        if not texts_to_translate:
+            return
+        fresh = {}
+        try:
+            async for text, translated_text in self._iter_gateway(
+                texts_to_translate, source_lang, target_lang
+            ):
+                fresh[text] = translated_text
+                yield text, translated_text
+        finally:
+            if self.memory is not None and fresh:
+                # 실패한(None) 결과는 put_many에서 저장하지 않습니다.
+                self.memory.put_many(fresh, source_lang, target_lang)
+
+    def _resolve_template(self, representatives, text, translated_text):
+        key, pending = representatives.pop(text, (None, None))
+        if pending is None:
+            return
+        sample = (text, translated_text) if translated_text else None
+        if sample is not None:
+            self._template_translations.put(key, sample)
+        pending.translators -= 1
+        if pending.result.done() or (sample is None and pending.translators > 0):
+            return  # 이미 결과가 있거나, 다른 호출이 아직 번역 중입니다.
+        pending.result.set_result(sample)
+        if self._pending_templates.get(key) is pending:
+            del self._pending_templates[key]
+
+    async def _iter_gateway(self, texts, source_lang, target_lang):
+        """
+        게이트웨이가 지원하는 가장 효율적인 방식으로 번역하며 (원문, 번역문)을 내보냅니다.
+        묶음 번역(iter_translate_batch / translate_batch)을 지원하면 여러 블록을
+        한 요청으로 보내고, 그렇지 않으면 텍스트마다 translate를 호출합니다.
+        """
+        iter_translate_batch = getattr(self.gateway, "iter_translate_batch", None)
+        translate_batch = getattr(self.gateway, "translate_batch", None)
+        if iter_translate_batch is not None:
+            async for index, translated_text in iter_translate_batch(
+                texts, source_lang, target_lang
+            ):
+                yield texts[index], translated_text
+        elif translate_batch is not None:
+            translated_texts = await translate_batch(texts, source_lang, target_lang)
+            for text, translated_text in zip(texts, translated_texts):
+                yield text, translated_text
+        else:
+
+            async def translate_one(text):
+                return text, await self.gateway.translate(
+                    text, source_lang, target_lang
+                )
+
+            tasks = [asyncio.ensure_future(translate_one(text)) for text in texts]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    @staticmethod
+    def missing_blocks(segments, translated_blocks: Optional[dict]) -> List[str]:
+        """
+        번역 결과에서 누락된(실패한) 블록의 block_id 목록을 원래 순서대로 반환합니다.
+        """
+        translated_blocks = translated_blocks or {}
+        return [
+            block_id
+            for block_id in TranslationService.group_by_block(segments)
+            if not translated_blocks.get(block_id)
         ]
-        translated_block_texts = await asyncio.gather(*tasks)
 
-        # 3. 번역된 블록 텍스트를 block_id에 매핑하여 반환합니다.
-        translated_blocks = {}
-        for i, block_id in enumerate(blocks.keys()):
-            translated_blocks[block_id] = translated_block_texts[i]
+    async def close(self):
+        """게이트웨이의 네트워크 자원과 번역 메모리를 정리합니다."""
+        close_gateway = getattr(self.gateway, "close", None)
+        if close_gateway is not None:
+            await close_gateway()
+        if self.memory is not None:
+            self.memory.close()
 
-        return translated_blocks
+    @staticmethod
+    def group_by_block(segments) -> "OrderedDict[str, list]":
+        blocks = OrderedDict()
+        for seg in segments:
+            if seg.block_id not in blocks:
+                blocks[seg.block_id] = []
+            blocks[seg.block_id].append(seg)
+        return blocks
 
     @staticmethod
     def build_translated_segments(original_segments, translated_blocks: dict):
@@ -55,12 +284,10 @@ class TranslationService:
         """
         if not original_segments:
             return []
+        # 뷰 DTO는 Qt를 불러오므로, 화면 없이 쓰는 CLI가 Qt 없이 동작하도록 여기서 불러옵니다.
+        from src.infrastructure.dtos.pdf_view_dtos import SegmentViewData
 
-        blocks = OrderedDict()
-        for seg in original_segments:
-            if seg.block_id not in blocks:
-                blocks[seg.block_id] = []
-            blocks[seg.block_id].append(seg)
+        blocks = TranslationService.group_by_block(original_segments)
 
         translated_segments = []
         for block_id, segments_in_block in blocks.items():
@@ -69,15 +296,8 @@ class TranslationService:
 
             block_bbox = fitz.Rect()
             for seg in segments_in_block:
-                qrect = seg.rect
-                block_bbox.include_rect(
-                    fitz.Rect(
-                        qrect.x(),
-                        qrect.y(),
-                        qrect.x() + qrect.width(),
-                        qrect.y() + qrect.height(),
-                    )
-                )
+                x, y, width, height = seg.bounds
+                block_bbox.include_rect(fitz.Rect(x, y, x + width, y + height))
 
             first_seg = segments_in_block[0]
             translated_text = translated_blocks[block_id]
@@ -94,7 +314,7 @@ class TranslationService:
                     ),
                     font_family=first_seg.font_family,
                     font_size=first_seg.font_size,
-                    font_color=first_seg.font_color.name(),
+                    font_color=first_seg.color_name,
                     is_bold=first_seg.is_bold,
                     is_italic=first_seg.is_italic,
                     is_highlighted=False,
@@ -11,6 +11,10 @@ class AppSettings:
     prefetch_page_count: int = 0  # 미리 번역할 페이지 수 (백그라운드)
     preview_page_count: int = 10  # 미리보기 다이얼로그에 표시할 페이지 수 (썸네일)
     enable_highlighting: bool = True  # 하이라이트 기능 활성화 여부
+    translation_connection_limit: int = 8  # 번역 서버 호스트당 최대 동시 연결 수
+    enable_layout_cache: bool = True  # 파싱한 페이지 구조를 디스크에 캐시할지 여부
+    enable_raster_background: bool = False  # 원본 페이지를 이미지 타일로 표시할지 여부
+    enable_continuous_scroll: bool = False  # 페이지를 세로로 이어서 스크롤할지 여부
 
 
     @property
@@ -28,6 +32,10 @@ class AppSettings:
             "prefetch_page_count": self.prefetch_page_count,  # 백그라운드 프리페치
             "preview_page_count": self.preview_page_count,  # 미리보기 다이얼로그 (썸네일)
             "enable_highlighting": self.enable_highlighting,
+            "translation_connection_limit": self.translation_connection_limit,
+            "enable_layout_cache": self.enable_layout_cache,
+            "enable_raster_background": self.enable_raster_background,
+            "enable_continuous_scroll": self.enable_continuous_scroll,
 
         }
 
@@ -43,4 +51,8 @@ class AppSettings:
                 "preview_page_count", 10
             ),  # 미리보기 다이얼로그
             enable_highlighting=data.get("enable_highlighting", True),
+            translation_connection_limit=data.get("translation_connection_limit", 8),
+            enable_layout_cache=data.get("enable_layout_cache", True),
+            enable_raster_background=data.get("enable_raster_background", False),
+            enable_continuous_scroll=data.get("enable_continuous_scroll", False),
         )
@@ -5,6 +5,29 @@ from PySide6.QtGui import QColor, QPixmap
 
 
 class SegmentViewData:
+    """
+    화면에 표시할 텍스트 세그먼트(줄 또는 번역 블록).
+    좌표와 색상은 파이썬 기본 값으로 보관하고, QRectF/QColor는 화면에서 처음 필요할 때
+    만듭니다. 한 페이지에 수천 개가 만들어지므로 __slots__로 메모리를 줄입니다.
+    """
+
+    __slots__ = (
+        "segment_id",
+        "text",
+        "bounds",
+        "font_family",
+        "font_size",
+        "color_name",
+        "is_bold",
+        "is_italic",
+        "is_highlighted",
+        "link_uri",
+        "block_id",
+        "line_id",
+        "_rect",
+        "_font_color",
+    )
+
     def __init__(
         self,
         segment_id: str,
@@ -22,16 +45,68 @@ class SegmentViewData:
     ):
         self.segment_id = segment_id
         self.text = text
-        self.rect = QRectF(rect[0], rect[1], rect[2], rect[3])
+        self.bounds = (rect[0], rect[1], rect[2], rect[3])  # (x, y, width, height)
         self.font_family = font_family
         self.font_size = font_size
-        self.font_color = QColor(font_color)
+        self.color_name = font_color
         self.is_bold = is_bold
         self.is_italic = is_italic
         self.is_highlighted = is_highlighted
         self.link_uri = link_uri
         self.block_id = block_id
         self.line_id = line_id
+        self._rect: Optional[QRectF] = None
+        self._font_color: Optional[QColor] = None
+
+    @property
+    def rect(self) -> QRectF:
+        if self._rect is None:
+            self._rect = QRectF(*self.bounds)
+        return self._rect
+
+    @property
+    def font_color(self) -> QColor:
+        if self._font_color is None:
+            self._font_color = QColor(self.color_name)
+        return self._font_color
+
+    def display_key(self) -> tuple:
+        """화면 표시에 영향을 주는 값. 같으면 이미 그려진 아이템을 그대로 재사용할 수 있습니다."""
+        return (
+            self.text,
+            self.bounds,
+            self.font_family,
+            self.font_size,
+            self.color_name,
+            self.is_bold,
+            self.is_italic,
+            self.is_highlighted,
+            self.link_uri,
+        )
+
+    def copy(self) -> "SegmentViewData":
+        """같은 값을 가진 새 세그먼트 (캐시된 세그먼트를 화면에 따로 내줄 때)"""
+        clone = SegmentViewData.__new__(SegmentViewData)
+        for name in SegmentViewData.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+    def translated_placeholder(self) -> "SegmentViewData":
+        """번역 전 번역 뷰에 보여 줄 세그먼트 (원문을 그대로 표시)"""
+        return SegmentViewData(
+            segment_id=self.segment_id.replace("orig_", "trans_"),
+            text=self.text,  # 초기에는 원본 텍스트로 채움
+            rect=self.bounds,
+            font_family=self.font_family,
+            font_size=self.font_size,
+            font_color=self.color_name,
+            is_bold=self.is_bold,
+            is_italic=self.is_italic,
+            is_highlighted=False,
+            link_uri=None,
+            block_id=self.block_id,
+            line_id=self.line_id,
+        )
 
 
 class HighlightUpdateInfo:
@@ -40,14 +115,48 @@ class HighlightUpdateInfo:
 
 
 class ImageViewData:
-    def __init__(self, xref: int, rect: QRectF):
+    __slots__ = (
+        "xref",
+        "bounds",
+        "pixel_width",
+        "pixel_height",
+        "colorspace",
+        "pixmap",
+        "_rect",
+    )
+
+    def __init__(
+        self,
+        xref: int,
+        rect,
+        pixel_width: int = 0,
+        pixel_height: int = 0,
+        colorspace: int = 0,
+    ):
         """
         지연 로딩을 위해 pixmap 대신 이미지의 xref를 저장합니다.
+        :param rect: (x, y, width, height) 튜플 또는 QRectF
+        :param pixel_width, pixel_height, colorspace: 파싱할 때 얻은 원본 이미지 정보
+            (0이면 알 수 없음). 지연 로더가 디코딩 방법을 고르는 데 사용합니다.
         """
         self.xref = xref
-        self.rect = rect
+        self.pixel_width = pixel_width
+        self.pixel_height = pixel_height
+        self.colorspace = colorspace
+        if isinstance(rect, QRectF):
+            self.bounds = rect.getRect()
+            self._rect: Optional[QRectF] = rect
+        else:
+            self.bounds = (rect[0], rect[1], rect[2], rect[3])
+            self._rect = None
         self.pixmap: Optional[QPixmap] = None  # 필요할 때 로드됩니다.
 
+    @property
+    def rect(self) -> QRectF:
+        if self._rect is None:
+            self._rect = QRectF(*self.bounds)
+        return self._rect
+
 
 class PageDisplayViewModel:
     def __init__(
@@ -56,14 +165,48 @@ class PageDisplayViewModel:
         page_width: float,
         page_height: float,
         original_segments_view: List[SegmentViewData],
-        translated_segments_view: List[SegmentViewData],
+        translated_segments_view: Optional[List[SegmentViewData]],
         image_views: List[ImageViewData],
         error_message: Optional[str] = None,
     ):
+        """
+        :param translated_segments_view: 번역 뷰에 표시할 세그먼트.
+            None이면 원문을 그대로 보여 주는 목록을 처음 필요할 때 만들어 사용하므로,
+            파싱 결과에 원문 세그먼트의 복사본을 미리 보관하지 않습니다.
+        """
         self.page_number = page_number
         self.page_width = page_width
         self.page_height = page_height
         self.original_segments_view = original_segments_view
-        self.translated_segments_view = translated_segments_view
+        self._translated_segments_view = translated_segments_view
         self.image_views = image_views
         self.error_message = error_message
+
+    @property
+    def translated_segments_view(self) -> List[SegmentViewData]:
+        if self._translated_segments_view is None:
+            # 한 번 만든 목록을 계속 써야 화면에서 바꾼 상태(하이라이트 등)가 유지됩니다.
+            self._translated_segments_view = [
+                seg.translated_placeholder() for seg in self.original_segments_view
+            ]
+        return self._translated_segments_view
+
+    @translated_segments_view.setter
+    def translated_segments_view(self, segments: Optional[List[SegmentViewData]]):
+        self._translated_segments_view = segments
+
+    def copy(self) -> "PageDisplayViewModel":
+        """
+        세그먼트까지 복사한 뷰모델. 화면에서 바꾼 상태(하이라이트, 번역 결과 교체)가
+        원본에 남지 않습니다. 이미지 정보는 불러온 이미지를 재사용하도록 공유합니다.
+        """
+        translated = self._translated_segments_view
+        return PageDisplayViewModel(
+            self.page_number,
+            self.page_width,
+            self.page_height,
+            [seg.copy() for seg in self.original_segments_view],
+            None if translated is None else [seg.copy() for seg in translated],
+            list(self.image_views),
+            self.error_message,
+        )
@@ -0,0 +1,40 @@
+from typing import NamedTuple
+
+import fitz
+
+from src.infrastructure.pdf_parsing.layout_extractor import worker_document
+
+
+class DecodedImage(NamedTuple):
+    """디코딩된 이미지의 픽셀 (프로세스 간 전달을 위해 Qt 객체를 포함하지 않음)"""
+
+    width: int
+    height: int
+    stride: int  # 한 줄의 바이트 수
+    format: str  # QImage.Format 이름에서 "Format_"을 뺀 부분 (RGB888, RGBA8888, ...)
+    samples: bytes
+
+
+def decode_image(doc, xref: int) -> DecodedImage:
+    """
+    문서의 이미지 xref를 Qt가 그대로 읽을 수 있는 8비트 회색조/RGB/RGBA 픽셀로 디코딩합니다.
+    CMYK 등 다른 색공간과 알파가 있는 회색조 이미지는 RGB로 변환합니다.
+    """
+    pixmap = fitz.Pixmap(doc, xref)
+    colors = pixmap.n - pixmap.alpha
+    if colors != 3 and (colors != 1 or pixmap.alpha):
+        pixmap = fitz.Pixmap(fitz.csRGB, pixmap)
+    if pixmap.alpha:
+        image_format = "RGBA8888"
+    elif pixmap.n == 1:
+        image_format = "Grayscale8"
+    else:
+        image_format = "RGB888"
+    return DecodedImage(
+        pixmap.width, pixmap.height, pixmap.stride, image_format, pixmap.samples
+    )
+
+
+def decode_image_in_worker(xref: int) -> DecodedImage:
+    """파싱 워커 프로세스가 열어 둔 문서의 이미지를 디코딩합니다."""
+    return decode_image(worker_document(), xref)
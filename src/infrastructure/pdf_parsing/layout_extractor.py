@@ -0,0 +1,125 @@
+from typing import List, Optional
+
+import fitz
+
+from src.common.spatial_index import GridSpatialIndex
+from src.core.entities.page_layout import ImageRecord, LineRecord, PageLayout
+
+
+def _link_uri(link) -> Optional[str]:
+    kind = link.get("kind")
+    if kind == fitz.LINK_GOTO:
+        # 내부 페이지 이동 링크
+        return f"page:{link.get('page', -1)}"
+    if kind == fitz.LINK_URI:
+        # 외부 URL 링크
+        return link.get("uri")
+    if kind == fitz.LINK_LAUNCH:
+        # 파일 실행 링크 (보안상 주의 필요)
+        return f"file:{link.get('file')}"
+    if kind == fitz.LINK_NAMED:
+        # 명명된 목적지 링크
+        return f"name:{link.get('name')}"
+    # fitz.LINK_REMOTE 등 다른 종류의 링크도 필요에 따라 추가할 수 있습니다.
+    return None
+
+
+def extract_page_layout(page, page_number: int) -> PageLayout:
+    """
+    PDF 페이지에서 텍스트 줄, 이미지 위치, 링크를 추출합니다.
+    Qt에 의존하지 않으므로 워커 프로세스에서도 실행할 수 있습니다.
+    """
+    # 1. 링크 정보 미리 처리 (성능 최적화 및 가독성 향상)
+    # 링크 영역으로 공간 인덱스를 한 번 만들어, 줄마다 주변 격자 칸의 링크만 검사합니다.
+    # (링크가 많은 색인/참고문헌 페이지에서 줄 수 × 링크 수 비교를 피합니다)
+    link_index = GridSpatialIndex()
+    for link in page.get_links():
+        uri = _link_uri(link)
+        if uri:
+            link_index.insert(tuple(fitz.Rect(link["from"])), uri)
+
+    # 이미지 추출 (지연 로딩: 실제 이미지 데이터 대신 xref와 배치 정보만 저장)
+    # 페이지 콘텐츠를 한 번만 해석하여 모든 이미지의 위치/크기/색공간을 얻습니다.
+    # (이미지마다 get_image_bbox를 부르면 그때마다 페이지 전체를 다시 해석하므로
+    #  작은 이미지가 많은 카탈로그 페이지에서 매우 느립니다)
+    images: List[ImageRecord] = []
+    for info in page.get_image_info(xrefs=True):
+        xref = info.get("xref", 0)
+        if xref <= 0:
+            continue  # 인라인 이미지는 xref가 없어 따로 불러올 수 없습니다.
+        img_rect = fitz.Rect(info["bbox"])
+        if img_rect.is_valid and not img_rect.is_empty:
+            images.append(
+                ImageRecord(
+                    xref,
+                    tuple(img_rect),
+                    info.get("width", 0),
+                    info.get("height", 0),
+                    info.get("colorspace", 0),
+                )
+            )
+
+    # 텍스트 줄 추출 (UI 상호작용을 위해 줄(line) 단위로 분리)
+    lines: List[LineRecord] = []
+    # `get_text("dict")`는 텍스트 블록에 대한 상세 정보를 제공합니다.
+    for block in page.get_text("dict")["blocks"]:
+        if block["type"] != 0:  # 0은 텍스트 블록을 의미
+            continue
+
+        block_id = f"block_{page_number}_{block['number']}"
+        for line_idx, line in enumerate(block["lines"]):
+            line_spans = line.get("spans", [])
+            if not line_spans:
+                continue
+
+            # 줄(line) 내의 모든 스팬(span)을 병합하여 하나의 텍스트로 만듭니다.
+            line_text = " ".join(span["text"] for span in line_spans)
+            if not line_text.strip():
+                continue
+
+            # 줄의 경계 상자(bounding box)를 계산합니다.
+            line_bbox = fitz.Rect()
+            for span in line_spans:
+                line_bbox.include_rect(fitz.Rect(span["bbox"]))
+
+            # 줄과 겹치는 링크 중 문서에서 가장 먼저 나오는 링크를 사용합니다.
+            line_link_uri = link_index.first(tuple(line_bbox))
+
+            # 폰트 정보는 첫 번째 스팬의 것을 대표로 사용합니다.
+            first_span = line_spans[0]
+            font = first_span.get("font", "Arial")
+            lines.append(
+                LineRecord(
+                    line_id=f"line_{page_number}_{block['number']}_{line_idx}",
+                    block_id=block_id,
+                    text=line_text,
+                    bbox=tuple(line_bbox),
+                    font_family=font,
+                    font_size=first_span["size"],
+                    is_bold="bold" in font.lower(),
+                    is_italic="italic" in font.lower(),
+                    link_uri=line_link_uri,
+                )
+            )
+
+    page_rect = page.rect
+    return PageLayout(page_number, page_rect.width, page_rect.height, lines, images)
+
+
+# --- 파싱 워커 프로세스 ---
+# 각 워커는 시작할 때 문서를 한 번 열어 두고 페이지 번호만 받아 파싱합니다.
+_worker_doc = None
+
+
+def init_parse_worker(pdf_path: str):
+    global _worker_doc
+    _worker_doc = fitz.open(pdf_path)
+
+
+def worker_document():
+    """init_parse_worker로 연 워커 프로세스의 문서"""
+    return _worker_doc
+
+
+def extract_page_layout_in_worker(page_number: int) -> PageLayout:
+    return extract_page_layout(_worker_doc[page_number], page_number)
@@ -0,0 +1,29 @@
+from typing import NamedTuple, Sequence
+
+import fitz
+
+from src.infrastructure.pdf_parsing.layout_extractor import worker_document
+
+
+class RenderedTile(NamedTuple):
+    """렌더링된 페이지 타일의 RGB888 픽셀 (프로세스 간 전달을 위해 Qt 객체를 포함하지 않음)"""
+
+    width: int
+    height: int
+    stride: int  # 한 줄의 바이트 수
+    samples: bytes
+
+
+def render_page_tile(page, zoom: float, clip: Sequence[float]) -> RenderedTile:
+    """페이지의 clip 영역 (x0, y0, x1, y1)을 zoom 배율의 RGB 이미지로 렌더링합니다."""
+    pixmap = page.get_pixmap(
+        matrix=fitz.Matrix(zoom, zoom), clip=fitz.Rect(clip), alpha=False
+    )
+    return RenderedTile(pixmap.width, pixmap.height, pixmap.stride, pixmap.samples)
+
+
+def render_page_tile_in_worker(
+    page_number: int, zoom: float, clip: Sequence[float]
+) -> RenderedTile:
+    """파싱 워커 프로세스가 열어 둔 문서의 페이지 타일을 렌더링합니다."""
+    return render_page_tile(worker_document()[page_number], zoom, clip)
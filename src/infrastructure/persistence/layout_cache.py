@@ -0,0 +1,307 @@
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Iterable, Optional
+
+import fitz
+
+from src.common.utils import user_cache_dir
+from src.core.entities.page_layout import ImageRecord, LineRecord, PageLayout
+
+DEFAULT_LAYOUT_CACHE_DIR = os.path.join(user_cache_dir(), "layout_cache")
+# 캐시 디렉터리 전체의 최대 크기. 넘으면 오래 쓰지 않은 문서의 캐시부터 지웁니다.
+DEFAULT_LAYOUT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# 다시 쓴 항목의 이전 데이터가 이보다 크고 살아 있는 데이터보다 많으면 다시 열 때 압축합니다.
+_COMPACT_MIN_DEAD_BYTES = 1024 * 1024
+# 이보다 오래된 임시 파일은 중간에 종료되어 남은 것으로 보고 지웁니다.
+_STALE_TMP_SECONDS = 24 * 60 * 60
+
+# 파일 구조
+#   헤더:       MAGIC(4) | 형식 버전(u16) | 페이지 수(u32) | PyMuPDF 버전(32바이트, 0 채움)
+#   오프셋 표:  페이지마다 (데이터 위치 u64, 데이터 길이 u32). 위치가 0이면 아직 없음
+#   데이터:     페이지별 zlib(marshal(페이지 구조)). 파싱되는 대로 파일 끝에 덧붙입니다.
+_MAGIC = b"PDLC"
+_FORMAT_VERSION = 2
+_HEADER = struct.Struct("<4sHI32s")
+_ENTRY = struct.Struct("<QI")
+
+
+def _pymupdf_version() -> str:
+    return getattr(fitz, "VersionBind", None) or getattr(fitz, "__version__", "")
+
+
+def file_content_hash(path: str) -> str:
+    """파일 내용의 SHA-256 해시. 경로나 수정 시각이 바뀌어도 같은 문서를 알아봅니다."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def file_stat_key(path: str) -> str:
+    """
+    경로, 크기, 수정 시각으로 만든 키. 파일을 읽지 않으므로 바로 계산되며,
+    내용 해시를 이미 계산해 둔 파일을 다시 열 때 해시를 다시 계산하지 않도록 씁니다.
+    """
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}\0{stat.st_size}\0{stat.st_mtime_ns}"
+    return hashlib.sha256(key.encode("utf-8", "surrogateescape")).hexdigest()
+
+
+def prune_layout_cache(
+    cache_dir: str,
+    max_bytes: int = DEFAULT_LAYOUT_CACHE_MAX_BYTES,
+    keep: Iterable[str] = (),
+) -> None:
+    """
+    캐시 디렉터리의 크기를 max_bytes 이하로 줄입니다. 마지막으로 연 시각(수정 시각)이
+    오래된 캐시 파일부터 지우며, keep에 있는 파일(지금 쓰는 캐시)은 남깁니다.
+    지운 캐시를 가리키는 키 파일과 남아 있는 오래된 임시 파일도 지웁니다.
+    PyMuPDF나 형식 버전이 바뀌어 다시 열리지 않는 캐시도 이렇게 정리됩니다.
+    """
+    keep = {os.path.abspath(path) for path in keep}
+    layouts = []
+    key_paths = []
+    now = time.time()
+    try:
+        entries = list(os.scandir(cache_dir))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            stat = entry.stat()
+            if entry.name.endswith(".tmp"):
+                if now - stat.st_mtime > _STALE_TMP_SECONDS:
+                    os.remove(entry.path)
+            elif entry.name.endswith(".layout"):
+                layouts.append((stat.st_mtime, stat.st_size, entry.path))
+            elif entry.name.endswith(".key"):
+                key_paths.append(entry.path)
+        except OSError:
+            continue  # 다른 프로세스가 지웠거나 쓰는 중인 파일
+
+    total = sum(size for _, size, _ in layouts)
+    for _, size, path in sorted(layouts):
+        if total <= max_bytes:
+            break
+        if os.path.abspath(path) in keep:
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            continue  # 다른 프로세스가 열어 둔 파일 (Windows)
+        total -= size
+
+    for key_path in key_paths:
+        try:
+            with open(key_path, "r", encoding="ascii") as f:
+                content_hash = f.read().strip()
+            if not os.path.exists(os.path.join(cache_dir, f"{content_hash}.layout")):
+                os.remove(key_path)
+        except (OSError, ValueError):
+            continue
+
+
+def _encode_layout(layout: PageLayout) -> bytes:
+    # marshal은 기본 자료형만 지원하므로 NamedTuple을 일반 튜플로 바꿔 저장합니다.
+    payload = (
+        layout.page_number,
+        layout.width,
+        layout.height,
+        [tuple(line) for line in layout.lines],
+        [tuple(image) for image in layout.images],
+    )
+    return zlib.compress(marshal.dumps(payload), 1)
+
+
+def _decode_layout(data: bytes) -> PageLayout:
+    page_number, width, height, lines, images = marshal.loads(zlib.decompress(data))
+    return PageLayout(
+        page_number,
+        width,
+        height,
+        [LineRecord(*line) for line in lines],
+        [ImageRecord(*image) for image in images],
+    )
+
+
+class LayoutCache:
+    """
+    문서 하나의 페이지 파싱 결과를 담는 디스크 캐시 파일(사이드카).
+    파일 이름은 문서 내용 해시이며, PyMuPDF 버전이나 형식 버전이 다르면 새로 만듭니다.
+    내용 해시를 계산하면 (경로, 크기, 수정 시각) 키 → 내용 해시를 작은 파일로 남겨,
+    같은 파일을 다시 열 때는 find_for_document가 파일을 읽지 않고 바로 캐시를 찾습니다.
+    읽기는 메모리 매핑으로 필요한 페이지의 데이터만 풀어 내므로, 큰 문서를 다시 열고
+    아무 페이지로 이동해도 이미 파싱했던 페이지는 파싱 없이 바로 표시할 수 있습니다.
+    열 때마다 파일의 수정 시각을 갱신하므로, prune_layout_cache는 오래 열지 않은 문서의
+    캐시부터 지웁니다.
+    """
+
+    def __init__(self, path: str, page_count: int):
+        self.path = path
+        self.page_count = page_count
+        self._lock = threading.Lock()
+        self._mmap: Optional[mmap.mmap] = None
+        self._table_offset = _HEADER.size
+        self._data_offset = _HEADER.size + _ENTRY.size * page_count
+        if not self._has_valid_header():
+            self._create()
+        else:
+            self._compact_if_sparse()
+            os.utime(path)
+        self._file = open(path, "r+b")
+
+    @classmethod
+    def find_for_document(
+        cls, pdf_path: str, page_count: int, cache_dir: str = DEFAULT_LAYOUT_CACHE_DIR
+    ) -> Optional["LayoutCache"]:
+        """
+        내용 해시를 계산해 둔 파일(경로, 크기, 수정 시각이 같은)이면 그 캐시를 엽니다.
+        처음 보는 파일이면 해시를 계산하지 않고 None을 반환합니다.
+        """
+        key_path = os.path.join(cache_dir, f"{file_stat_key(pdf_path)}.key")
+        try:
+            with open(key_path, "r", encoding="ascii") as f:
+                content_hash = f.read().strip()
+        except (OSError, ValueError):
+            return None
+        if len(content_hash) != 64:
+            return None
+        return cls(os.path.join(cache_dir, f"{content_hash}.layout"), page_count)
+
+    @classmethod
+    def for_document(
+        cls, pdf_path: str, page_count: int, cache_dir: str = DEFAULT_LAYOUT_CACHE_DIR
+    ) -> "LayoutCache":
+        """
+        문서 내용 해시로 캐시를 엽니다. 큰 문서는 해시 계산에 시간이 걸리므로
+        UI 스레드 밖에서 호출해야 합니다.
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        stat_key = file_stat_key(pdf_path)
+        content_hash = file_content_hash(pdf_path)
+        # 해시를 계산하는 동안 파일이 바뀌었다면 키를 남기지 않습니다.
+        if file_stat_key(pdf_path) == stat_key:
+            key_path = os.path.join(cache_dir, f"{stat_key}.key")
+            tmp_path = f"{key_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="ascii") as f:
+                f.write(content_hash)
+            os.replace(tmp_path, key_path)
+        return cls(os.path.join(cache_dir, f"{content_hash}.layout"), page_count)
+
+    def _expected_header(self) -> bytes:
+        version = _pymupdf_version().encode("ascii", "replace")[:32]
+        return _HEADER.pack(_MAGIC, _FORMAT_VERSION, self.page_count, version)
+
+    def _has_valid_header(self) -> bool:
+        try:
+            with open(self.path, "rb") as f:
+                header = f.read(_HEADER.size)
+                if header != self._expected_header():
+                    return False
+                f.seek(0, os.SEEK_END)
+                return f.tell() >= self._data_offset
+        except OSError:
+            return False
+
+    def _create(self):
+        # 빈 오프셋 표까지 한 번에 써 두고, 임시 파일을 바꿔치기하여 반쯤 쓴 파일을 막습니다.
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self._expected_header())
+            f.write(b"\0" * (_ENTRY.size * self.page_count))
+        os.replace(tmp_path, self.path)
+
+    def _compact_if_sparse(self):
+        """
+        put은 항상 파일 끝에 덧붙이므로, 다시 쓴 항목의 이전 데이터는 파일에 남습니다.
+        그런 데이터가 많으면 오프셋 표가 가리키는 데이터만 모아 파일을 새로 씁니다.
+        """
+        with open(self.path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(self._table_offset)
+            table = f.read(self._data_offset - self._table_offset)
+            entries = [
+                _ENTRY.unpack_from(table, _ENTRY.size * page)
+                for page in range(self.page_count)
+            ]
+            live = [
+                (page, offset, length)
+                for page, (offset, length) in enumerate(entries)
+                if offset and offset + length <= size
+            ]
+            live_bytes = sum(length for _, _, length in live)
+            dead_bytes = size - self._data_offset - live_bytes
+            if dead_bytes < max(_COMPACT_MIN_DEAD_BYTES, live_bytes):
+                return
+            new_table = bytearray(len(table))
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as out:
+                out.write(self._expected_header())
+                out.write(new_table)
+                position = self._data_offset
+                for page, offset, length in live:
+                    f.seek(offset)
+                    out.write(f.read(length))
+                    _ENTRY.pack_into(new_table, _ENTRY.size * page, position, length)
+                    position += length
+                out.seek(self._table_offset)
+                out.write(new_table)
+        os.replace(tmp_path, self.path)
+
+    def _mapped(self) -> mmap.mmap:
+        size = os.fstat(self._file.fileno()).st_size
+        if self._mmap is None or len(self._mmap) != size:
+            # 파일 끝에 데이터가 추가되었다면 다시 매핑합니다.
+            if self._mmap is not None:
+                self._mmap.close()
+            self._mmap = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def get(self, page_number: int) -> Optional[PageLayout]:
+        if not 0 <= page_number < self.page_count:
+            return None
+        with self._lock:
+            if self._file.closed:
+                return None
+            mapped = self._mapped()
+            offset, length = _ENTRY.unpack_from(
+                mapped, self._table_offset + _ENTRY.size * page_number
+            )
+            if offset == 0 or offset + length > len(mapped):
+                return None
+            data = mapped[offset : offset + length]
+        try:
+            return _decode_layout(data)
+        except (ValueError, TypeError, EOFError, zlib.error):
+            return None  # 손상된 항목은 없는 것으로 보고 다시 파싱합니다.
+
+    def put(self, layout: PageLayout) -> None:
+        page_number = layout.page_number
+        if not 0 <= page_number < self.page_count:
+            return
+        data = _encode_layout(layout)
+        with self._lock:
+            if self._file.closed:
+                return
+            # 데이터를 먼저 쓰고 오프셋 표를 나중에 갱신하여, 중간에 종료되어도
+            # 표가 가리키는 데이터는 항상 완전하도록 합니다.
+            self._file.seek(0, os.SEEK_END)
+            offset = max(self._file.tell(), self._data_offset)
+            self._file.seek(offset)
+            self._file.write(data)
+            self._file.flush()
+            self._file.seek(self._table_offset + _ENTRY.size * page_number)
+            self._file.write(_ENTRY.pack(offset, len(data)))
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            self._file.close()
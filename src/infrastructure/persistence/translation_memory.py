@@ -0,0 +1,188 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from src.common.utils import user_cache_dir
+
+TRANSLATION_MEMORY_FILENAME = "translation_memory.db"
+DEFAULT_MAX_ENTRIES = 200_000
+
+
+def default_translation_memory_path() -> str:
+    """GUI와 CLI가 함께 쓰는 번역 메모리 파일 경로 (사용자 캐시 디렉터리 아래)"""
+    return os.path.join(user_cache_dir(), TRANSLATION_MEMORY_FILENAME)
+
+
+def normalize_source_text(text: str) -> str:
+    """
+    캐시 키 생성을 위해 원문을 정규화합니다.
+    줄 단위 공백 차이(들여쓰기, 연속 공백)는 번역 결과에 영향을 주지 않으므로 무시하고,
+    문단 구조를 유지하기 위해 줄바꿈은 보존합니다.
+    """
+    lines = (" ".join(line.split()) for line in text.strip().splitlines())
+    return "\n".join(lines)
+
+
+class SqliteTranslationMemory:
+    """
+    SQLite 기반의 디스크 번역 메모리(Translation Memory).
+    (정규화된 원문, 원본 언어, 번역 언어)를 키로 번역 결과를 저장하며,
+    저장 항목 수가 max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다(LRU).
+    조회할 때마다 디스크에 쓰지 않도록, 조회한 항목의 사용 시각은 모아 두었다가
+    다음 저장(put_many)이나 close에서 함께 기록합니다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        if path is None:
+            path = default_translation_memory_path()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # 아직 기록하지 않은 조회 시각 {키: last_used}
+        self._pending_touches: Dict[str, float] = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translation_memory (
+                key TEXT PRIMARY KEY,
+                source_lang TEXT NOT NULL,
+                target_lang TEXT NOT NULL,
+                source_text TEXT NOT NULL,
+                translated_text TEXT NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_translation_memory_last_used "
+            "ON translation_memory (last_used)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(text: str, source_lang: str, target_lang: str) -> str:
+        normalized = normalize_source_text(text)
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return f"{source_lang}:{target_lang}:{digest}"
+
+    def get_many(
+        self, texts: Iterable[str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """
+        여러 원문에 대한 번역 결과를 한 번에 조회합니다.
+        :return: {원문: 번역문} 형태의 딕셔너리 (캐시에 있는 항목만 포함)
+        """
+        keys_by_text = {
+            text: self.make_key(text, source_lang, target_lang) for text in texts
+        }
+        if not keys_by_text:
+            return {}
+        unique_keys = list(set(keys_by_text.values()))
+        found: Dict[str, str] = {}
+        with self._lock:
+            # SQLite의 바인딩 변수 개수 제한을 넘지 않도록 나누어 조회합니다.
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT key, translated_text FROM translation_memory "
+                    f"WHERE key IN ({placeholders})",  # nosec B608
+                    chunk,
+                ).fetchall()
+                found.update(rows)
+            now = time.time()
+            for key in found:
+                self._pending_touches[key] = now
+        return {text: found[key] for text, key in keys_by_text.items() if key in found}
+
+    def get(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        return self.get_many([text], source_lang, target_lang).get(text)
+
+    def put_many(
+        self, translations: Dict[str, str], source_lang: str, target_lang: str
+    ) -> None:
+        """
+        {원문: 번역문} 딕셔너리를 저장합니다. 비어 있는 번역 결과는 저장하지 않습니다.
+        """
+        now = time.time()
+        rows = [
+            (
+                self.make_key(text, source_lang, target_lang),
+                source_lang,
+                target_lang,
+                normalize_source_text(text),
+                translated,
+                now,
+            )
+            for text, translated in translations.items()
+            if translated
+        ]
+        if not rows:
+            return
+        with self._lock:
+            # 제거할 항목을 고르기 전에 모아 둔 사용 시각을 반영합니다.
+            self._flush_touches()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translation_memory "
+                "(key, source_lang, target_lang, source_text, translated_text, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._evict_if_needed()
+            self._conn.commit()
+
+    def put(
+        self, text: str, translated: str, source_lang: str, target_lang: str
+    ) -> None:
+        self.put_many({text: translated}, source_lang, target_lang)
+
+    def _flush_touches(self):
+        if not self._pending_touches:
+            return
+        self._conn.executemany(
+            "UPDATE translation_memory SET last_used = ? WHERE key = ?",
+            [(last_used, key) for key, last_used in self._pending_touches.items()],
+        )
+        self._pending_touches.clear()
+
+    def _evict_if_needed(self):
+        (count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM translation_memory"
+        ).fetchone()
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM translation_memory WHERE key IN ("
+            "SELECT key FROM translation_memory ORDER BY last_used ASC LIMIT ?)",
+            (overflow,),
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM translation_memory"
+            ).fetchone()
+        return count
+
+    def clear(self):
+        with self._lock:
+            self._pending_touches.clear()
+            self._conn.execute("DELETE FROM translation_memory")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,198 @@
+import asyncio
+import itertools
+import time
+from typing import Dict, List, Optional
+
+from src.common.translation_priority import (
+    PRIORITY_VISIBLE,
+    PriorityToken,
+    current_priority_token,
+)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD(Additive Increase / Multiplicative Decrease) 방식의 동시 요청 제한기.
+    - 요청이 성공하고 지연 시간이 기준치 이내이면 한도를 조금씩 늘립니다
+      (한도만큼의 요청이 성공할 때마다 약 1씩 증가).
+    - 오류(429, 빈 응답, 네트워크 오류 등)가 발생하면 한도를 곱셈적으로 줄입니다.
+      같은 혼잡 상황에서 동시에 실패한 요청들로 한도가 연쇄적으로 줄지 않도록,
+      감소는 최근 지연 시간 동안 한 번만 적용합니다.
+    게이트웨이 하나에 하나의 제한기를 두어 현재 페이지 번역과 프리페치가 함께 사용합니다.
+
+    대기 중인 요청은 우선순위(translation_priority 참고) 순서로, 같은 우선순위 안에서는
+    도착 순서대로 슬롯을 받습니다. 또한 보이는 페이지의 요청이 백그라운드 요청 뒤에서
+    기다리지 않도록 reserved_slots 개의 슬롯은 보이는 페이지 요청만 사용할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        reserved_slots: int = 1,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.reserved_slots = reserved_slots
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._waiters: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._min_latency: Optional[float] = None
+        self._last_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self.successes = 0
+        self.failures = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.future.done())
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "successes": self.successes,
+            "failures": self.failures,
+            "last_latency": self._last_latency or 0.0,
+        }
+
+    def set_max_limit(self, max_limit: int):
+        self.max_limit = max(self.min_limit, max_limit)
+        self._limit = min(self._limit, float(self.max_limit))
+        self._wake_waiters()
+
+    def capacity_for(self, priority: int) -> int:
+        """해당 우선순위의 요청이 사용할 수 있는 최대 동시 요청 수"""
+        if priority <= PRIORITY_VISIBLE:
+            return self.limit
+        return max(1, self.limit - self.reserved_slots)
+
+    async def acquire(self, token: Optional[PriorityToken] = None):
+        """
+        슬롯을 하나 얻을 때까지 기다립니다.
+        :param token: 요청의 우선순위. 없으면 현재 컨텍스트의 우선순위를 사용합니다.
+        """
+        if token is None:
+            token = current_priority_token()
+        waiter = _Waiter(
+            token, next(self._sequence), asyncio.get_running_loop().create_future()
+        )
+        self._waiters.append(waiter)
+        # 대기 중에 우선순위가 바뀌면 대기열을 다시 확인합니다.
+        token.add_listener(self._wake_waiters)
+        try:
+            self._wake_waiters()
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # 슬롯을 넘겨받은 직후 취소되었다면 슬롯을 반납합니다.
+                self.abandon()
+            raise
+        finally:
+            token.remove_listener(self._wake_waiters)
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+    def release(self, success: bool, latency: Optional[float] = None):
+        self._in_flight -= 1
+        if success:
+            self._on_success(latency)
+        else:
+            self._on_failure()
+        self._wake_waiters()
+
+    def abandon(self):
+        """취소된 요청의 슬롯을 한도 조정 없이 반납합니다."""
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def slot(self) -> "_LimiterSlot":
+        """
+        ``async with limiter.slot() as slot:`` 형태로 사용합니다.
+        블록 안에서 예외가 발생하거나 slot.mark_failure()를 호출하면 실패로 기록됩니다.
+        """
+        return _LimiterSlot(self)
+
+    def _on_success(self, latency: Optional[float]):
+        self.successes += 1
+        if latency is not None:
+            self._last_latency = latency
+            if self._min_latency is None or latency < self._min_latency:
+                self._min_latency = latency
+            # 지연 시간이 기준치보다 크게 늘었다면 혼잡의 신호로 보고 한도를 유지합니다.
+            if latency > self._min_latency * self.latency_tolerance:
+                return
+        self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+    def _on_failure(self):
+        self.failures += 1
+        now = time.monotonic()
+        if now - self._last_decrease < (self._last_latency or 0.0):
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+
+    def _wake_waiters(self):
+        while True:
+            self._waiters = [w for w in self._waiters if not w.future.done()]
+            if not self._waiters:
+                return
+            # 대기열이 길지 않으므로 매번 우선순위가 가장 높은 요청을 찾습니다.
+            # (우선순위는 대기 중에도 바뀔 수 있습니다)
+            waiter = min(self._waiters, key=_Waiter.sort_key)
+            if self._in_flight >= self.capacity_for(waiter.token.value):
+                return
+            self._waiters.remove(waiter)
+            self._in_flight += 1
+            waiter.future.set_result(None)
+
+
+class _Waiter:
+    __slots__ = ("token", "sequence", "future")
+
+    def __init__(self, token: PriorityToken, sequence: int, future: asyncio.Future):
+        self.token = token
+        self.sequence = sequence
+        self.future = future
+
+    def sort_key(self):
+        return (self.token.value, self.sequence)
+
+
+class _LimiterSlot:
+    def __init__(self, limiter: AdaptiveConcurrencyLimiter):
+        self._limiter = limiter
+        self._failed = False
+        self._started = 0.0
+
+    def mark_failure(self):
+        self._failed = True
+
+    async def __aenter__(self) -> "_LimiterSlot":
+        await self._limiter.acquire()
+        self._started = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        success = exc_type is None and not self._failed
+        if exc_type is asyncio.CancelledError:
+            # 취소는 서버 상태와 무관하므로 한도를 조정하지 않습니다.
+            self._limiter.abandon()
+        else:
+            self._limiter.release(success, time.monotonic() - self._started)
+        return False
@@ -1,28 +1,289 @@
-import aiohttp
 import asyncio
-from typing import Optional
+import contextlib
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+from .concurrency import AdaptiveConcurrencyLimiter
+from .resilience import CircuitBreaker, RetryPolicy, is_retryable_status
+from .request_packing import (
+    DEFAULT_MAX_ENCODED_LENGTH,
+    join_batch,
+    pack_batches,
+    split_batch,
+)
 
 GOOGLE_TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
 
-async def google_translate(text: str, source: str = "auto", target: str = "ko") -> Optional[str]:
-    """
-    Translate text using Google Translate (unofficial, GET method).
-    Returns translated text or None on error.
-    """
-    params = {
+DEFAULT_LIMIT_PER_HOST = 8
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0  # 초
+DEFAULT_DNS_CACHE_TTL = 300  # 초
+DEFAULT_REQUEST_TIMEOUT = 15.0  # 초
+
+
+def _parse_translation(data) -> Optional[str]:
+    # data[0] is a list of [translatedText, originalText, ...]
+    try:
+        return "".join([item[0] for item in data[0] if item[0]])
+    except Exception:
+        return None
+
+
+def _build_params(text: str, source: str, target: str) -> dict:
+    return {
         "client": "gtx",
         "sl": source,
         "tl": target,
         "dt": "t",
         "q": text,
     }
-    async with aiohttp.ClientSession() as session:
-        async with session.get(GOOGLE_TRANSLATE_URL, params=params) as resp:
-            if resp.status != 200:
+
+
+async def _fetch_translation(
+    session: aiohttp.ClientSession, text: str, source: str, target: str, url: str
+) -> Tuple[int, Optional[str]]:
+    """HTTP 상태 코드와 번역 결과(파싱 실패 시 None)를 함께 반환합니다."""
+    async with session.get(url, params=_build_params(text, source, target)) as resp:
+        if resp.status != 200:
+            return resp.status, None
+        data = await resp.json(content_type=None)
+        return resp.status, _parse_translation(data)
+
+
+async def google_translate(
+    text: str,
+    source: str = "auto",
+    target: str = "ko",
+    session: Optional[aiohttp.ClientSession] = None,
+    url: str = GOOGLE_TRANSLATE_URL,
+) -> Optional[str]:
+    """
+    Translate text using Google Translate (unofficial, GET method).
+    Returns translated text or None on error.
+    session을 전달하면 해당 세션(커넥션 풀)을 재사용하고, 없으면 일회용 세션을 만듭니다.
+    """
+    if session is None:
+        async with aiohttp.ClientSession() as own_session:
+            return await google_translate(text, source, target, own_session, url)
+    _, translated = await _fetch_translation(session, text, source, target, url)
+    return translated
+
+
+class GoogleTranslateClient:
+    """
+    keep-alive 커넥션 풀을 가진 aiohttp 세션을 소유하는 장수명(long-lived) 클라이언트.
+    블록마다 세션(커넥터, TLS 핸드셰이크)을 새로 만들지 않고 하나의 풀을 재사용합니다.
+    세션은 이벤트 루프 안에서 처음 요청할 때 생성되며, close()로 정리해야 합니다.
+    모든 요청은 클라이언트가 소유한 AdaptiveConcurrencyLimiter를 거쳐 동시 요청 수가 조절됩니다.
+    일시적인 실패는 RetryPolicy에 따라 재시도하고, 서버가 계속 실패하면 CircuitBreaker가
+    요청을 즉시 실패(None)시켜 불필요한 요청을 막습니다.
+    """
+
+    def __init__(
+        self,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        url: str = GOOGLE_TRANSLATE_URL,
+        max_encoded_length: int = DEFAULT_MAX_ENCODED_LENGTH,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.request_timeout = request_timeout
+        self.url = url
+        self.max_encoded_length = max_encoded_length
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=min(4, limit_per_host), max_limit=limit_per_host
+        )
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_lock: Optional[asyncio.Lock] = None
+        # 세션별 진행 중인 translate 수. 설정이 바뀌어 교체된 세션은 0이 되면 닫습니다.
+        self._session_users: Dict[aiohttp.ClientSession, int] = {}
+
+    def set_limit_per_host(self, limit_per_host: int):
+        """호스트당 연결 수를 바꾸고, 동시 요청 한도의 상한도 함께 맞춥니다."""
+        self.limit_per_host = max(1, int(limit_per_host))
+        self.limiter.set_max_limit(self.limit_per_host)
+
+    def stats(self) -> Dict[str, float]:
+        return self.limiter.stats()
+
+    @property
+    def is_open(self) -> bool:
+        return self._session is not None and not self._session.closed
+
+    def _session_matches_config(self) -> bool:
+        return (
+            self.is_open
+            and self._session.connector.limit_per_host == self.limit_per_host
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session_matches_config():
+            return self._session
+        if self._session_lock is None:
+            self._session_lock = asyncio.Lock()
+        async with self._session_lock:
+            if not self._session_matches_config():
+                # 설정(호스트당 연결 수)이 바뀌었으면 새 풀로 바꿉니다. 기존 풀은
+                # 그 풀로 진행 중인 요청이 모두 끝난 뒤에 닫습니다.
+                old_session = self._session
+                connector = aiohttp.TCPConnector(
+                    limit_per_host=self.limit_per_host,
+                    keepalive_timeout=self.keepalive_timeout,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    use_dns_cache=True,
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+                )
+                if old_session is not None and not self._session_users.get(old_session):
+                    await old_session.close()
+        return self._session
+
+    @contextlib.asynccontextmanager
+    async def _use_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """요청하는 동안 세션이 교체되어도 닫히지 않도록 사용 중으로 표시합니다."""
+        session = await self._get_session()
+        self._session_users[session] = self._session_users.get(session, 0) + 1
+        try:
+            yield session
+        finally:
+            # close()가 먼저 정리했을 수도 있습니다.
+            remaining = self._session_users.pop(session, 0) - 1
+            if remaining > 0:
+                self._session_users[session] = remaining
+            elif session is not self._session and not session.closed:
+                await session.close()
+
+    async def translate(
+        self, text: str, source: str = "auto", target: str = "ko"
+    ) -> Optional[str]:
+        """
+        텍스트를 번역합니다. 재시도 후에도 실패하거나 회로가 열려 있으면 None을 반환합니다.
+        """
+        async with self._use_session() as session:
+            return await self._translate_with(session, text, source, target)
+
+    async def _translate_with(
+        self, session: aiohttp.ClientSession, text: str, source: str, target: str
+    ) -> Optional[str]:
+        for attempt in range(self.retry_policy.max_attempts):
+            if not self.circuit_breaker.allow_request():
                 return None
-            data = await resp.json()
-            # data[0] is a list of [translatedText, originalText, ...]
+            # 어떤 경로로 나가든 회로 차단기에 결과를 알려야 반열림 상태의 시험 요청이
+            # 끝난 것으로 처리됩니다. (None이면 취소 또는 예상하지 못한 예외)
+            server_ok = None
             try:
-                return "".join([item[0] for item in data[0] if item[0]])
-            except Exception:
-                return None
+                status, translated = await self._request_once(
+                    session, text, source, target
+                )
+                if translated is not None:
+                    server_ok = True
+                    return translated
+                if status != 200 and not is_retryable_status(status):
+                    # 요청 자체의 문제(400, 414 등)는 재시도해도 같으므로 바로 포기합니다.
+                    # 서버는 응답했으므로 장애로 세지 않습니다.
+                    server_ok = True
+                    return None
+                # 네트워크 오류, 429/5xx, 빈 응답은 일시적 장애로 보고 재시도합니다.
+                server_ok = False
+            finally:
+                if server_ok is None:
+                    self.circuit_breaker.record_cancelled()
+                elif server_ok:
+                    self.circuit_breaker.record_success()
+                else:
+                    self.circuit_breaker.record_failure()
+            if attempt + 1 < self.retry_policy.max_attempts:
+                await asyncio.sleep(self.retry_policy.delay(attempt))
+        return None
+
+    async def _request_once(
+        self, session: aiohttp.ClientSession, text: str, source: str, target: str
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """
+        동시 요청 제한기를 거쳐 한 번 요청합니다.
+        네트워크 오류와 JSON이 아닌 응답은 상태 코드 None으로 반환합니다.
+        """
+        async with self.limiter.slot() as slot:
+            try:
+                status, translated = await _fetch_translation(
+                    session, text, source, target, self.url
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                slot.mark_failure()
+                return None, None
+            if status != 200 or translated is None:
+                # 429(요청 과다), 5xx, 빈 응답은 모두 한도를 줄이는 신호로 봅니다.
+                slot.mark_failure()
+            return status, translated
+
+    async def translate_many(
+        self, texts: Sequence[str], source: str = "auto", target: str = "ko"
+    ) -> List[Optional[str]]:
+        """
+        여러 텍스트를 요청 크기 제한이 허용하는 만큼 하나의 요청으로 묶어 번역합니다.
+        :return: texts와 같은 순서의 번역 결과 리스트 (실패한 항목은 None)
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        async for index, translated in self.iter_translate_many(texts, source, target):
+            results[index] = translated
+        return results
+
+    async def iter_translate_many(
+        self, texts: Sequence[str], source: str = "auto", target: str = "ko"
+    ) -> AsyncIterator[Tuple[int, Optional[str]]]:
+        """
+        translate_many와 같이 묶어서 요청하되, 묶음 요청이 끝나는 대로
+        (텍스트 인덱스, 번역 결과)를 내보냅니다. 모든 인덱스가 정확히 한 번씩 나옵니다.
+        묶음의 번역 결과를 표지로 다시 나누지 못하면 해당 묶음만 텍스트별로 다시 요청합니다.
+        반복을 중간에 멈추면 남은 요청은 취소됩니다.
+        """
+
+        async def run_batch(indices: List[int]) -> List[Tuple[int, Optional[str]]]:
+            batch_texts = [texts[i] for i in indices]
+            if len(batch_texts) == 1:
+                translated = [await self.translate(batch_texts[0], source, target)]
+            else:
+                packed = await self.translate(join_batch(batch_texts), source, target)
+                if packed is None:
+                    # 요청 자체가 실패했다면 블록별로 다시 보내지 않고 누락으로 남깁니다.
+                    translated = [None] * len(batch_texts)
+                else:
+                    translated = split_batch(packed, len(batch_texts))
+                if translated is None:
+                    translated = await asyncio.gather(
+                        *(self.translate(text, source, target) for text in batch_texts)
+                    )
+            return list(zip(indices, translated))
+
+        tasks = [
+            asyncio.ensure_future(run_batch(indices))
+            for indices in pack_batches(texts, self.max_encoded_length)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for item in await next_done:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def close(self):
+        """풀에 남아 있는 커넥션을 닫고 세션(교체되어 정리를 기다리는 세션 포함)을 정리합니다."""
+        sessions = set(self._session_users)
+        if self._session is not None:
+            sessions.add(self._session)
+        self._session = None
+        self._session_users.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
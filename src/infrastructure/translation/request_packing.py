@@ -0,0 +1,74 @@
+import re
+from typing import List, Optional, Sequence
+from urllib.parse import quote
+
+# translate_a/single은 GET 요청이므로 URL 길이가 사실상의 요청 크기 제한입니다.
+# 여유를 두어 퍼센트 인코딩된 q 파라미터 길이를 기준으로 제한합니다.
+DEFAULT_MAX_ENCODED_LENGTH = 5000
+
+# 각 블록 앞에 "[[번호]]" 표지를 독립된 줄로 넣어 하나의 요청으로 합칩니다.
+# 번역기가 표지 주변의 공백/줄바꿈을 바꾸는 경우에도 찾을 수 있도록 느슨하게 매칭합니다.
+_MARKER_TEMPLATE = "[[{index}]]"
+_MARKER_PATTERN = re.compile(r"\[\[\s*(\d+)\s*\]\]")
+
+
+def encoded_length(text: str) -> int:
+    return len(quote(text, safe=""))
+
+
+def _packed_item_length(position: int, text: str) -> int:
+    # 표지와 줄바꿈의 인코딩 길이까지 포함하여 계산합니다.
+    return encoded_length(f"{_MARKER_TEMPLATE.format(index=position)}\n{text}\n")
+
+
+def pack_batches(
+    texts: Sequence[str], max_encoded_length: int = DEFAULT_MAX_ENCODED_LENGTH
+) -> List[List[int]]:
+    """
+    텍스트들을 요청 크기 제한을 넘지 않는 묶음으로 나눕니다.
+    원래 순서를 유지하며, 제한보다 긴 텍스트는 단독 묶음이 됩니다.
+    :return: 묶음별 텍스트 인덱스 리스트
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_length = 0
+    for index, text in enumerate(texts):
+        item_length = _packed_item_length(len(current), text)
+        if current and current_length + item_length > max_encoded_length:
+            batches.append(current)
+            current, current_length = [], 0
+            item_length = _packed_item_length(0, text)
+        current.append(index)
+        current_length += item_length
+    if current:
+        batches.append(current)
+    return batches
+
+
+def join_batch(texts: Sequence[str]) -> str:
+    """여러 텍스트를 번호 표지로 구분된 하나의 요청 텍스트로 합칩니다."""
+    return "\n".join(
+        f"{_MARKER_TEMPLATE.format(index=i)}\n{text}" for i, text in enumerate(texts)
+    )
+
+
+def split_batch(translated: Optional[str], expected_count: int) -> Optional[List[str]]:
+    """
+    join_batch로 합친 요청의 번역 결과를 다시 블록별 텍스트로 나눕니다.
+    표지가 0부터 순서대로 정확히 expected_count개 있지 않으면 None을 반환하여
+    호출 측이 블록 단위 요청으로 대체하도록 합니다.
+    """
+    if not translated:
+        return None
+    matches = list(_MARKER_PATTERN.finditer(translated))
+    if [int(m.group(1)) for m in matches] != list(range(expected_count)):
+        return None
+    if translated[: matches[0].start()].strip():
+        return None  # 첫 표지 앞에 내용이 있다면 표지가 손상된 것으로 봅니다.
+    pieces = []
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(translated)
+        pieces.append(translated[match.end() : end].strip())
+    if not all(pieces):
+        return None
+    return pieces
@@ -0,0 +1,88 @@
+import random
+import time
+from typing import Optional
+
+# 일시적인 장애로 보고 재시도할 HTTP 상태 코드
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def is_retryable_status(status: Optional[int]) -> bool:
+    """status가 None이면 네트워크 오류 또는 빈 응답으로 보고 재시도합니다."""
+    return status is None or status in RETRYABLE_STATUSES
+
+
+class RetryPolicy:
+    """
+    지터(jitter)를 적용한 지수 백오프 재시도 정책.
+    n번째 재시도 전 대기 시간은 0 ~ min(max_delay, base_delay * 2^n) 사이의 난수입니다
+    (full jitter). 여러 요청이 동시에 실패해도 재시도가 한꺼번에 몰리지 않습니다.
+    """
+
+    def __init__(
+        self, max_attempts: int = 4, base_delay: float = 0.5, max_delay: float = 8.0
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, retry_number: int) -> float:
+        cap = min(self.max_delay, self.base_delay * (2**retry_number))
+        return random.uniform(0, cap)  # nosec B311 - 보안 용도가 아닌 지터
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold 번 발생하면 회로를 열어(open) reset_timeout 동안
+    요청을 즉시 실패시킵니다. 시간이 지나면 반열림(half-open) 상태에서 시험 요청 하나만
+    허용하고, 성공하면 닫고(closed) 실패하면 다시 엽니다.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        self._state = self.CLOSED
+        self._consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self._consecutive_failures += 1
+        if (
+            self._state == self.HALF_OPEN
+            or self._consecutive_failures >= self.failure_threshold
+        ):
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def record_cancelled(self):
+        """시험 요청이 취소되었다면 다음 요청이 다시 시험할 수 있도록 합니다."""
+        self._probe_in_flight = False
@@ -0,0 +1,224 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Dict, List, Optional
+
+from src.common.constants import LANGUAGES
+from src.core.use_cases.document_translation_service import (
+    DocumentTranslationService,
+    PageTranslationResult,
+)
+
+
+class TranslationResultWriter:
+    """
+    페이지 번역 결과를 파일에 바로바로 기록합니다.
+    페이지는 완료 순서와 관계없이 페이지 순서대로 기록되며,
+    확장자가 .jsonl이면 한 줄에 한 페이지씩, 그 외에는 하나의 JSON 문서로 기록합니다.
+    """
+
+    def __init__(self, out_path: str, header: dict, page_numbers: List[int]):
+        self.out_path = out_path
+        self.header = header
+        self._jsonl = out_path.lower().endswith(".jsonl")
+        self._pending: Dict[int, dict] = {}
+        self._order = list(page_numbers)
+        self._next_index = 0
+        self._written = 0
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.out_path, "w", encoding="utf-8")
+        if self._jsonl:
+            self._write_line({"document": self.header})
+        else:
+            header = json.dumps(self.header, ensure_ascii=False)[:-1]
+            self._file.write(f'{header}, "pages": [\n')
+        self._file.flush()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self._jsonl:
+            self._file.write("\n]}\n")
+        self._file.close()
+        return False
+
+    def add(self, result: PageTranslationResult):
+        self._pending[result.page_number] = self._page_record(result)
+        # 앞 페이지가 모두 끝났다면 연속된 페이지들을 기록합니다.
+        while (
+            self._next_index < len(self._order)
+            and self._order[self._next_index] in self._pending
+        ):
+            record = self._pending.pop(self._order[self._next_index])
+            if self._jsonl:
+                self._write_line(record)
+            else:
+                separator = ",\n" if self._written else ""
+                self._file.write(separator + json.dumps(record, ensure_ascii=False))
+            self._written += 1
+            self._next_index += 1
+        self._file.flush()
+
+    def _write_line(self, record: dict):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    @staticmethod
+    def _page_record(result: PageTranslationResult) -> dict:
+        source_texts: Dict[str, List[str]] = {}
+        for line in result.lines:
+            source_texts.setdefault(line.block_id, []).append(line.text)
+        return {
+            "page_number": result.page_number + 1,
+            "blocks": [
+                {
+                    "block_id": block_id,
+                    "source": "\n".join(source_texts.get(block_id, [])),
+                    "translation": translated,
+                }
+                for block_id, translated in result.translated_blocks.items()
+            ],
+            "missing_blocks": result.missing_blocks,
+        }
+
+
+def parse_page_range(spec: Optional[str], page_count: int) -> List[int]:
+    """'1-3,7' 형식의 페이지 범위(1부터 시작)를 0부터 시작하는 페이지 번호 목록으로 변환합니다."""
+    if not spec:
+        return list(range(page_count))
+    pages = []
+    for part in spec.split(","):
+        part = part.strip()
+        if "-" in part:
+            start, end = part.split("-", 1)
+            pages.extend(range(int(start) - 1, min(int(end), page_count)))
+        elif part:
+            pages.append(int(part) - 1)
+    return [p for p in dict.fromkeys(pages) if 0 <= p < page_count]
+
+
+def page_range_arg(value: str) -> str:
+    """--pages 값의 형식을 검사하는 argparse type (페이지 수는 문서를 열어야 알 수 있음)"""
+    try:
+        parse_page_range(value, 0)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"잘못된 페이지 범위입니다: {value!r} (예: 1-10,15)"
+        ) from None
+    return value
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pdf-dual-viewer translate",
+        description="GUI 없이 PDF 문서 전체를 번역하여 JSON 파일로 저장합니다.",
+    )
+    parser.add_argument("pdf", help="번역할 PDF 파일 경로")
+    parser.add_argument("--from", dest="source", default="auto", help="원본 언어")
+    parser.add_argument("--to", dest="target", default="ko", help="번역 언어")
+    parser.add_argument(
+        "--out", required=True, help="결과 파일 경로 (.json 또는 .jsonl)"
+    )
+    parser.add_argument(
+        "--pages", type=page_range_arg, help="번역할 페이지 범위 (예: 1-10,15)"
+    )
+    parser.add_argument(
+        "--parse-workers", type=int, default=None, help="파싱 프로세스 수"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="동시에 번역할 페이지 수"
+    )
+    parser.add_argument(
+        "--connections", type=int, default=8, help="번역 서버 호스트당 최대 연결 수"
+    )
+    parser.add_argument(
+        "--memory",
+        default=None,
+        help="번역 메모리(SQLite) 경로. 기본값은 GUI와 같은 사용자 캐시 디렉터리의 파일",
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="번역 메모리를 사용하지 않습니다."
+    )
+    return parser
+
+
+async def run_translate(args) -> int:
+    import fitz
+
+    from src.adapters.gateways.google_translation_gateway import (
+        GoogleTranslationGateway,
+    )
+    from src.core.use_cases.translation_service import TranslationService
+    from src.infrastructure.persistence.translation_memory import (
+        SqliteTranslationMemory,
+    )
+
+    with fitz.open(args.pdf) as doc:
+        page_count = doc.page_count
+    page_numbers = parse_page_range(args.pages, page_count)
+
+    memory = None
+    if not args.no_memory:
+        memory = SqliteTranslationMemory(args.memory)
+    translation_service = TranslationService(
+        GoogleTranslationGateway(limit_per_host=args.connections), memory=memory
+    )
+    pipeline = DocumentTranslationService(
+        translation_service,
+        parse_workers=args.parse_workers,
+        translate_concurrency=args.concurrency,
+    )
+
+    header = {
+        "source": args.pdf,
+        "source_lang": args.source,
+        "target_lang": args.target,
+        "page_count": page_count,
+    }
+    started = time.monotonic()
+    done = 0
+    failed_blocks = 0
+
+    with TranslationResultWriter(args.out, header, page_numbers) as writer:
+
+        async def on_page_done(result: PageTranslationResult):
+            nonlocal done, failed_blocks
+            done += 1
+            failed_blocks += len(result.missing_blocks)
+            writer.add(result)
+            elapsed = time.monotonic() - started
+            print(
+                f"[{done}/{len(page_numbers)}] page {result.page_number + 1} "
+                f"({len(result.translated_blocks)} blocks, "
+                f"{len(result.missing_blocks)} failed) {elapsed:.1f}s",
+                file=sys.stderr,
+            )
+
+        try:
+            await pipeline.translate_document(
+                args.pdf, args.source, args.target, on_page_done, page_numbers
+            )
+        finally:
+            await translation_service.close()
+
+    print(
+        f"완료: {done}페이지, 실패한 블록 {failed_blocks}개, "
+        f"{time.monotonic() - started:.1f}초 -> {args.out}",
+        file=sys.stderr,
+    )
+    return 1 if failed_blocks else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    `translate` 명령의 진입점.
+    예: pdf-dual-viewer translate in.pdf --to ko --out result.json
+    """
+    args = build_arg_parser().parse_args(argv)
+    for lang in (args.source, args.target):
+        if lang not in LANGUAGES:
+            print(f"알 수 없는 언어 코드: {lang}", file=sys.stderr)
+            return 2
+    return asyncio.run(run_translate(args))
@@ -1,11 +1,19 @@
 import asyncio
 import json
+import logging
 import os
 from typing import Optional
 
 import fitz  # PyMuPDF
 from PySide6.QtCore import QEvent, Qt, QTimer, QUrl
-from PySide6.QtGui import QAction, QDesktopServices, QIcon, QImage, QPixmap
+from PySide6.QtGui import (
+    QAction,
+    QDesktopServices,
+    QIcon,
+    QImage,
+    QKeySequence,
+    QPixmap,
+)
 from PySide6.QtWidgets import QTreeWidget  # QAction removed from here
 from PySide6.QtWidgets import QTreeWidgetItem  # QAction removed from here
 from PySide6.QtWidgets import (  # QAction removed from here
@@ -30,6 +38,7 @@ from PySide6.QtWidgets import (  # QAction removed from here
 from src.adapters.controllers.pdf_controller import PdfController
 from src.adapters.presenters.pdf_presenter import PdfPresenter
 from src.common.constants import LANGUAGES
+from src.common.translation_priority import priority_for_distance
 from src.core.use_cases.pdf_page_service import PdfPageService
 from src.infrastructure.dtos.app_settings_dtos import AppSettings
 from src.infrastructure.dtos.pdf_view_dtos import (
@@ -38,11 +47,19 @@ from src.infrastructure.dtos.pdf_view_dtos import (
     SegmentViewData,
 )
 from src.ui.view.settings_dialog import SettingsDialog
+from src.ui.widgets.image_cache import SharedImageCache
 from src.ui.widgets.pdf_view_widget import PdfViewWidget
+from src.ui.widgets.search_panel import SearchPanel
 
+logger = logging.getLogger(__name__)
 
 class MainWindow(QMainWindow):  # type: ignore
     SETTINGS_PATH = "settings.json"
+    # 현재 페이지 뒤로 미리 파싱해 둘 최소 페이지 수
+    PARSE_LOOKAHEAD_PAGES = 2
+    # 연속 스크롤 모드에서 뷰포트 근처 페이지 앞뒤로 지우지 않고 남겨 둘 페이지 수
+    # (스크롤을 조금 되돌렸을 때 페이지를 다시 그리지 않도록)
+    CONTINUOUS_KEEP_PAGES = 1
 
     def __init__(self):
         super().__init__()
@@ -52,6 +69,12 @@ class MainWindow(QMainWindow):  # type: ignore
         self.auto_translate = False
         self.pdf_preview_dialog = None  # 미리보기 다이얼로그 참조
         self._current_view_model = None
+        # 연속 스크롤 모드 여부와 뷰포트 근처의 페이지, 불러오는 중인 페이지
+        self._continuous = False
+        self._visible_pages = []
+        self._loading_pages = set()
+        self._page_view_models = {}  # 연속 스크롤 모드에서 그려 둔 페이지의 뷰모델
+        self._image_cache = None  # 두 뷰가 함께 쓰는 문서의 이미지 캐시
         self.sidebar_visible = False
         self.controller = PdfController()  # 컨트롤러 인스턴스 생성
         # self.outline_tree와 self.sidebar를 항상 생성
@@ -63,6 +86,7 @@ class MainWindow(QMainWindow):  # type: ignore
         self.sidebar.setWidget(self.outline_tree)
         self.addDockWidget(Qt.LeftDockWidgetArea, self.sidebar)
         self.sidebar.setVisible(False)  # 기본적으로 숨김
+        self._create_search_dock()
         self.setAcceptDrops(True)  # 드래그&드롭 허용
 
         self.main_widget = QWidget()
@@ -83,10 +107,76 @@ class MainWindow(QMainWindow):  # type: ignore
 
         self.current_settings = self._load_settings()  # 폰트/하이라이트 등 통합 관리
         self.apply_highlight_color_to_views(self.current_settings.highlight_color)
+        self.controller.set_translation_connection_limit(
+            self.current_settings.translation_connection_limit
+        )
+        self.controller.set_layout_cache_enabled(
+            self.current_settings.enable_layout_cache
+        )
+        self._apply_raster_background()
+        self._apply_continuous_scroll()
+
+    def _create_search_dock(self):
+        self._search_hits = []
+        self._pending_search_focus = None  # 페이지를 연 뒤 가운데로 보여 줄 세그먼트 ID
+        self.search_panel = SearchPanel()
+        self.search_panel.searchRequested.connect(self._run_search)
+        self.search_panel.hitActivated.connect(self._on_search_hit_activated)
+        self.search_dock = QDockWidget("검색", self)
+        self.search_dock.setAllowedAreas(Qt.LeftDockWidgetArea | Qt.RightDockWidgetArea)
+        self.search_dock.setWidget(self.search_panel)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.search_dock)
+        self.search_dock.setVisible(False)
+
+    def show_search_panel(self):
+        self.search_dock.setVisible(True)
+        self.search_panel.focus_query()
+
+    def _on_search_index_progress(self, indexed_pages, page_count):
+        self.search_panel.set_progress(indexed_pages, page_count)
+        # 색인이 진행되는 동안 새로 색인된 페이지의 결과도 목록에 나타나도록 합니다.
+        self.search_panel.refresh()
+
+    def _run_search(self, query):
+        self._search_hits = self.controller.search(query) if query else []
+        self.search_panel.set_results(self._search_hits)
+        self._apply_search_matches(getattr(self, "_current_page", 0))
+
+    def _apply_search_matches(self, page_number):
+        """검색 결과 중 page_number 페이지의 세그먼트를 두 뷰에 표시합니다."""
+        # 연속 스크롤 모드에서는 여러 페이지가 보이므로 모든 결과를 넘깁니다.
+        # (뷰는 지정된 ID를 기억했다가 페이지를 그릴 때 표시합니다)
+        segment_ids = [
+            hit.segment_id
+            for hit in self._search_hits
+            if self._continuous or hit.page_number == page_number
+        ]
+        self.original_pdf_widget.set_search_matches(
+            [segment_id for segment_id in segment_ids if segment_id.startswith("orig_")]
+        )
+        self.translated_pdf_widget.set_search_matches(
+            [
+                segment_id
+                for segment_id in segment_ids
+                if segment_id.startswith("trans_")
+            ]
+        )
+
+    def _on_search_hit_activated(self, page_number, segment_id):
+        if self._continuous:
+            if self._center_on_search_hit(segment_id):
+                return
+        elif page_number == self._current_page:
+            self._center_on_search_hit(segment_id)
+            return
+        # 페이지를 표시한 뒤 해당 세그먼트를 가운데로 보여 줍니다.
+        self._pending_search_focus = segment_id
+        self._show_pdf_page(page_number)
 
-        # --- Prefetch 관련 초기화 추가 ---
-        self.prefetch_cache = {}  # {page_number: translated_segments}
-        self.prefetch_tasks = {}  # {page_number: asyncio.Task}
+    def _center_on_search_hit(self, segment_id) -> bool:
+        if segment_id.startswith("trans_"):
+            return self.translated_pdf_widget.center_on_segment(segment_id)
+        return self.original_pdf_widget.center_on_segment(segment_id)
 
     def _load_settings(self):
         if os.path.exists(self.SETTINGS_PATH):
@@ -234,6 +324,11 @@ class MainWindow(QMainWindow):  # type: ignore
 
         # 링크 클릭 시그널 연결 (원본 뷰에만 적용)
         self.original_pdf_widget.linkClicked.connect(self._handle_link_click)
+        # 연속 스크롤 모드에서 보이는 페이지를 따라 페이지를 그립니다. (두 뷰의 스크롤이
+        # 동기화되므로 원본 뷰만 따릅니다)
+        self.original_pdf_widget.visiblePagesChanged.connect(
+            self._on_visible_pages_changed
+        )
 
     def show_status_message(self, message: str, timeout: int = 4000):
         """상태바에 메시지를 표시하고 일정 시간 후 지웁니다."""
@@ -432,6 +527,13 @@ class MainWindow(QMainWindow):  # type: ignore
         self.display_page(dummy_page_view_model)
 
     def display_page(self, view_model):
+        page_data = self._render_page_views(view_model)
+        self.page_input.setText(str(page_data["page_number"]))
+        self._current_view_model = view_model
+        self._apply_search_matches(page_data["page_number"] - 1)
+
+    def _render_page_views(self, view_model) -> dict:
+        """뷰모델의 페이지를 원본/번역 뷰에 그리고, 프레젠터가 만든 화면 데이터를 반환합니다."""
         # 프레젠터를 통해 UI 데이터 추출
         page_data = PdfPresenter.present_page(view_model)
 
@@ -451,6 +553,7 @@ class MainWindow(QMainWindow):  # type: ignore
             page_width,
             page_height,
             pdf_doc,
+            page_number=page_data["page_number"] - 1,
         )
         self.translated_pdf_widget.render_page(
             page_data["translated_segments"],
@@ -458,9 +561,9 @@ class MainWindow(QMainWindow):  # type: ignore
             page_width,
             page_height,
             pdf_doc,
+            page_number=page_data["page_number"] - 1,
         )
-        self.page_input.setText(str(page_data["page_number"]))
-        self._current_view_model = view_model
+        return page_data
 
     def update_highlights(self, highlight_info):
         # 하이라이트 기능이 꺼져 있으면 모든 하이라이트를 끄고, 나머지 로직은 무시
@@ -511,56 +614,34 @@ class MainWindow(QMainWindow):  # type: ignore
             return
 
         # 원본 뷰와 번역본 뷰의 하이라이트를 동기화합니다.
-        # 번역 전(라인-라인)과 번역 후(라인-블록) 상태에 따라 다르게 동작합니다.
+        # 번역이 블록 단위로 도착하므로 번역 뷰에는 번역 전(라인) 세그먼트와
+        # 번역 후(블록) 세그먼트가 섞여 있을 수 있어, 세그먼트마다 대응 관계를 판단합니다.
         if segment_id:
-            # 번역 뷰가 라인 기반인지(번역 전) 확인
-            is_trans_view_line_based = False
-            if self.translated_pdf_widget._current_segments_on_display:
-                first_trans_seg = next(
-                    iter(
-                        self.translated_pdf_widget._current_segments_on_display.values()
-                    )
-                )
-                is_trans_view_line_based = first_trans_seg.line_id is not None
-
-            if is_trans_view_line_based:
-                # 번역 전: 1:1 라인 하이라이트 동기화
-                if segment_id.startswith("orig_"):
-                    sibling_id = segment_id.replace("orig_", "trans_")
-                    if sibling_id in all_trans_ids:
-                        segments_to_update[sibling_id] = True
-                elif segment_id.startswith("trans_"):
+            original_segments = self.original_pdf_widget._current_segments_on_display
+            translated_segments = (
+                self.translated_pdf_widget._current_segments_on_display
+            )
+            if view_context == "ORIGINAL":
+                # 번역 전: 1:1 라인 하이라이트, 번역 후: 라인-블록 하이라이트
+                sibling_id = segment_id.replace("orig_", "trans_")
+                original_segment = original_segments.get(segment_id)
+                if sibling_id in translated_segments:
+                    segments_to_update[sibling_id] = True
+                elif original_segment and original_segment.block_id:
+                    translated_block_id = f"trans_{original_segment.block_id}"
+                    if translated_block_id in translated_segments:
+                        segments_to_update[translated_block_id] = True
+            elif view_context == "TRANSLATED":
+                translated_segment = translated_segments.get(segment_id)
+                if translated_segment and translated_segment.line_id is not None:
                     sibling_id = segment_id.replace("trans_", "orig_")
-                    if sibling_id in all_orig_ids:
+                    if sibling_id in original_segments:
                         segments_to_update[sibling_id] = True
-            else:
-                # 번역 후: 라인-블록 하이라이트 동기화
-                if view_context == "ORIGINAL":
-                    original_segment = (
-                        self.original_pdf_widget._current_segments_on_display.get(
-                            segment_id
-                        )
-                    )
-                    if original_segment and original_segment.block_id:
-                        translated_block_id = f"trans_{original_segment.block_id}"
-                        if translated_block_id in all_trans_ids:
-                            segments_to_update[translated_block_id] = True
-                elif view_context == "TRANSLATED":
-                    translated_segment = (
-                        self.translated_pdf_widget._current_segments_on_display.get(
-                            segment_id
-                        )
-                    )
-                    if translated_segment and translated_segment.block_id:
-                        block_id_to_find = translated_segment.block_id
-                        for (
-                            orig_seg_id,
-                            orig_seg_data,
-                        ) in (
-                            self.original_pdf_widget._current_segments_on_display.items()
-                        ):
-                            if orig_seg_data.block_id == block_id_to_find:
-                                segments_to_update[orig_seg_id] = True
+                elif translated_segment and translated_segment.block_id:
+                    block_id_to_find = translated_segment.block_id
+                    for orig_seg_id, orig_seg_data in original_segments.items():
+                        if orig_seg_data.block_id == block_id_to_find:
+                            segments_to_update[orig_seg_id] = True
 
         self.update_highlights(HighlightUpdateInfo(segments_to_update))
 
@@ -722,13 +803,28 @@ class MainWindow(QMainWindow):  # type: ignore
             self._current_pdf = self.controller.pdf_doc
             self._current_pdf_path = file_path
             self._current_page = 0
+            # 두 뷰가 같은 이미지 캐시를 쓰고, 이미지는 워커 프로세스에서 디코딩합니다.
+            if self._image_cache is not None:
+                self._image_cache.clear()
+            self._image_cache = SharedImageCache(
+                self._current_pdf, self.controller.get_image_decoder()
+            )
+            self.original_pdf_widget.set_image_cache(self._image_cache)
+            self.translated_pdf_widget.set_image_cache(self._image_cache)
+            # 새 문서의 검색 색인과 반복 블록 분석을 백그라운드에서 만듭니다.
+            self._search_hits = []
+            self._pending_search_focus = None
+            self.search_panel.reset()
+            self.controller.start_document_analysis(self._on_search_index_progress)
             if self.sidebar:
                 self._load_pdf_outline()
-            if self.auto_translate:
+            self._apply_continuous_scroll(document_changed=True)
+            if self.auto_translate and not self._continuous:
                 import asyncio
 
                 asyncio.create_task(self._run_translation_async())
             else:
+                # 연속 스크롤 모드에서는 페이지를 그리면서 계속 번역을 시작합니다.
                 self._show_pdf_page(0)
         except Exception as e:
             QMessageBox.critical(
@@ -765,13 +861,30 @@ class MainWindow(QMainWindow):  # type: ignore
         if page_number < 0 or page_number >= self._current_pdf.page_count:
             return
         self._current_page = page_number
+        self.page_input.setText(str(page_number + 1))
+        self.page_count_label.setText(f"/ {self._current_pdf.page_count}")
+        if self._continuous:
+            # 페이지로 스크롤하면 보이는 페이지가 바뀌어 필요한 페이지를 그립니다.
+            self.original_pdf_widget.scroll_to_page(page_number)
+            self.translated_pdf_widget.scroll_to_page(page_number)
+            return
+        # 페이지 파싱은 워커 프로세스에서 하고, UI 스레드는 씬 구성만 담당합니다.
+        asyncio.create_task(self._show_pdf_page_async(page_number))
+
+    async def _show_pdf_page_async(self, page_number):
+        try:
+            view_model = await self.controller.load_page_view_model_async(page_number)
+        except Exception as e:
+            self.show_status_message(f"페이지를 불러오지 못했습니다: {e}")
+            return
+        if view_model is None or page_number != self._current_page:
+            return  # 파싱하는 동안 다른 페이지로 이동했습니다.
+        self.controller.set_current_view_model(view_model)
         # 현재 확대/이동 상태 저장
         orig_transform = self.original_pdf_widget.graphics_view.transform()
         trans_transform = self.translated_pdf_widget.graphics_view.transform()
-        view_model = self.controller.get_page_view_model(page_number)
         self.display_page(view_model)
         self.page_input.setText(str(page_number + 1))
-        self.page_count_label.setText(f"/ {self._current_pdf.page_count}")
         self._update_pdf_thumbnail()
         self._update_thumbnail_position()
         if self.sidebar:
@@ -783,42 +896,147 @@ class MainWindow(QMainWindow):  # type: ignore
         # 확대/이동 상태 복원
         self.original_pdf_widget.graphics_view.setTransform(orig_transform)
         self.translated_pdf_widget.graphics_view.setTransform(trans_transform)
+        if self._pending_search_focus is not None:
+            self._center_on_search_hit(self._pending_search_focus)
+            self._pending_search_focus = None
+        # 이웃 페이지를 미리 파싱해 두어 페이지를 넘길 때 기다리지 않도록 합니다.
+        lookahead = max(
+            self.PARSE_LOOKAHEAD_PAGES,
+            getattr(self.current_settings, "prefetch_page_count", 0),
+        )
+        self.controller.prefetch_pages(
+            range(page_number - 1, page_number + lookahead + 1)
+        )
         # --- Prefetch logic 추가 ---
         self._trigger_prefetch_translations(page_number)
 
+    def _on_visible_pages_changed(self, current_page, visible_pages):
+        """
+        연속 스크롤 모드에서 보이는 페이지가 바뀌면 호출됩니다.
+        근처 페이지는 그리고, 멀어진 페이지는 두 뷰에서 지웁니다.
+        """
+        if not self._continuous or not visible_pages:
+            return
+        self._visible_pages = list(visible_pages)
+        if current_page != self._current_page:
+            self._current_page = current_page
+            self.page_input.setText(str(current_page + 1))
+            self._set_continuous_current_view_model()
+            self._update_pdf_thumbnail()
+            self._update_pdf_preview_content()
+        keep = set()
+        for page_number in self._visible_pages:
+            keep.update(
+                range(
+                    page_number - self.CONTINUOUS_KEEP_PAGES,
+                    page_number + self.CONTINUOUS_KEEP_PAGES + 1,
+                )
+            )
+        for widget in (self.original_pdf_widget, self.translated_pdf_widget):
+            for page_number in widget.displayed_pages():
+                if page_number not in keep:
+                    widget.remove_page(page_number)
+                    self._page_view_models.pop(page_number, None)
+        for page_number in self._visible_pages:
+            if (
+                page_number not in self._page_view_models
+                and page_number not in self._loading_pages
+            ):
+                asyncio.create_task(self._show_continuous_page(page_number))
+        lookahead = max(
+            self.PARSE_LOOKAHEAD_PAGES,
+            getattr(self.current_settings, "prefetch_page_count", 0),
+        )
+        self.controller.prefetch_pages(
+            range(self._visible_pages[0] - 1, self._last_shown_page() + lookahead + 1)
+        )
+        self._trigger_prefetch_translations(current_page)
+
+    async def _show_continuous_page(self, page_number):
+        """연속 스크롤 모드에서 한 페이지를 두 뷰의 제자리에 그립니다."""
+        self._loading_pages.add(page_number)
+        try:
+            view_model = await self.controller.load_page_view_model_async(page_number)
+        except Exception as e:
+            self.show_status_message(f"페이지를 불러오지 못했습니다: {e}")
+            return
+        finally:
+            self._loading_pages.discard(page_number)
+        if (
+            view_model is None
+            or not self._continuous
+            or page_number not in self._visible_pages
+        ):
+            return  # 파싱하는 동안 다른 곳으로 스크롤했습니다.
+        self._render_page_views(view_model)
+        self._page_view_models[page_number] = view_model
+        if page_number == self._current_page:
+            self._set_continuous_current_view_model()
+        if self._pending_search_focus is not None and self._center_on_search_hit(
+            self._pending_search_focus
+        ):
+            self._pending_search_focus = None
+        if self.auto_translate:
+            asyncio.create_task(self._run_translation_async(view_model))
+
+    def _set_continuous_current_view_model(self):
+        """연속 스크롤 모드에서 현재 페이지가 그려져 있으면 그 뷰모델을 현재 뷰모델로 둡니다."""
+        view_model = self._page_view_models.get(self._current_page)
+        if view_model is not None:
+            self.controller.set_current_view_model(view_model)
+            self._current_view_model = view_model
+
+    def _is_page_shown(self, page_number) -> bool:
+        """페이지가 지금 화면에 그려져 있는지 (번역 결과를 뷰에 반영해도 되는지)"""
+        if self._continuous:
+            return page_number in self._visible_pages
+        return page_number == self._current_page
+
+    def _last_shown_page(self) -> int:
+        """화면에 보이는 마지막 페이지. 번역 프리페치는 이 페이지 뒤부터 셉니다."""
+        if self._continuous and self._visible_pages:
+            return self._visible_pages[-1]
+        return self._current_page
+
     def _trigger_prefetch_translations(self, current_page):
         count = getattr(self.current_settings, "prefetch_page_count", 0)
         if not hasattr(self, "_current_pdf") or self._current_pdf is None:
             return
+        source_lang = self.original_lang_combo.currentData()
+        target_lang = self.target_lang_combo.currentData()
+        # 사용자가 벗어난 페이지의 번역은 취소하고, 남은 작업의 우선순위를 다시 매깁니다.
+        visible_pages = self._visible_pages if self._continuous else ()
+        self.controller.update_translation_window(
+            current_page, count, source_lang, target_lang, visible_pages
+        )
         max_page = self._current_pdf.page_count
+        last_page = self._last_shown_page()
         for offset in range(1, count + 1):
-            page_num = current_page + offset
+            page_num = last_page + offset
             if page_num >= max_page:
                 break
-            if page_num in self.prefetch_cache or page_num in self.prefetch_tasks:
-                continue  # 이미 번역됨/진행중
-            self.prefetch_tasks[page_num] = asyncio.create_task(
-                self._prefetch_translate_page(page_num)
+            asyncio.create_task(
+                self._prefetch_page_translation(page_num, source_lang, target_lang)
             )
 
-    async def _prefetch_translate_page(self, page_number):
+    async def _prefetch_page_translation(self, page_number, source_lang, target_lang):
         try:
-            # 페이지 뷰모델 준비
-            view_model = self.controller.get_page_view_model(page_number)
-            source_lang = self.original_lang_combo.currentData()
-            target_lang = self.target_lang_combo.currentData()
-            translated_blocks = (
-                await self.controller.translation_service.translate_segments(
-                    view_model.original_segments_view, source_lang, target_lang
-                )
+            view_model = await self.controller.load_page_view_model_async(page_number)
+            # 파싱하는 동안 사용자가 멀리 이동했다면 번역을 시작하지 않습니다.
+            distance = page_number - self._last_shown_page()
+            count = getattr(self.current_settings, "prefetch_page_count", 0)
+            if view_model is None or not 0 < distance <= count:
+                return
+            # 이미 번역 중이거나 번역이 끝난 페이지는 기존 작업을 그대로 사용합니다.
+            self.controller.start_page_translation(
+                page_number,
+                source_lang,
+                target_lang,
+                view_model,
+                priority=priority_for_distance(distance),
             )
-            # Prefetch 캐시에는 번역된 블록 딕셔너리를 저장합니다.
-            self.prefetch_cache[page_number] = translated_blocks
         except Exception as e:
-            print(f"Prefetch translation failed for page {page_number}: {e}")
-            self.prefetch_cache[page_number] = None  # 실패 표시
-        finally:
-            self.prefetch_tasks.pop(page_number, None)
+            logger.warning("프리페치 번역 실패 (페이지 %s): %s", page_number, e)
 
     def run_translation(self):
         """
@@ -844,7 +1062,7 @@ class MainWindow(QMainWindow):  # type: ignore
 
         # Step 2: Check for relevance. If the user has navigated away, abort.
         page_num_to_translate = view_model_to_translate.page_number - 1
-        if page_num_to_translate != self._current_page:
+        if not self._is_page_shown(page_num_to_translate):
             # This translation task is for a page that is no longer visible.
             return
 
@@ -854,62 +1072,49 @@ class MainWindow(QMainWindow):  # type: ignore
             target_lang = self.target_lang_combo.currentData()
             original_segments = view_model_to_translate.original_segments_view
 
-            # Step 3: Get translated text (from cache or new request).
-            translated_blocks = None
-            if (
-                page_num_to_translate in self.prefetch_cache
-                and self.prefetch_cache[page_num_to_translate] is not None
+            # Step 3: Get translated text.
+            # 같은 페이지의 번역(프리페치 포함)이 이미 진행 중이면 그 작업에 합류하고,
+            # 이전 결과에 실패한 블록이 있으면 그 블록만 다시 요청하는 작업이 시작됩니다.
+            translation_service = self.controller.translation_service
+            job = self.controller.start_page_translation(
+                page_num_to_translate,
+                source_lang,
+                target_lang,
+                view_model_to_translate,
+            )
+            if job.done and not translation_service.missing_blocks(
+                original_segments, job.results
             ):
-                translated_blocks = self.prefetch_cache[page_num_to_translate]
+                # 전체 번역이 이미 있으면 한 번에 렌더링합니다.
+                translated_blocks = dict(job.results)
+                self._render_translated_page(view_model_to_translate, translated_blocks)
             else:
-                # The translation service only needs the segments, not the whole controller state.
-                translated_blocks = (
-                    await self.controller.translation_service.translate_segments(
-                        original_segments, source_lang, target_lang
-                    )
-                )
-                if translated_blocks:
-                    self.prefetch_cache[page_num_to_translate] = translated_blocks
-
-            if not translated_blocks:
-                # Nothing to render if translation failed or returned empty.
-                return
-
-            # Step 4: Final relevance check before updating the UI.
-            if page_num_to_translate != self._current_page:
-                return
-
-            # Step 5: Build the translated segment DTOs.
-            translated_segments = (
-                self.controller.translation_service.build_translated_segments(
-                    original_segments, translated_blocks
+                # 번역이 도착하는 블록부터 번역 뷰에 반영합니다.
+                translated_blocks = await self._stream_translation_into_view(
+                    view_model_to_translate, job
                 )
-            )
-
-            # Step 6: Render the translated view.
-            image_views = view_model_to_translate.image_views
-            page_width = view_model_to_translate.page_width
-            page_height = view_model_to_translate.page_height
-            pdf_doc = self._current_pdf if hasattr(self, "_current_pdf") else None
-
-            # Preserve zoom/scroll from original view
-            original_view_transform = self.original_pdf_widget.graphics_view.transform()
 
-            self.translated_pdf_widget.render_page(
-                translated_segments, image_views, page_width, page_height, pdf_doc
-            )
-            self.translated_pdf_widget.graphics_view.setTransform(
-                original_view_transform
+            missing_block_ids = translation_service.missing_blocks(
+                original_segments, translated_blocks
             )
+            if missing_block_ids and self._is_page_shown(page_num_to_translate):
+                self.show_status_message(
+                    f"{len(missing_block_ids)}개 블록의 번역에 실패했습니다. "
+                    "'번역 실행'을 다시 누르면 실패한 블록만 다시 요청합니다.",
+                    timeout=8000,
+                )
 
-            # Step 7: Update the main view model's translated part, if it's still the current one.
+            # Step 4: Update the main view model's translated part, if it's still the current one.
             if (
                 self.controller.view_model
                 and self.controller.view_model.page_number
                 == view_model_to_translate.page_number
+                and len(missing_block_ids) < len(translated_blocks)
             ):
                 self.controller.view_model.translated_segments_view = (
-                    translated_segments
+                    translation_service.build_translated_segments(
+                        original_segments, translated_blocks
+                    )
                 )
         except Exception as e:
             QMessageBox.critical(
@@ -918,6 +1123,61 @@ class MainWindow(QMainWindow):  # type: ignore
         finally:
             self.progress_bar.setVisible(False)
 
+    async def _stream_translation_into_view(
+        self, view_model: PageDisplayViewModel, job
+    ) -> dict:
+        """
+        페이지 번역 작업을 구독하면서 번역이 끝난 블록부터 번역 뷰의 해당 블록만 교체합니다.
+        사용자가 다른 페이지로 이동하면 구독만 멈추고 그때까지의 결과를 반환합니다.
+        번역 작업은 계속 진행되어 그 페이지로 돌아오면 결과를 다시 사용합니다.
+        """
+        translation_service = self.controller.translation_service
+        original_segments = view_model.original_segments_view
+        page_num = view_model.page_number - 1
+        segments_by_block = translation_service.group_by_block(original_segments)
+        stream = job.stream()
+        try:
+            async for block_id, translated_text in stream:
+                if not self._is_page_shown(page_num):
+                    break  # 더 이상 보이지 않는 페이지는 그리지 않습니다.
+                if not translated_text:
+                    continue
+                self.translated_pdf_widget.update_block_segments(
+                    block_id,
+                    translation_service.build_translated_segments(
+                        segments_by_block[block_id], {block_id: translated_text}
+                    ),
+                )
+        finally:
+            await stream.aclose()
+        return dict(job.results)
+
+    def _render_translated_page(
+        self, view_model: PageDisplayViewModel, translated_blocks: dict
+    ):
+        """번역 결과 전체로 번역 뷰를 다시 그립니다."""
+        translated_segments = (
+            self.controller.translation_service.build_translated_segments(
+                view_model.original_segments_view, translated_blocks
+            )
+        )
+        pdf_doc = self._current_pdf if hasattr(self, "_current_pdf") else None
+
+        # Preserve zoom/scroll from original view
+        original_view_transform = self.original_pdf_widget.graphics_view.transform()
+        self.translated_pdf_widget.render_page(
+            translated_segments,
+            view_model.image_views,
+            view_model.page_width,
+            view_model.page_height,
+            pdf_doc,
+            page_number=view_model.page_number - 1,
+        )
+        if not self._continuous:
+            self.translated_pdf_widget.graphics_view.setTransform(
+                original_view_transform
+            )
+
     def _filter_combo(self, combo, text):
         # 입력값이 코드/이름에 포함된 첫 항목을 선택
         text = text.strip().lower()
@@ -930,8 +1190,10 @@ class MainWindow(QMainWindow):  # type: ignore
 
     def eventFilter(self, obj, event):
         if event.type() == QEvent.KeyPress:
-            # 페이지 입력창에 포커스가 있으면 통과
-            if self.page_input and self.page_input.hasFocus():
+            # 페이지 입력창이나 검색창에 포커스가 있으면 통과
+            if (self.page_input and self.page_input.hasFocus()) or (
+                self.search_panel.query_input.hasFocus()
+            ):
                 return super().eventFilter(obj, event)
             if event.key() == Qt.Key_Left:
                 self.go_to_prev_page()
@@ -1076,6 +1338,10 @@ class MainWindow(QMainWindow):  # type: ignore
         file_open_action = QAction("파일 열기", self)
         file_open_action.triggered.connect(self.open_pdf_file)
         input_menu.addAction(file_open_action)
+        search_action = QAction("문서 검색", self)
+        search_action.setShortcut(QKeySequence.StandardKey.Find)
+        search_action.triggered.connect(self.show_search_panel)
+        input_menu.addAction(search_action)
         # 설정 메뉴
         settings_menu = menu_bar.addMenu("설정(&S)")
         settings_action = QAction("설정 열기", self)
@@ -1089,6 +1355,54 @@ class MainWindow(QMainWindow):  # type: ignore
             self._save_settings()
             self.apply_font_to_views(self.current_settings.font)
             self.apply_highlight_color_to_views(self.current_settings.highlight_color)
+            self.controller.set_translation_connection_limit(
+                self.current_settings.translation_connection_limit
+            )
+            self.controller.set_layout_cache_enabled(
+                self.current_settings.enable_layout_cache
+            )
+            raster_changed = self._apply_raster_background()
+            continuous_changed = self._apply_continuous_scroll()
+            if continuous_changed or (raster_changed and self._continuous):
+                # 연속 스크롤 모드에서는 보이는 페이지를 모두 다시 그려야 하므로
+                # 현재 페이지로 이동해 처음부터 그립니다.
+                self._page_view_models.clear()
+                self._show_pdf_page(self._current_page)
+            elif raster_changed and self._current_view_model:
+                self.display_page(self._current_view_model)
+
+    def _apply_raster_background(self) -> bool:
+        """
+        설정에 따라 원본 뷰의 페이지 이미지 표시 모드를 켜거나 끕니다.
+        모드가 바뀌었으면 True (현재 페이지를 다시 그려야 함)
+        """
+        renderer = (
+            self.controller.get_tile_renderer()
+            if self.current_settings.enable_raster_background
+            else None
+        )
+        return self.original_pdf_widget.set_tile_renderer(renderer)
+
+    def _apply_continuous_scroll(self, document_changed: bool = False) -> bool:
+        """
+        설정과 열린 문서에 따라 두 뷰의 연속 스크롤 모드를 켜거나 끕니다.
+        document_changed이면 새 문서의 페이지 크기로 자리를 다시 잡습니다.
+        모드가 바뀌었으면 True (현재 페이지를 다시 그려야 함)
+        """
+        enabled = bool(
+            self.current_settings.enable_continuous_scroll
+            and getattr(self, "_current_pdf", None) is not None
+        )
+        changed = enabled != self._continuous
+        if not changed and not (enabled and document_changed):
+            return False
+        page_sizes = self.controller.get_page_sizes() if enabled else None
+        self.original_pdf_widget.set_page_layout(page_sizes)
+        self.translated_pdf_widget.set_page_layout(page_sizes)
+        self._continuous = enabled
+        self._visible_pages = []
+        self._page_view_models.clear()
+        return changed
 
     def apply_highlight_color_to_views(self, color):
         if hasattr(self, "original_pdf_widget"):
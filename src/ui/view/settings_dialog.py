@@ -28,6 +28,10 @@ class SettingsDialog(QDialog):
             prefetch_page_count=current_settings.prefetch_page_count,
             preview_page_count=current_settings.preview_page_count,
             enable_highlighting=current_settings.enable_highlighting,
+            translation_connection_limit=current_settings.translation_connection_limit,
+            enable_layout_cache=current_settings.enable_layout_cache,
+            enable_raster_background=current_settings.enable_raster_background,
+            enable_continuous_scroll=current_settings.enable_continuous_scroll,
         )
         self._init_ui()
 
@@ -80,6 +84,22 @@ class SettingsDialog(QDialog):
         preview_layout.addStretch()
         main_layout.addLayout(preview_layout)
 
+        # 번역 서버 동시 연결 수 설정
+        connection_layout = QHBoxLayout()
+        connection_layout.addWidget(QLabel("번역 동시 연결 수:"))
+        self.connection_limit_spin = QSpinBox()
+        self.connection_limit_spin.setRange(1, 32)
+        self.connection_limit_spin.setValue(
+            self._new_settings.translation_connection_limit
+        )
+        self.connection_limit_spin.setSingleStep(1)
+        self.connection_limit_spin.valueChanged.connect(
+            self._on_connection_limit_changed
+        )
+        connection_layout.addWidget(self.connection_limit_spin)
+        connection_layout.addStretch()
+        main_layout.addLayout(connection_layout)
+
         # 하이라이트 기능 활성화 여부 설정
         highlight_enable_layout = QHBoxLayout()
         self.highlight_enable_checkbox = QCheckBox("하이라이트 기능 사용")
@@ -91,6 +111,44 @@ class SettingsDialog(QDialog):
         )
         highlight_enable_layout.addWidget(self.highlight_enable_checkbox)
         main_layout.addLayout(highlight_enable_layout)
+
+        # 페이지 구조 디스크 캐시 사용 여부 (다음에 여는 문서부터 적용)
+        layout_cache_layout = QHBoxLayout()
+        self.layout_cache_checkbox = QCheckBox("페이지 구조 디스크 캐시 사용")
+        self.layout_cache_checkbox.setChecked(self._new_settings.enable_layout_cache)
+        self.layout_cache_checkbox.stateChanged.connect(
+            self._on_layout_cache_enabled_changed
+        )
+        layout_cache_layout.addWidget(self.layout_cache_checkbox)
+        main_layout.addLayout(layout_cache_layout)
+
+        # 원본 페이지를 이미지로 표시 (벡터 그래픽/표/원본 글꼴이 그대로 보임)
+        raster_background_layout = QHBoxLayout()
+        self.raster_background_checkbox = QCheckBox(
+            "원본 페이지를 이미지로 표시 (벡터 그래픽/표/글꼴 유지)"
+        )
+        self.raster_background_checkbox.setChecked(
+            self._new_settings.enable_raster_background
+        )
+        self.raster_background_checkbox.stateChanged.connect(
+            self._on_raster_background_changed
+        )
+        raster_background_layout.addWidget(self.raster_background_checkbox)
+        main_layout.addLayout(raster_background_layout)
+
+        # 연속 스크롤 (페이지를 세로로 이어서 표시하고 보이는 페이지만 그림)
+        continuous_scroll_layout = QHBoxLayout()
+        self.continuous_scroll_checkbox = QCheckBox(
+            "연속 스크롤 (페이지를 이어서 표시)"
+        )
+        self.continuous_scroll_checkbox.setChecked(
+            self._new_settings.enable_continuous_scroll
+        )
+        self.continuous_scroll_checkbox.stateChanged.connect(
+            self._on_continuous_scroll_changed
+        )
+        continuous_scroll_layout.addWidget(self.continuous_scroll_checkbox)
+        main_layout.addLayout(continuous_scroll_layout)
         # 예시 텍스트 미리보기 (일부만 하이라이트)
         preview_layout = QHBoxLayout()
         preview_layout.addWidget(QLabel("미리보기:"))
@@ -128,9 +186,21 @@ class SettingsDialog(QDialog):
     def _on_preview_count_changed(self, value):
         self._new_settings.preview_page_count = value
 
+    def _on_connection_limit_changed(self, value):
+        self._new_settings.translation_connection_limit = value
+
     def _on_highlight_enabled_changed(self, state):
         self._new_settings.enable_highlighting = bool(state)
 
+    def _on_layout_cache_enabled_changed(self, state):
+        self._new_settings.enable_layout_cache = bool(state)
+
+    def _on_raster_background_changed(self, state):
+        self._new_settings.enable_raster_background = bool(state)
+
+    def _on_continuous_scroll_changed(self, state):
+        self._new_settings.enable_continuous_scroll = bool(state)
+
     def _update_highlight_color_preview(self, color: QColor):
         self.color_preview.setStyleSheet(
             f"background-color: {color.name()}; border: 1px solid black;"
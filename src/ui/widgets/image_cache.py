@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Set
+
+import fitz
+from PySide6.QtGui import QImage, QPixmap
+
+from src.common.utils import LruCache
+from src.infrastructure.pdf_parsing.image_decoder import DecodedImage, decode_image
+
+logger = logging.getLogger(__name__)
+
+# 디코딩한 이미지를 보관할 최대 개수 (문서 전체, 두 뷰 공유)
+DEFAULT_IMAGE_CACHE_SIZE = 64
+
+
+class SharedImageCache:
+    """
+    문서 하나의 이미지 xref → QPixmap LRU 캐시.
+    원본/번역 뷰가 같은 인스턴스를 받아 쓰므로, 두 뷰와 여러 페이지에 반복되는 이미지
+    (예: 페이지마다 있는 로고)는 한 번만 디코딩합니다.
+    decoder(xref -> DecodedImage 코루틴 함수)를 지정하면 request가 UI 스레드 밖에서
+    디코딩하고, UI 스레드는 받은 픽셀로 QPixmap을 만드는 일만 합니다.
+    decoder가 없으면 decode_now로 호출한 자리에서 디코딩합니다.
+    디코딩에 실패한 xref는 기록해 두고(is_failed), 스크롤할 때마다 다시 디코딩하지
+    않습니다. 문서가 바뀌면 새 캐시를 만들므로 그때 다시 시도합니다.
+    """
+
+    def __init__(
+        self,
+        pdf_doc: Optional[fitz.Document],
+        decoder: Optional[Callable[[int], Awaitable[Optional[DecodedImage]]]] = None,
+        max_entries: int = DEFAULT_IMAGE_CACHE_SIZE,
+    ):
+        self.pdf_doc = pdf_doc
+        self.decoder = decoder
+        self._pixmaps: LruCache[QPixmap] = LruCache(max_entries)
+        self._requests: Dict[int, asyncio.Future] = {}
+        self._failed: Set[int] = set()
+
+    def get(self, xref: int) -> Optional[QPixmap]:
+        return self._pixmaps.get(xref)
+
+    def is_failed(self, xref: int) -> bool:
+        """디코딩에 실패한 이미지인지 여부 (다시 요청하지 않습니다)"""
+        return xref in self._failed
+
+    def decode_now(self, xref: int) -> QPixmap:
+        """
+        이 스레드에서 바로 디코딩해 캐시에 넣습니다.
+        실패하거나 문서가 이미 닫혔으면 빈 QPixmap을 반환합니다.
+        """
+        if self.pdf_doc is None or self.pdf_doc.is_closed:
+            return QPixmap()
+        try:
+            pixmap = self._to_pixmap(decode_image(self.pdf_doc, xref))
+        except (RuntimeError, ValueError) as e:
+            self._record_failure(xref, e)
+            return QPixmap()
+        if pixmap.isNull():
+            self._record_failure(xref, "빈 이미지")
+        else:
+            self._pixmaps.put(xref, pixmap)
+        return pixmap
+
+    def _record_failure(self, xref: int, reason):
+        self._failed.add(xref)
+        logger.warning("이미지 디코딩 실패 xref %s: %s", xref, reason)
+
+    def request(self, xref: int) -> asyncio.Future:
+        """
+        decoder로 이미지 디코딩을 시작합니다. 결과가 캐시에 들어간 뒤 완료되는 Future를
+        반환하며, 같은 xref를 디코딩 중이면 그 Future를 그대로 반환합니다.
+        이벤트 루프 안에서 호출해야 합니다.
+        """
+        future = self._requests.get(xref)
+        if future is None:
+            future = asyncio.ensure_future(self.decoder(xref))
+            self._requests[xref] = future
+            future.add_done_callback(
+                lambda done, xref=xref: self._on_decoded(xref, done)
+            )
+        return future
+
+    def _on_decoded(self, xref: int, future: asyncio.Future):
+        if self._requests.get(xref) is future:
+            del self._requests[xref]
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self._record_failure(xref, future.exception())
+            return
+        decoded = future.result()
+        if decoded is None:
+            # 워커를 사용할 수 없으면 여기서 직접 디코딩합니다. (문서가 열려 있을 때만)
+            self.decode_now(xref)
+            return
+        pixmap = self._to_pixmap(decoded)
+        if pixmap.isNull():
+            self._record_failure(xref, "빈 이미지")
+        else:
+            self._pixmaps.put(xref, pixmap)
+
+    @staticmethod
+    def _to_pixmap(decoded: DecodedImage) -> QPixmap:
+        image = QImage(
+            decoded.samples,
+            decoded.width,
+            decoded.height,
+            decoded.stride,
+            getattr(QImage.Format, f"Format_{decoded.format}"),
+        )
+        # fromImage가 픽셀을 복사하므로 samples 버퍼가 사라져도 됩니다.
+        return QPixmap.fromImage(image)
+
+    def clear(self):
+        """캐시를 비우고 진행 중인 디코딩을 취소합니다. (문서를 닫을 때)"""
+        requests = list(self._requests.values())
+        self._requests.clear()
+        for future in requests:
+            future.cancel()
+        self._pixmaps.clear()
+        self._failed.clear()
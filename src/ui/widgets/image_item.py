@@ -6,6 +6,8 @@ class ImageItem(QGraphicsPixmapItem):
         super().__init__(parent)
         self.image_data = image_data
         self.setPos(image_data.rect.topLeft())
+        # 하이라이트 오버레이(-1)와 텍스트 아래에 표시합니다. (추가된 순서와 무관하게)
+        self.setZValue(-2)
         self.loaded = False
 
     def load_pixmap(self, pixmap: QPixmap):
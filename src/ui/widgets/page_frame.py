@@ -0,0 +1,83 @@
+from typing import Dict, List, Optional
+
+from PySide6.QtCore import QRectF, Qt
+from PySide6.QtGui import QBrush, QColor, QPen
+from PySide6.QtWidgets import QGraphicsRectItem
+
+from src.common.spatial_index import GridSpatialIndex
+from src.infrastructure.dtos.pdf_view_dtos import SegmentViewData
+
+from .image_item import ImageItem
+
+
+class PageFrame(QGraphicsRectItem):
+    """
+    씬에 배치한 한 페이지.
+    페이지의 텍스트/이미지/타일 아이템은 이 아이템의 자식으로 페이지 좌표 그대로 두고,
+    페이지를 씬의 어디에 놓을지는 이 아이템의 위치로 정합니다. (연속 스크롤 모드에서
+    페이지 크기가 바뀌어 아래 페이지들을 옮길 때 자식 아이템은 손대지 않아도 됩니다)
+    위치로 세그먼트를 찾는 공간 인덱스와 이미지 아이템 목록도 페이지마다 둡니다.
+    """
+
+    def __init__(self, page_number: Optional[int], width: float, height: float):
+        super().__init__(0, 0, width, height)
+        self.page_number = page_number
+        self.segments: Dict[str, SegmentViewData] = {}
+        self.image_items: List[ImageItem] = []
+        self.raster = False  # 페이지를 이미지 타일로 표시하는지 여부
+        self._segment_index = GridSpatialIndex()
+        self._stale_index_entries = 0
+        self.setBrush(QBrush(QColor("#ffffff")))
+        self.setPen(QPen(Qt.PenStyle.NoPen))
+
+    def set_border(self, color: Optional[str]):
+        """페이지 테두리 색 (None이면 테두리 없음)"""
+        if color is None:
+            self.setPen(QPen(Qt.PenStyle.NoPen))
+        else:
+            pen = QPen(QColor(color))
+            pen.setCosmetic(True)  # 확대/축소와 상관없이 1픽셀
+            self.setPen(pen)
+
+    def add_segment(self, segment_data: SegmentViewData):
+        self.segments[segment_data.segment_id] = segment_data
+        self._index(segment_data)
+
+    def remove_segment(self, segment_id: str) -> Optional[SegmentViewData]:
+        segment_data = self.segments.pop(segment_id, None)
+        if segment_data is not None:
+            # 공간 인덱스는 항목을 지우지 않으므로, 지운 항목이 쌓이면 다시 만듭니다.
+            self._stale_index_entries += 1
+            if self._stale_index_entries > len(self.segments):
+                self._segment_index = GridSpatialIndex()
+                self._stale_index_entries = 0
+                for live in self.segments.values():
+                    self._index(live)
+        return segment_data
+
+    def _index(self, segment_data: SegmentViewData):
+        x, y, width, height = segment_data.bounds
+        # 크기가 없는 세그먼트도 찾을 수 있도록 최소 크기를 줍니다.
+        self._segment_index.insert(
+            (x, y, x + max(width, 1.0), y + max(height, 1.0)), segment_data
+        )
+
+    def segments_in(self, scene_rect: QRectF) -> List[SegmentViewData]:
+        """씬 좌표 영역과 겹치는 이 페이지의 세그먼트"""
+        rect = scene_rect.translated(-self.pos())
+        return [
+            segment_data
+            for segment_data in self._segment_index.query(
+                (rect.left(), rect.top(), rect.right(), rect.bottom())
+            )
+            if self.segments.get(segment_data.segment_id) is segment_data
+        ]
+
+    def scene_rect_of(self, segment_data: SegmentViewData) -> QRectF:
+        """세그먼트가 차지하는 씬 좌표 영역"""
+        x, y, width, height = segment_data.bounds
+        return QRectF(x + self.x(), y + self.y(), max(width, 1.0), max(height, 1.0))
+
+    def local_rect(self, scene_rect: QRectF) -> QRectF:
+        """씬 좌표 영역 중 이 페이지 안에 있는 부분 (페이지 좌표)"""
+        return scene_rect.translated(-self.pos()).intersected(self.rect())
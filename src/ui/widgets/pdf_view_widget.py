@@ -1,31 +1,56 @@
-from typing import Dict, List, Optional
+import asyncio
+import bisect
+import logging
+import math
+from collections import deque
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import fitz
-from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtCore import QEvent, QPointF, QRectF, Qt, QTimer, Signal
 from PySide6.QtGui import (
     QBrush,
     QColor,
     QFont,
+    QImage,
     QPainter,
     QPixmap,
-    QTextCharFormat,
-    QTextCursor,
+    QTransform,
 )
 from PySide6.QtWidgets import (
+    QGraphicsItem,
+    QGraphicsPixmapItem,
     QGraphicsScene,
-    QGraphicsTextItem,
     QGraphicsView,
     QSizePolicy,
     QVBoxLayout,
     QWidget,
 )
 
+from src.common.utils import LruCache
 from src.infrastructure.dtos.pdf_view_dtos import ImageViewData, SegmentViewData
 
 from .highlight_overlay import HighlightOverlay
+from .image_cache import SharedImageCache
 from .image_item import ImageItem
+from .page_frame import PageFrame
+from .static_text_segment_item import StaticTextSegmentItem
 from .text_segment_item import TextSegmentItem
 
+logger = logging.getLogger(__name__)
+
+# 페이지 타일 키: (페이지 번호, 렌더링 배율, 타일 열, 타일 행)
+TileKey = Tuple[int, float, int, int]
+
 # --- DTOs (Data Transfer Objects) - 클래스 다이어그램에서 정의된 뷰 모델 활용 ---
 # class SegmentViewData:
 #     def __init__(self, segment_id: str, text: str, rect: Tuple[float, float, float, float],
@@ -68,24 +93,75 @@ from .text_segment_item import TextSegmentItem
 
 class PdfViewWidget(QWidget):
     """
-    단일 PDF 페이지를 렌더링하고 텍스트 세그먼트 상호작용을 처리하는 위젯.
+    PDF 페이지를 렌더링하고 텍스트 세그먼트 상호작용을 처리하는 위젯.
+    기본은 한 페이지만 표시하고, set_page_layout으로 문서의 페이지를 세로로 이어 붙여
+    스크롤하는 연속 스크롤 모드로 바꿀 수 있습니다. 페이지마다 PageFrame을 하나 두고
+    그 페이지의 아이템을 모두 자식으로 둡니다.
     """
 
+    # 검색 결과 표시 색상 (호버 하이라이트와 구분)
+    SEARCH_MATCH_COLOR = "#ffa94d"
+    # 텍스트 아이템을 미리 만들어 둘 뷰포트 바깥 여유 (뷰포트 크기에 대한 비율)
+    VIEWPORT_MARGIN = 0.5
+    # 이벤트 루프 한 번에 만들 텍스트 아이템 수 (줄이 많은 페이지를 여는 동안 UI가 멈추지 않도록)
+    MATERIALIZE_BATCH = 200
+    # 페이지 이미지 타일 한 변의 픽셀 수
+    TILE_SIZE = 512
+    # 메모리에 보관할 타일 수 (512x512 RGB 타일 하나는 약 0.75MB)
+    TILE_CACHE_SIZE = 64
+    # 연속 스크롤 모드의 페이지 사이 간격(씬 좌표)과 배경/테두리 색
+    PAGE_GAP = 12.0
+    PAGE_GAP_COLOR = "#d0d0d0"
+    PAGE_BORDER_COLOR = "#a0a0a0"
+    # 연속 스크롤 모드에서 미리 그려 둘 뷰포트 위아래 여유 (뷰포트 높이에 대한 비율)
+    PAGE_PRELOAD_MARGIN = 1.0
+
     segmentHovered = Signal(str, object)
     # 뷰 동기화를 위한 시그널
     zoom_in_requested = Signal()
     zoom_out_requested = Signal()
     linkClicked = Signal(str)  # linkClicked 시그널 추가
     fileDropped = Signal(str)  # PDF 파일 드롭 시그널 추가
+    # 연속 스크롤 모드에서 (뷰포트 가운데의 페이지, 뷰포트 근처의 페이지 목록)이 바뀔 때
+    visiblePagesChanged = Signal(int, list)
 
     def __init__(self, view_context: str, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.view_context = view_context
+        # 표시 중인 모든 페이지의 세그먼트. 텍스트 아이템(_text_items)은 뷰포트 근처의
+        # 세그먼트만 만들어 두고, 스크롤/확대로 보이는 영역이 바뀌면 새로 만들거나 제거합니다.
         self._current_segments_on_display: Dict[str, SegmentViewData] = {}
-        self._text_items: Dict[str, QGraphicsTextItem] = {}
-        self._image_items: List[ImageItem] = []
+        self._text_items: Dict[str, QGraphicsItem] = {}
+        # 표시 중인 페이지 (한 페이지 모드에서는 하나뿐)와 세그먼트가 속한 페이지
+        self._frames: Dict[Optional[int], PageFrame] = {}
+        self._segment_frames: Dict[str, PageFrame] = {}
+        self._materialized_area: Optional[QRectF] = None  # 아이템을 만들어 둔 씬 영역
+        self._pending_segment_ids: Deque[str] = deque()  # 아이템을 만들 차례인 세그먼트
+        self._display_font: Optional[QFont] = None
+        self._highlight_overlays: Dict[str, HighlightOverlay] = {}
+        # 검색 결과로 표시할 세그먼트 ID와 그 표시 오버레이 (페이지를 다시 그려도 유지)
+        self._search_match_ids: Set[str] = set()
+        self._search_overlays: Dict[str, HighlightOverlay] = {}
         self._pdf_doc: Optional[fitz.Document] = None
+        # 문서의 이미지 xref → QPixmap 캐시 (set_image_cache로 다른 뷰와 공유합니다)
+        self._image_cache: Optional[SharedImageCache] = None
+        self._image_requests: Dict[int, asyncio.Future] = {}
+        # 연속 스크롤 모드의 페이지 크기와 씬에서의 위쪽 좌표 (한 페이지 모드에서는 None)
+        self._page_sizes: Optional[List[Tuple[float, float]]] = None
+        self._page_tops: List[float] = []
+        self._visible_pages_state: Optional[tuple] = (
+            None  # 마지막으로 알린 보이는 페이지
+        )
+        # 페이지를 이미지 타일로 표시하는 모드 (set_tile_renderer로 켭니다)
+        self._tile_renderer: Optional[Callable] = None
+        self._tile_cache: LruCache[QPixmap] = LruCache(self.TILE_CACHE_SIZE)
+        self._tile_items: Dict[TileKey, QGraphicsPixmapItem] = {}
+        self._tile_requests: Dict[TileKey, asyncio.Future] = {}
+        # 렌더링에 실패한 타일. 배율이나 문서가 바뀔 때까지 다시 요청하지 않습니다.
+        self._failed_tiles: Set[TileKey] = set()
+        # 마지막으로 타일을 맞춘 배율/범위
+        self._tile_view_state: Optional[tuple] = None
         self.setAcceptDrops(True)  # 드래그&드롭 허용
 
         # 지연 로딩을 위한 타이머 설정 (디바운싱)
@@ -94,6 +170,28 @@ class PdfViewWidget(QWidget):
         self._lazy_load_timer.setInterval(100)  # 100ms
         self._lazy_load_timer.timeout.connect(self._load_visible_images)
 
+        # 보이는 영역이 바뀐 뒤 텍스트 아이템을 갱신하고, 나눠서 만들기 위한 타이머
+        self._visible_update_timer = QTimer(self)
+        self._visible_update_timer.setSingleShot(True)
+        self._visible_update_timer.setInterval(0)
+        self._visible_update_timer.timeout.connect(self._update_visible_segments)
+        self._materialize_timer = QTimer(self)
+        self._materialize_timer.setSingleShot(True)
+        self._materialize_timer.setInterval(0)
+        self._materialize_timer.timeout.connect(self._materialize_pending_segments)
+
+        # 확대/축소하는 동안 중간 배율의 타일을 요청하지 않도록 잠시 기다렸다가 갱신합니다.
+        self._tile_update_timer = QTimer(self)
+        self._tile_update_timer.setSingleShot(True)
+        self._tile_update_timer.setInterval(50)
+        self._tile_update_timer.timeout.connect(self._update_tiles)
+
+        # 그리는 도중에 시그널을 받는 쪽이 씬을 바꾸지 않도록 다음 이벤트 루프에서 알립니다.
+        self._visible_pages_timer = QTimer(self)
+        self._visible_pages_timer.setSingleShot(True)
+        self._visible_pages_timer.setInterval(0)
+        self._visible_pages_timer.timeout.connect(self._emit_visible_pages)
+
         self._current_highlight_color = QColor("#ffffcc")  # 기본 하이라이트 색상
 
         self._init_ui()
@@ -124,6 +222,9 @@ class PdfViewWidget(QWidget):
         self.graphics_view.horizontalScrollBar().valueChanged.connect(
             self.schedule_lazy_load
         )
+        # 스크롤, 확대, 외부의 setTransform 등 보이는 영역을 바꾸는 모든 경우에 다시
+        # 그려지므로, 그릴 때 텍스트 아이템이 보이는 영역을 덮는지 확인합니다.
+        self.graphics_view.viewport().installEventFilter(self)
         self.layout.addWidget(self.graphics_view)
         self.setLayout(self.layout)
         self.graphics_scene.setBackgroundBrush(QBrush(QColor("#ffffff")))
@@ -135,57 +236,635 @@ class PdfViewWidget(QWidget):
         page_width: float,
         page_height: float,
         pdf_doc: Optional[fitz.Document],
+        page_number: Optional[int] = None,
     ):
         """
         주어진 세그먼트와 이미지 목록을 기반으로 페이지 내용을 렌더링합니다.
         페이지의 실제 크기를 기준으로 Scene의 좌표계를 설정합니다.
         지연 로딩을 위해 pdf_doc 객체를 받습니다.
+        같은 문서를 다시 그릴 때는 씬을 비우지 않고, 화면의 아이템과 새 목록을
+        segment_id(이미지는 xref와 위치)로 비교하여 바뀐 아이템만 추가/제거/교체합니다.
+        (예: 번역이 끝나 번역 뷰를 다시 그릴 때 바뀐 블록만 다시 만들고,
+         이미 불러온 이미지는 그대로 재사용합니다)
+        타일 렌더러가 지정되어 있고 page_number(0부터 시작)를 받으면 페이지를 이미지
+        타일로 그리고, 텍스트 아이템은 글자 없이 호버/하이라이트만 처리합니다.
+        연속 스크롤 모드에서는 page_number 페이지의 자리에 그리고, 다른 페이지와
+        보이는 위치/확대 배율은 그대로 둡니다.
         """
+        if pdf_doc is not self._pdf_doc:
+            # 다른 문서의 xref는 의미가 없으므로 처음부터 다시 그립니다.
+            self._clear_scene()
+        self._pdf_doc = pdf_doc
+        if self._image_cache is None or self._image_cache.pdf_doc is not pdf_doc:
+            self._image_cache = SharedImageCache(pdf_doc)
+
+        if self._page_sizes is not None:
+            if page_number is None or not 0 <= page_number < len(self._page_sizes):
+                return
+            frame = self._place_page(page_number, page_width, page_height)
+        else:
+            # 한 페이지 모드에서는 다른 페이지를 지우고 씬을 페이지 크기로 맞춥니다.
+            for other in [key for key in self._frames if key != page_number]:
+                self.remove_page(other)
+            frame = self._frames.get(page_number)
+            if frame is None:
+                frame = self._add_frame(page_number, page_width, page_height)
+            else:
+                frame.setRect(0, 0, page_width, page_height)
+            # 페이지의 실제 크기로 씬의 영역을 설정합니다. 이것이 좌표계의 기준이 됩니다.
+            if page_width > 0 and page_height > 0:
+                self.graphics_scene.setSceneRect(0, 0, page_width, page_height)
+
+        raster = (
+            self._tile_renderer is not None
+            and pdf_doc is not None
+            and page_number is not None
+        )
+        if raster != frame.raster:
+            frame.raster = raster
+            # 캐시한 타일은 페이지로 돌아왔을 때 다시 쓰도록 남겨 둡니다.
+            self._remove_page_tiles(page_number)
+            for segment_id in frame.segments:
+                text_item = self._text_items.get(segment_id)
+                if text_item is not None:
+                    text_item.set_text_visible(not raster)
+
+        # 페이지 이미지에 이미 그려지는 이미지는 따로 불러오지 않습니다.
+        self._reconcile_images(frame, [] if raster else images)
+        self._reconcile_segments(frame, segments)
+        if self._page_sizes is None:
+            # 씬의 크기가 페이지 크기로 고정되었으므로, 뷰를 여기에 맞춥니다.
+            self.fit_to_view()  # 모든 아이템이 추가된 후 뷰에 맞춤
+        self._update_visible_segments()
+        self._update_tiles()
+        self.schedule_lazy_load()  # 새로 추가된 이미지 중 보이는 것을 로드
+
+    def _add_frame(
+        self, page_number: Optional[int], page_width: float, page_height: float
+    ) -> PageFrame:
+        frame = PageFrame(page_number, page_width, page_height)
+        self.graphics_scene.addItem(frame)
+        self._frames[page_number] = frame
+        return frame
+
+    def _clear_scene(self):
         self.graphics_scene.clear()
         self._current_segments_on_display.clear()
         self._text_items.clear()
-        self._image_items.clear()
-        self._pdf_doc = pdf_doc
+        self._frames.clear()
+        self._segment_frames.clear()
+        self._materialized_area = None
+        self._pending_segment_ids.clear()
+        self._materialize_timer.stop()
+        self._highlight_overlays.clear()
+        self._search_overlays.clear()
+        self._tile_items.clear()
+        self._cancel_tile_requests()
+        self._tile_cache.clear()
+        self._failed_tiles.clear()
+        self._tile_view_state = None
+        self._visible_pages_state = None
+        self._image_requests.clear()
+
+    def remove_page(self, page_number: Optional[int]):
+        """페이지의 아이템을 모두 지웁니다. (연속 스크롤 모드에서 화면에서 멀어진 페이지)"""
+        frame = self._frames.pop(page_number, None)
+        if frame is None:
+            return
+        for segment_id in frame.segments:
+            self._current_segments_on_display.pop(segment_id, None)
+            self._segment_frames.pop(segment_id, None)
+            self._text_items.pop(segment_id, None)
+            self._highlight_overlays.pop(segment_id, None)
+            self._search_overlays.pop(segment_id, None)
+        self._remove_page_tiles(page_number)
+        # 자식 아이템(텍스트, 오버레이, 이미지, 타일)도 함께 씬에서 빠집니다.
+        self.graphics_scene.removeItem(frame)
+
+    def displayed_pages(self) -> List[int]:
+        """아이템을 그려 둔 페이지 번호 (0부터 시작)"""
+        return sorted(key for key in self._frames if key is not None)
+
+    def set_page_layout(self, page_sizes: Optional[Sequence[Tuple[float, float]]]):
+        """
+        연속 스크롤 모드를 켜거나(문서의 페이지별 (너비, 높이) 목록) 끕니다(None).
+        연속 스크롤 모드에서는 모든 페이지의 자리를 세로로 이어 붙인 씬에 render_page로
+        받은 페이지만 제자리에 그립니다. 뷰포트 근처의 페이지가 바뀌면
+        visiblePagesChanged가 발생하므로, 받는 쪽에서 근처 페이지를 그리고 멀어진
+        페이지는 remove_page로 지웁니다.
+        """
+        self._clear_scene()
+        if page_sizes is None:
+            self._page_sizes = None
+            self._page_tops = []
+            self.graphics_scene.setBackgroundBrush(QBrush(QColor("#ffffff")))
+            return
+        self._page_sizes = [
+            (float(width), float(height)) for width, height in page_sizes
+        ]
+        self._layout_pages()
+        self.graphics_scene.setBackgroundBrush(QBrush(QColor(self.PAGE_GAP_COLOR)))
+        self.fit_to_view()
+        self.graphics_view.verticalScrollBar().setValue(
+            self.graphics_view.verticalScrollBar().minimum()
+        )
+
+    @property
+    def is_continuous(self) -> bool:
+        return self._page_sizes is not None
+
+    def _layout_pages(self):
+        """페이지 크기로 각 페이지의 위치와 씬의 크기를 다시 계산합니다."""
+        self._page_tops = []
+        top = 0.0
+        for _, height in self._page_sizes:
+            self._page_tops.append(top)
+            top += height + self.PAGE_GAP
+        width = max((width for width, _ in self._page_sizes), default=0.0)
+        height = max(0.0, top - self.PAGE_GAP)
+        self.graphics_scene.setSceneRect(0, 0, width, height)
+        for page_number, frame in self._frames.items():
+            frame.setPos(self._page_position(page_number))
+        self._visible_pages_state = None
 
-        # 페이지의 실제 크기로 씬의 영역을 설정합니다. 이것이 좌표계의 기준이 됩니다.
+    def _page_position(self, page_number: int) -> QPointF:
+        # 폭이 좁은 페이지는 가운데에 놓습니다.
+        page_width = self._page_sizes[page_number][0]
+        return QPointF(
+            (self.graphics_scene.sceneRect().width() - page_width) / 2,
+            self._page_tops[page_number],
+        )
+
+    def _place_page(
+        self, page_number: int, page_width: float, page_height: float
+    ) -> PageFrame:
+        """연속 스크롤 모드에서 페이지 자리에 PageFrame을 놓습니다."""
         if page_width > 0 and page_height > 0:
-            self.graphics_scene.setSceneRect(0, 0, page_width, page_height)
+            width, height = self._page_sizes[page_number]
+            if abs(width - page_width) > 0.5 or abs(height - page_height) > 0.5:
+                # 미리 받은 크기와 실제 크기가 다르면 아래 페이지들을 옮깁니다.
+                self._page_sizes[page_number] = (page_width, page_height)
+                self._layout_pages()
+        else:
+            page_width, page_height = self._page_sizes[page_number]
+        frame = self._frames.get(page_number)
+        if frame is None:
+            frame = self._add_frame(page_number, page_width, page_height)
+            frame.set_border(self.PAGE_BORDER_COLOR)
+        else:
+            frame.setRect(0, 0, page_width, page_height)
+        frame.setPos(self._page_position(page_number))
+        return frame
 
-        # 이미지 렌더링 (텍스트보다 먼저 그려서 텍스트 아래에 위치하도록 함)
-        for image_data in images:
-            image_item = ImageItem(image_data)
-            self.graphics_scene.addItem(image_item)
-            self._image_items.append(image_item)
+    def _page_at(self, y: float) -> int:
+        """씬 y 좌표에 있는 (페이지 사이 간격이면 바로 위) 페이지"""
+        return max(0, bisect.bisect_right(self._page_tops, y) - 1)
+
+    def _pages_between(self, top: float, bottom: float) -> List[int]:
+        pages = []
+        for page_number in range(self._page_at(top), len(self._page_tops)):
+            page_top = self._page_tops[page_number]
+            if page_top > bottom:
+                break
+            if page_top + self._page_sizes[page_number][1] >= top:
+                pages.append(page_number)
+        return pages
 
-        if not segments:
-            self.fit_to_view()
-            self.schedule_lazy_load()  # 텍스트가 없어도 이미지는 로드
+    def _visible_pages(self) -> tuple:
+        visible = self._visible_scene_rect()
+        margin = visible.height() * self.PAGE_PRELOAD_MARGIN
+        return (
+            min(self._page_at(visible.center().y()), len(self._page_tops) - 1),
+            self._pages_between(visible.top() - margin, visible.bottom() + margin),
+        )
+
+    def _emit_visible_pages(self):
+        if not self._page_tops:
+            return
+        state = self._visible_pages()
+        if state != self._visible_pages_state:
+            self._visible_pages_state = state
+            current_page, pages = state
+            self.visiblePagesChanged.emit(current_page, pages)
+
+    def scroll_to_page(self, page_number: int):
+        """연속 스크롤 모드에서 페이지의 위쪽이 뷰포트 위에 오도록 스크롤합니다."""
+        if not 0 <= page_number < len(self._page_tops):
             return
+        visible = self._visible_scene_rect()
+        self.graphics_view.centerOn(
+            visible.center().x(), self._page_tops[page_number] + visible.height() / 2
+        )
+
+    def _reconcile_images(self, frame: PageFrame, images: List[ImageViewData]):
+        """같은 xref가 같은 위치에 있는 이미지 아이템은 불러온 pixmap과 함께 재사용합니다."""
+        reusable: Dict[tuple, List[ImageItem]] = {}
+        for item in frame.image_items:
+            key = (item.image_data.xref, item.image_data.bounds)
+            reusable.setdefault(key, []).append(item)
+        image_items = []
+        for image_data in images:
+            candidates = reusable.get((image_data.xref, image_data.bounds))
+            if candidates:
+                image_items.append(candidates.pop())
+                continue
+            image_items.append(ImageItem(image_data, frame))
+        for candidates in reusable.values():
+            for item in candidates:
+                self.graphics_scene.removeItem(item)
+        frame.image_items = image_items
+
+    def _reconcile_segments(self, frame: PageFrame, segments: List[SegmentViewData]):
+        """표시 내용(display_key)이 같은 세그먼트 아이템은 그대로 두고 나머지만 교체합니다."""
+        new_ids = {segment_data.segment_id for segment_data in segments}
+        stale_ids = [
+            segment_id for segment_id in frame.segments if segment_id not in new_ids
+        ]
+        for segment_id in stale_ids:
+            self._remove_segment_item(segment_id)
         for segment_data in segments:
-            # 하이라이트 오버레이 분리 적용
-            if segment_data.is_highlighted:
-                overlay = HighlightOverlay(segment_data.rect)
-                self.graphics_scene.addItem(overlay)
+            current = self._current_segments_on_display.get(segment_data.segment_id)
+            if current is not None:
+                if (
+                    current is segment_data
+                    or current.display_key() == segment_data.display_key()
+                ):
+                    continue
+                self._remove_segment_item(segment_data.segment_id)
+            self._add_segment_item(frame, segment_data)
+
+    def _add_segment_item(self, frame: PageFrame, segment_data: SegmentViewData):
+        """
+        세그먼트를 페이지에 추가합니다. 텍스트 아이템은 세그먼트가 아이템을 만들어 둔
+        영역 안에 있을 때만 (다음 이벤트 루프에서) 만듭니다.
+        """
+        # 하이라이트 오버레이 분리 적용
+        if segment_data.is_highlighted:
+            overlay = HighlightOverlay(segment_data.rect, parent=frame)
+            self._highlight_overlays[segment_data.segment_id] = overlay
+        self._current_segments_on_display[segment_data.segment_id] = segment_data
+        self._segment_frames[segment_data.segment_id] = frame
+        frame.add_segment(segment_data)
+        if segment_data.segment_id in self._search_match_ids:
+            self._add_search_overlay(segment_data)
+        area = self._materialized_area
+        if area is not None and frame.scene_rect_of(segment_data).intersects(area):
+            self._pending_segment_ids.append(segment_data.segment_id)
+            self._materialize_timer.start()
+
+    def _remove_segment_item(self, segment_id: str):
+        text_item = self._text_items.pop(segment_id, None)
+        if text_item is not None:
+            self.graphics_scene.removeItem(text_item)
+        overlay = self._highlight_overlays.pop(segment_id, None)
+        if overlay is not None:
+            self.graphics_scene.removeItem(overlay)
+        search_overlay = self._search_overlays.pop(segment_id, None)
+        if search_overlay is not None:
+            self.graphics_scene.removeItem(search_overlay)
+        self._current_segments_on_display.pop(segment_id, None)
+        frame = self._segment_frames.pop(segment_id, None)
+        if frame is not None:
+            frame.remove_segment(segment_id)
+
+    def _segment_scene_rect(self, segment_data: SegmentViewData) -> QRectF:
+        return self._segment_frames[segment_data.segment_id].scene_rect_of(segment_data)
+
+    def _create_text_item(self, segment_data: SegmentViewData):
+        # 링크가 있는 세그먼트만 클릭을 처리하는 QGraphicsTextItem 기반 아이템을 쓰고,
+        # 나머지는 미리 배치한 텍스트를 그리기만 하는 가벼운 아이템을 씁니다.
+        if segment_data.link_uri:
             text_item = TextSegmentItem(segment_data)
-            text_item.set_highlight_color(
-                self._current_highlight_color
-            )  # 하이라이트 색상 적용
-            if segment_data.link_uri:
-                text_item.linkActivated.connect(self._on_link_activated)
-            self.graphics_scene.addItem(text_item)
-            self._text_items[segment_data.segment_id] = text_item
-            self._current_segments_on_display[segment_data.segment_id] = segment_data
-        # 씬의 크기가 페이지 크기로 고정되었으므로, 뷰를 여기에 맞춥니다.
-        self.fit_to_view()  # 모든 아이템이 추가된 후 뷰에 맞춤
-        self.schedule_lazy_load()  # 초기 렌더링 후 보이는 이미지 로드
+            text_item.linkActivated.connect(self._on_link_activated)
+        else:
+            text_item = StaticTextSegmentItem(segment_data)
+        text_item.set_highlight_color(
+            self._current_highlight_color
+        )  # 하이라이트 색상 적용
+        if self._display_font is not None:
+            text_item.setFont(self._display_font)
+        frame = self._segment_frames[segment_data.segment_id]
+        if frame.raster:
+            text_item.set_text_visible(False)
+        text_item.setParentItem(frame)
+        self._text_items[segment_data.segment_id] = text_item
+
+    def _visible_scene_rect(self) -> QRectF:
+        return self.graphics_view.mapToScene(
+            self.graphics_view.viewport().rect()
+        ).boundingRect()
+
+    def _segments_in(self, rect: QRectF) -> List[SegmentViewData]:
+        return [
+            segment_data
+            for frame in self._frames.values()
+            if frame.sceneBoundingRect().intersects(rect)
+            for segment_data in frame.segments_in(rect)
+        ]
+
+    def _needs_visible_update(self) -> bool:
+        area = self._materialized_area
+        if area is None:
+            return bool(self._current_segments_on_display)
+        visible = self._visible_scene_rect()
+        if not area.contains(visible.intersected(self.graphics_scene.sceneRect())):
+            return True
+        # 크게 확대한 뒤에는 멀리 떨어진 아이템을 정리합니다.
+        return area.width() > 4 * visible.width() or (
+            area.height() > 4 * visible.height()
+        )
+
+    def _update_visible_segments(self):
+        """
+        뷰포트와 그 주변 여유 영역의 세그먼트만 텍스트 아이템으로 만들고,
+        영역을 벗어난 아이템은 제거합니다. 아이템은 보이는 것부터 나눠서 만듭니다.
+        """
+        visible = self._visible_scene_rect()
+        margin_x = visible.width() * self.VIEWPORT_MARGIN
+        margin_y = visible.height() * self.VIEWPORT_MARGIN
+        area = visible.adjusted(-margin_x, -margin_y, margin_x, margin_y)
+        self._materialized_area = area
+        for segment_id, text_item in list(self._text_items.items()):
+            segment_data = self._current_segments_on_display.get(segment_id)
+            if segment_data is None or not self._segment_scene_rect(
+                segment_data
+            ).intersects(area):
+                del self._text_items[segment_id]
+                self.graphics_scene.removeItem(text_item)
+        pending: Deque[str] = deque()
+        queued: Set[str] = set()
+        for rect in (visible, area):
+            for segment_data in self._segments_in(rect):
+                segment_id = segment_data.segment_id
+                if segment_id not in self._text_items and segment_id not in queued:
+                    queued.add(segment_id)
+                    pending.append(segment_id)
+        self._pending_segment_ids = pending
+        self._materialize_pending_segments()
+
+    def _materialize_pending_segments(self):
+        area = self._materialized_area
+        created = 0
+        while self._pending_segment_ids and created < self.MATERIALIZE_BATCH:
+            segment_id = self._pending_segment_ids.popleft()
+            segment_data = self._current_segments_on_display.get(segment_id)
+            if (
+                segment_data is None
+                or segment_id in self._text_items
+                or area is None
+                or not self._segment_scene_rect(segment_data).intersects(area)
+            ):
+                continue
+            self._create_text_item(segment_data)
+            created += 1
+        if self._pending_segment_ids:
+            self._materialize_timer.start()
+
+    def eventFilter(self, watched, event):
+        if (
+            event.type() == QEvent.Type.Paint
+            and watched is self.graphics_view.viewport()
+        ):
+            if self._needs_visible_update():
+                self._visible_update_timer.start()
+            if self._has_raster_pages() and self._tile_view_changed():
+                self._tile_update_timer.start()
+            if self._page_tops and self._visible_pages() != self._visible_pages_state:
+                self._visible_pages_timer.start()
+        return super().eventFilter(watched, event)
+
+    def set_tile_renderer(self, renderer: Optional[Callable]) -> bool:
+        """
+        페이지를 이미지 타일로 표시하는 모드를 켜거나(renderer 지정) 끕니다(None).
+        renderer는 (page_number, zoom, clip) -> RenderedTile 코루틴 함수로,
+        UI 스레드 밖에서 페이지의 clip 영역을 렌더링합니다. 이 모드에서는 벡터 그래픽,
+        표, 원본 글꼴이 그대로 보입니다. 다음 render_page부터 적용됩니다.
+        모드가 바뀌었으면 True를 반환합니다. (페이지를 다시 그려야 함)
+        """
+        if renderer == self._tile_renderer:
+            return False
+        self._tile_renderer = renderer
+        self._clear_scene()
+        self._pdf_doc = None  # 다음 render_page에서 처음부터 다시 그립니다.
+        return True
+
+    def set_image_cache(self, image_cache: SharedImageCache):
+        """
+        다른 뷰와 함께 쓸 이미지 캐시를 지정합니다. 캐시의 문서를 그리는 동안 사용하며,
+        지정하지 않으면 이 뷰만 쓰는 캐시를 만들어 이미지를 바로 디코딩합니다.
+        """
+        self._image_cache = image_cache
+        self._image_requests.clear()
+
+    def _has_raster_pages(self) -> bool:
+        return any(frame.raster for frame in self._frames.values())
+
+    def _tile_zoom(self) -> float:
+        """
+        현재 확대 배율에 맞는 렌더링 배율. 조금 확대/축소할 때마다 다시 렌더링하지 않도록
+        배율을 2^(1/2) 단위로 올려서 묶습니다. (화면보다 흐리게 렌더링하지 않음)
+        """
+        scale = (
+            self.graphics_view.transform().m11()
+            * self.graphics_view.devicePixelRatioF()
+        )
+        if scale <= 0:
+            return 1.0
+        step = math.ceil(math.log2(scale) * 2 - 1e-6) / 2
+        return 2 ** min(max(step, -2.0), 3.0)
+
+    def _visible_tiles(self, zoom: float) -> List[Tuple[int, int, int]]:
+        """zoom 배율에서 뷰포트에 보이는 타일의 (페이지, 열, 행) 목록"""
+        visible = self._visible_scene_rect()
+        span = self.TILE_SIZE / zoom  # 타일 한 변의 페이지 좌표 길이
+        tiles = []
+        for frame in self._frames.values():
+            if not frame.raster:
+                continue
+            local = frame.local_rect(visible)
+            if local.isEmpty():
+                continue
+            first_x, first_y = int(local.left() // span), int(local.top() // span)
+            last_x = max(first_x, math.ceil(local.right() / span) - 1)
+            last_y = max(first_y, math.ceil(local.bottom() / span) - 1)
+            tiles.extend(
+                (frame.page_number, tile_x, tile_y)
+                for tile_y in range(first_y, last_y + 1)
+                for tile_x in range(first_x, last_x + 1)
+            )
+        return tiles
+
+    def _tile_view_changed(self) -> bool:
+        zoom = self._tile_zoom()
+        return (zoom, self._visible_tiles(zoom)) != self._tile_view_state
+
+    def _update_tiles(self):
+        """
+        보이는 타일을 현재 배율로 표시합니다. 캐시에 없는 타일은 렌더링을 요청하고,
+        렌더링이 끝나면 다시 호출됩니다. 보이는 타일이 모두 준비될 때까지는 이전 배율의
+        타일을 아래에 남겨 두어, 확대/축소하는 동안 페이지가 비어 보이지 않게 합니다.
+        """
+        if not self._has_raster_pages():
+            return
+        zoom = self._tile_zoom()
+        tiles = self._visible_tiles(zoom)
+        self._tile_view_state = (zoom, tiles)
+        self._failed_tiles = {key for key in self._failed_tiles if key[1] == zoom}
+        wanted = {
+            (page_number, zoom, tile_x, tile_y) for page_number, tile_x, tile_y in tiles
+        }
+        complete = True
+        for key in wanted:
+            if key in self._tile_items:
+                continue
+            pixmap = self._tile_cache.get(key)
+            if pixmap is None:
+                complete = False
+                if key not in self._tile_requests and key not in self._failed_tiles:
+                    self._request_tile(key)
+            else:
+                self._add_tile_item(key, pixmap)
+        for key in [key for key in self._tile_requests if key not in wanted]:
+            self._tile_requests.pop(key).cancel()
+        visible = self._visible_scene_rect()
+        for key, tile_item in list(self._tile_items.items()):
+            if key in wanted:
+                continue
+            if complete or not tile_item.sceneBoundingRect().intersects(visible):
+                del self._tile_items[key]
+                self.graphics_scene.removeItem(tile_item)
+            else:
+                tile_item.setZValue(-4)  # 새 배율의 타일 아래에 둡니다.
+
+    def _tile_clip(self, key: TileKey) -> Tuple[float, float, float, float]:
+        page_number, zoom, tile_x, tile_y = key
+        span = self.TILE_SIZE / zoom
+        page_rect = self._frames[page_number].rect()
+        return (
+            tile_x * span,
+            tile_y * span,
+            min((tile_x + 1) * span, page_rect.right()),
+            min((tile_y + 1) * span, page_rect.bottom()),
+        )
+
+    def _request_tile(self, key: TileKey):
+        page_number, zoom, _, _ = key
+        future = asyncio.ensure_future(
+            self._tile_renderer(page_number, zoom, self._tile_clip(key))
+        )
+        self._tile_requests[key] = future
+        future.add_done_callback(
+            lambda done, key=key: self._on_tile_rendered(key, done)
+        )
+
+    def _on_tile_rendered(self, key: TileKey, future: asyncio.Future):
+        if self._tile_requests.get(key) is not future:
+            return  # 취소되었거나 페이지/문서가 바뀐 뒤 도착한 결과
+        del self._tile_requests[key]
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logger.warning("페이지 타일 렌더링 실패 %s: %s", key, future.exception())
+            self._failed_tiles.add(key)
+            return
+        tile = future.result()
+        if tile is None:
+            return  # 렌더러를 사용할 수 없음 (다시 요청하지 않도록 갱신하지 않습니다)
+        image = QImage(
+            tile.samples,
+            tile.width,
+            tile.height,
+            tile.stride,
+            QImage.Format.Format_RGB888,
+        )
+        # fromImage가 픽셀을 복사하므로 samples 버퍼가 사라져도 됩니다.
+        self._tile_cache.put(key, QPixmap.fromImage(image))
+        self._update_tiles()
+
+    def _add_tile_item(self, key: TileKey, pixmap: QPixmap):
+        page_number, zoom, tile_x, tile_y = key
+        tile_item = QGraphicsPixmapItem(pixmap, self._frames[page_number])
+        tile_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        # 타일 픽셀을 페이지 좌표로 되돌립니다.
+        tile_item.setScale(1 / zoom)
+        span = self.TILE_SIZE / zoom
+        tile_item.setPos(tile_x * span, tile_y * span)
+        tile_item.setZValue(-3)  # 이미지 아이템과 텍스트 아이템 아래
+        self._tile_items[key] = tile_item
+
+    def _remove_page_tiles(self, page_number: Optional[int]):
+        for key in [key for key in self._tile_items if key[0] == page_number]:
+            self.graphics_scene.removeItem(self._tile_items.pop(key))
+        for key in [key for key in self._tile_requests if key[0] == page_number]:
+            self._tile_requests.pop(key).cancel()
+        self._tile_view_state = None
+
+    def _cancel_tile_requests(self):
+        requests = list(self._tile_requests.values())
+        self._tile_requests.clear()
+        for future in requests:
+            future.cancel()
+
+    def _add_search_overlay(self, segment_data: SegmentViewData):
+        overlay = HighlightOverlay(
+            segment_data.rect,
+            self.SEARCH_MATCH_COLOR,
+            parent=self._segment_frames[segment_data.segment_id],
+        )
+        self._search_overlays[segment_data.segment_id] = overlay
+
+    def set_search_matches(self, segment_ids: Iterable[str]):
+        """
+        검색 결과에 해당하는 세그먼트를 호버 하이라이트와 다른 색으로 표시합니다.
+        지정한 ID는 페이지를 다시 그리거나 블록이 교체되어도 계속 표시됩니다.
+        """
+        self._search_match_ids = set(segment_ids)
+        for overlay in self._search_overlays.values():
+            self.graphics_scene.removeItem(overlay)
+        self._search_overlays.clear()
+        for segment_id in self._search_match_ids:
+            segment_data = self._current_segments_on_display.get(segment_id)
+            if segment_data is not None:
+                self._add_search_overlay(segment_data)
+
+    def center_on_segment(self, segment_id: str) -> bool:
+        """세그먼트가 뷰 가운데에 보이도록 스크롤합니다. 세그먼트가 없으면 False."""
+        segment_data = self._current_segments_on_display.get(segment_id)
+        if segment_data is None:
+            return False
+        self.graphics_view.centerOn(self._segment_scene_rect(segment_data).center())
+        return True
+
+    def update_block_segments(
+        self, block_id: str, segments: List[SegmentViewData]
+    ) -> None:
+        """
+        페이지 전체를 다시 그리지 않고 한 블록의 세그먼트만 교체합니다.
+        (예: 번역이 도착한 블록의 줄 단위 자리표시자를 번역된 블록 세그먼트로 교체)
+        """
+        stale_ids = [
+            segment_id
+            for segment_id, segment_data in self._current_segments_on_display.items()
+            if segment_data.block_id == block_id
+        ]
+        if not stale_ids:
+            return  # 블록이 있는 페이지가 표시되어 있지 않습니다.
+        frame = self._segment_frames[stale_ids[0]]
+        for segment_id in stale_ids:
+            self._remove_segment_item(segment_id)
+        for segment_data in segments:
+            self._add_segment_item(frame, segment_data)
 
     def schedule_lazy_load(self):
         """보이는 이미지 로드를 위한 스케줄을 잡습니다 (디바운싱)."""
         self._lazy_load_timer.start()
 
     def _load_visible_images(self):
-        """현재 뷰포트에 보이는 이미지들의 Pixmap을 로드합니다."""
-        if not self._image_items or not self._pdf_doc:
+        """
+        현재 뷰포트에 보이는 이미지들의 Pixmap을 로드합니다.
+        캐시에 없는 이미지는 디코딩을 요청하고, 끝나면 그 xref를 쓰는 아이템에 넣습니다.
+        """
+        if not self._pdf_doc or self._image_cache is None:
             return
 
         # 씬 좌표계에서 현재 보이는 영역을 계산합니다.
@@ -193,56 +872,68 @@ class PdfViewWidget(QWidget):
             self.graphics_view.viewport().rect()
         ).boundingRect()
 
-        for item in self._image_items:
-            # 아이템이 보이고 아직 로드되지 않았다면 로드합니다.
-            # item.sceneBoundingRect()는 pixmap이 로드되기 전에는 비어있으므로,
-            # item.image_data.rect를 직접 사용하여 교차 검사를 수행합니다.
-            if not item.loaded and item.image_data.rect.intersects(visible_rect):
+        for frame in self._frames.values():
+            if not frame.image_items:
+                continue
+            local_rect = frame.local_rect(visible_rect)
+            for item in frame.image_items:
+                # 아이템이 보이고 아직 로드되지 않았다면 로드합니다.
+                # item.sceneBoundingRect()는 pixmap이 로드되기 전에는 비어있으므로,
+                # item.image_data.rect(페이지 좌표)를 직접 사용하여 교차 검사를 수행합니다.
+                if item.loaded or not item.image_data.rect.intersects(local_rect):
+                    continue
+                xref = item.image_data.xref
+                if xref in self._image_requests or self._image_cache.is_failed(xref):
+                    continue
                 try:
-                    base_image = self._pdf_doc.extract_image(item.image_data.xref)
-                    if not base_image:
-                        continue
-                    image_bytes = base_image["image"]
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(image_bytes)
-                    if not pixmap.isNull():
+                    pixmap = self._image_cache.get(xref)
+                    if pixmap is None and self._image_cache.decoder is None:
+                        pixmap = self._image_cache.decode_now(xref)
+                    if pixmap is None:
+                        self._request_image(xref)
+                    elif not pixmap.isNull():
                         item.load_pixmap(pixmap)
                 except Exception as e:
                     # 오류가 발생해도 전체가 멈추지 않도록 처리
-                    print(f"Error lazy-loading image xref {item.image_data.xref}: {e}")
+                    logger.warning("이미지 로드 실패 xref %s: %s", xref, e)
 
-    def _apply_highlight_format(
-        self, text_item: QGraphicsTextItem, highlight: bool, color: QColor = None
-    ):
-        """텍스트 아이템에 하이라이트 서식을 적용하거나 제거합니다."""
-        if color is None:
-            color = getattr(self, "_current_highlight_color", QColor("#ffffcc"))
-        cursor = QTextCursor(text_item.document())
-        cursor.select(QTextCursor.SelectionType.Document)
-        char_format = QTextCharFormat()
-        if highlight:
-            char_format.setBackground(QBrush(color))
-        else:
-            char_format.clearBackground()
-        cursor.setCharFormat(char_format)
+    def _request_image(self, xref: int):
+        future = self._image_cache.request(xref)
+        self._image_requests[xref] = future
+        future.add_done_callback(
+            lambda done, xref=xref: self._on_image_decoded(xref, done)
+        )
+
+    def _on_image_decoded(self, xref: int, future: asyncio.Future):
+        if self._image_requests.get(xref) is not future:
+            return  # 문서나 캐시가 바뀐 뒤 도착한 결과
+        del self._image_requests[xref]
+        pixmap = self._image_cache.get(xref)
+        if pixmap is None:
+            return  # 디코딩 실패 (캐시가 오류를 기록합니다)
+        # 같은 xref를 쓰는 다른 아이템(반복되는 로고 등)도 함께 채웁니다.
+        for frame in self._frames.values():
+            for item in frame.image_items:
+                if not item.loaded and item.image_data.xref == xref:
+                    item.load_pixmap(pixmap)
 
     def update_single_segment_highlight(self, segment_id: str, highlight: bool):
+        # 아이템이 아직 없는 세그먼트는 상태만 바꿔 두면 아이템을 만들 때 적용됩니다.
+        if segment_id in self._current_segments_on_display:
+            self._current_segments_on_display[segment_id].is_highlighted = highlight
         if segment_id in self._text_items:
-            text_item = self._text_items[segment_id]
-            self._apply_highlight_format(
-                text_item, highlight, self._current_highlight_color
-            )
-            if segment_id in self._current_segments_on_display:
-                self._current_segments_on_display[segment_id].is_highlighted = highlight
+            self._text_items[segment_id].set_highlighted(highlight)
 
     def get_segment_id_at_pos(self, x: float, y: float) -> Optional[str]:
         point = self.graphics_view.mapToScene(int(x), int(y))
         items = self.graphics_scene.items(point)
         for item in items:
-            if isinstance(item, QGraphicsTextItem):
-                for segment_id, text_item in self._text_items.items():
-                    if text_item == item:
-                        return segment_id
+            segment_data = getattr(item, "segment_data", None)
+            if segment_data is None:
+                continue
+            segment_id = segment_data.segment_id
+            if self._text_items.get(segment_id) is item:
+                return segment_id
         return None
 
     def _custom_mouse_move_event(self, event):
@@ -290,7 +981,15 @@ class PdfViewWidget(QWidget):
     def fit_to_view(self):
         """
         현재 scene의 콘텐츠를 view에 맞게 조정합니다.
+        연속 스크롤 모드에서는 가장 넓은 페이지의 폭을 뷰 폭에 맞춥니다.
         """
+        if self._page_sizes is not None:
+            scene_width = self.graphics_scene.sceneRect().width()
+            viewport_width = self.graphics_view.viewport().width()
+            if scene_width > 0 and viewport_width > 0:
+                scale = viewport_width / scene_width
+                self.graphics_view.setTransform(QTransform.fromScale(scale, scale))
+            return
         if not self.graphics_scene.sceneRect().isEmpty():
             self.graphics_view.fitInView(
                 self.graphics_scene.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio
@@ -329,6 +1028,7 @@ class PdfViewWidget(QWidget):
         """
         외부에서 전달된 QFont를 현재 표시 중인 모든 텍스트 세그먼트에 적용합니다.
         """
+        self._display_font = font  # 나중에 만들어지는 아이템에도 적용합니다.
         for text_item in self._text_items.values():
             text_item.setFont(font)
 
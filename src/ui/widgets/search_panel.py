@@ -0,0 +1,109 @@
+from typing import List, Optional
+
+from PySide6.QtCore import Qt, QTimer, Signal
+from PySide6.QtWidgets import (
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from src.core.use_cases.document_search_index import KIND_TRANSLATED, SearchHit
+
+# 결과 목록에 표시할 세그먼트 텍스트의 최대 길이
+_SNIPPET_LENGTH = 80
+
+
+class SearchPanel(QWidget):
+    """
+    문서 전체 검색 패널.
+    입력이 멈추면 searchRequested(검색어)를 보내고, 결과를 고르면 hitActivated(페이지, 세그먼트 ID)를 보냅니다.
+    색인이 진행되는 동안 refresh()를 부르면 같은 검색어로 결과를 주기적으로 다시 요청합니다.
+    """
+
+    searchRequested = Signal(str)
+    hitActivated = Signal(int, str)
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)  # 150ms
+        self._search_timer.timeout.connect(self._emit_search)
+        self._indexed_pages = 0
+        self._page_count = 0
+        self._hit_count = 0
+        self._init_ui()
+
+    def _init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        self.query_input = QLineEdit()
+        self.query_input.setPlaceholderText("문서에서 검색...")
+        self.query_input.setClearButtonEnabled(True)
+        # 입력할 때마다 검색하지 않고 입력이 멈추면 검색합니다 (디바운싱)
+        self.query_input.textChanged.connect(lambda _text: self._search_timer.start())
+        self.query_input.returnPressed.connect(self._emit_search)
+        layout.addWidget(self.query_input)
+        self.status_label = QLabel("")
+        layout.addWidget(self.status_label)
+        self.results_list = QListWidget()
+        self.results_list.itemActivated.connect(self._on_item_activated)
+        self.results_list.itemClicked.connect(self._on_item_activated)
+        layout.addWidget(self.results_list)
+
+    @property
+    def query(self) -> str:
+        return self.query_input.text().strip()
+
+    def focus_query(self):
+        self.query_input.setFocus()
+        self.query_input.selectAll()
+
+    def reset(self):
+        """새 문서를 열 때 결과와 색인 진행 상태를 지웁니다. 검색어는 유지합니다."""
+        self._indexed_pages = 0
+        self._page_count = 0
+        self.set_results([])
+
+    def refresh(self):
+        """현재 검색어로 다시 검색합니다. 호출이 잦아도 타이머 간격마다 한 번만 검색합니다."""
+        if self.query and not self._search_timer.isActive():
+            self._search_timer.start()
+
+    def set_progress(self, indexed_pages: int, page_count: int):
+        self._indexed_pages = indexed_pages
+        self._page_count = page_count
+        self._update_status()
+
+    def set_results(self, hits: List[SearchHit]):
+        self.results_list.clear()
+        for hit in hits:
+            text = " ".join(hit.text.split())
+            if len(text) > _SNIPPET_LENGTH:
+                text = text[: _SNIPPET_LENGTH - 1] + "…"
+            prefix = "[번역] " if hit.kind == KIND_TRANSLATED else ""
+            item = QListWidgetItem(f"p.{hit.page_number + 1}  {prefix}{text}")
+            item.setData(Qt.UserRole, (hit.page_number, hit.segment_id))
+            item.setToolTip(hit.text)
+            self.results_list.addItem(item)
+        self._hit_count = len(hits)
+        self._update_status()
+
+    def _update_status(self):
+        parts = []
+        if self._page_count and self._indexed_pages < self._page_count:
+            parts.append(f"색인 중 {self._indexed_pages}/{self._page_count} 페이지")
+        if self.query:
+            parts.append(f"결과 {self._hit_count}개")
+        self.status_label.setText(" · ".join(parts))
+
+    def _emit_search(self):
+        self._search_timer.stop()
+        self.searchRequested.emit(self.query)
+
+    def _on_item_activated(self, item: QListWidgetItem):
+        page_number, segment_id = item.data(Qt.UserRole)
+        self.hitActivated.emit(page_number, segment_id)
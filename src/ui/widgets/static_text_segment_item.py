@@ -0,0 +1,129 @@
+from typing import List
+
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QStaticText, QTransform
+from PySide6.QtWidgets import QGraphicsItem
+
+from src.infrastructure.dtos.pdf_view_dtos import SegmentViewData
+
+# QGraphicsTextItem(QTextDocument)의 기본 문서 여백과 같게 맞춰 두 아이템의 배치를 같게 합니다.
+_DOCUMENT_MARGIN = 4.0
+
+
+class StaticTextSegmentItem(QGraphicsItem):
+    """
+    링크가 없는 세그먼트를 그리는 가벼운 아이템.
+    QGraphicsTextItem처럼 QTextDocument/레이아웃 엔진/커서를 두지 않고, 줄마다 미리 배치한
+    QStaticText를 그립니다. 하이라이트는 텍스트 뒤에 배경을 칠하는 것으로 처리합니다.
+    위치와 크기 맞춤은 TextSegmentItem과 같습니다. (링크가 있는 세그먼트는 TextSegmentItem 사용)
+    """
+
+    def __init__(self, segment_data: SegmentViewData, parent=None):
+        super().__init__(parent)
+        self.segment_data = segment_data
+
+        self._original_font = QFont(segment_data.font_family, segment_data.font_size)
+        self._original_font.setBold(segment_data.is_bold)
+        self._original_font.setItalic(segment_data.is_italic)
+        self._font = self._original_font
+        self._color = segment_data.font_color
+        self._lines: List[QStaticText] = []
+        self._text_rect = QRectF()
+        self._layout_text()
+
+        # Transform for position/scale
+        natural_rect = self.boundingRect()
+        target_rect = segment_data.rect
+        scale = 1.0
+        if natural_rect.width() > 0 and natural_rect.height() > 0:
+            if (
+                natural_rect.width() > target_rect.width()
+                or natural_rect.height() > target_rect.height()
+            ):
+                scale_x = target_rect.width() / natural_rect.width()
+                scale_y = target_rect.height() / natural_rect.height()
+                scale = min(scale_x, scale_y)
+        transform = QTransform()
+        transform.translate(target_rect.left(), target_rect.top())
+        transform.scale(scale, scale)
+        transform.translate(-natural_rect.left(), -natural_rect.top())
+        self.setTransform(transform)
+        self.setAcceptHoverEvents(True)
+        self._highlighted = segment_data.is_highlighted
+        self._current_highlight_color = QColor("#ffffcc")  # Default highlight color
+        self._text_visible = True
+
+    def _layout_text(self):
+        """줄마다 QStaticText를 만들어 글리프 배치를 미리 계산해 둡니다."""
+        self._lines = []
+        width = height = 0.0
+        for line in self.segment_data.text.split("\n"):
+            static_text = QStaticText(line)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            static_text.prepare(QTransform(), self._font)
+            size = static_text.size()
+            self._lines.append(static_text)
+            width = max(width, size.width())
+            height += size.height()
+        self._text_rect = QRectF(_DOCUMENT_MARGIN, _DOCUMENT_MARGIN, width, height)
+
+    def boundingRect(self) -> QRectF:
+        return self._text_rect.adjusted(
+            -_DOCUMENT_MARGIN, -_DOCUMENT_MARGIN, _DOCUMENT_MARGIN, _DOCUMENT_MARGIN
+        )
+
+    def paint(self, painter, option, widget=None):
+        if self._highlighted:
+            if self._text_visible:
+                painter.fillRect(self._text_rect, self._current_highlight_color)
+            else:
+                # 아래에 그려진 페이지 이미지의 글자가 보이도록 반투명하게 칠합니다.
+                color = QColor(self._current_highlight_color)
+                color.setAlphaF(0.5)
+                painter.fillRect(self._text_rect, color)
+        if not self._text_visible:
+            return
+        painter.setFont(self._font)
+        painter.setPen(self._color)
+        y = self._text_rect.top()
+        for static_text in self._lines:
+            painter.drawStaticText(QPointF(self._text_rect.left(), y), static_text)
+            y += static_text.size().height()
+
+    def font(self) -> QFont:
+        return self._font
+
+    def setFont(self, font: QFont):
+        self.prepareGeometryChange()
+        self._font = font
+        self._layout_text()
+        self.update()
+
+    def set_display_font(self, font: QFont):
+        """
+        텍스트 아이템의 표시 폰트를 설정합니다.
+        원본 PDF의 폰트 속성(bold, italic)을 유지하면서 크기/패밀리만 변경합니다.
+        """
+        new_font = QFont(font.family(), font.pointSize())
+        new_font.setBold(self._original_font.bold())
+        new_font.setItalic(self._original_font.italic())
+        self.setFont(new_font)
+
+    def set_highlight_color(self, color: QColor):
+        """하이라이트 색상을 변경하고 적용합니다."""
+        self._current_highlight_color = color
+        if self._highlighted:
+            self.update()
+
+    def set_text_visible(self, visible: bool):
+        """
+        False이면 글자는 그리지 않고 하이라이트만 그립니다.
+        (페이지 이미지 위에서 호버/하이라이트만 처리하는 투명 아이템)
+        """
+        self._text_visible = visible
+        self.update()
+
+    def set_highlighted(self, highlight):
+        if self._highlighted != highlight:
+            self._highlighted = highlight
+            self.update()
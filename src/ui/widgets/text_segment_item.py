@@ -69,6 +69,7 @@ class TextSegmentItem(QGraphicsTextItem):
         self._highlighted = segment_data.is_highlighted  # Store initial highlight state
         self._current_highlight_color = QColor("#ffffcc")  # Default highlight color
         self._apply_highlight_format(self._highlighted, self._current_highlight_color)
+        self._text_visible = True
 
     def set_display_font(self, font: QFont):
         """
@@ -95,6 +96,22 @@ class TextSegmentItem(QGraphicsTextItem):
             char_format.clearBackground()
         cursor.setCharFormat(char_format)
 
+    def set_text_visible(self, visible: bool):
+        """
+        False이면 글자는 그리지 않고 하이라이트만 반투명하게 그립니다.
+        (페이지 이미지 위에서 링크 클릭과 호버만 처리하는 투명 아이템)
+        """
+        self._text_visible = visible
+        self.update()
+
+    def paint(self, painter, option, widget=None):
+        if self._text_visible:
+            super().paint(painter, option, widget)
+        elif self._highlighted:
+            color = QColor(self._current_highlight_color)
+            color.setAlphaF(0.5)
+            painter.fillRect(self.boundingRect(), color)
+
     def set_highlighted(self, highlight):
         self._highlighted = highlight
         self._apply_highlight_format(highlight, self._current_highlight_color)
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from src.common.translation_priority import (
+    PRIORITY_FAR,
+    PRIORITY_NEAR,
+    PRIORITY_VISIBLE,
+    PriorityToken,
+)
+from src.infrastructure.translation.concurrency import AdaptiveConcurrencyLimiter
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_in_flight_requests_and_reports_queue_depth():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    release = asyncio.Event()
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await release.wait()
+
+    tasks = [asyncio.create_task(request()) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 2
+    assert limiter.queue_depth == 3
+    release.set()
+    await asyncio.gather(*tasks)
+    assert peak == 2
+    assert limiter.in_flight == 0
+    assert limiter.queue_depth == 0
+
+
+def test_limiter_grows_additively_and_backs_off_multiplicatively():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=32)
+    for _ in range(40):
+        limiter._in_flight += 1
+        limiter.release(success=True, latency=0.1)
+    assert limiter.limit > 4
+
+    grown = limiter._limit
+    limiter._in_flight += 1
+    limiter.release(success=False, latency=0.1)
+    assert limiter.limit == int(grown * 0.5)
+    assert limiter.failures == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_does_not_leak_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release(success=True)
+    assert limiter.in_flight == 0
+    assert limiter.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_visible_requests_jump_queue_and_use_reserved_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+    far = PriorityToken(PRIORITY_FAR)
+    near = PriorityToken(PRIORITY_NEAR)
+    visible = PriorityToken(PRIORITY_VISIBLE)
+
+    # 백그라운드 요청은 예약된 1개를 제외한 2개 슬롯까지만 사용합니다.
+    await limiter.acquire(far)
+    await limiter.acquire(far)
+    queued_far = asyncio.create_task(limiter.acquire(far))
+    queued_near = asyncio.create_task(limiter.acquire(near))
+    await asyncio.sleep(0)
+    assert limiter.in_flight == 2
+    assert limiter.queue_depth == 2
+
+    # 보이는 페이지의 요청은 대기열을 건너뛰고 예약된 슬롯을 바로 사용합니다.
+    await asyncio.wait_for(limiter.acquire(visible), timeout=1)
+    assert limiter.in_flight == 3
+
+    # 슬롯이 반납되면 먼저 기다린 요청보다 우선순위가 높은 요청이 먼저 들어갑니다.
+    limiter.release(success=True)
+    limiter.release(success=True)
+    await asyncio.sleep(0)
+    assert queued_near.done()
+    assert not queued_far.done()
+
+    # 대기 중에 우선순위가 오르면 예약된 슬롯도 사용할 수 있습니다.
+    far.set(PRIORITY_VISIBLE)
+    await asyncio.sleep(0)
+    assert queued_far.done()
+    assert limiter.in_flight == 3
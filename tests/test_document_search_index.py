@@ -0,0 +1,47 @@
+from src.core.use_cases.document_search_index import (
+    KIND_TRANSLATED,
+    DocumentSearchIndex,
+    tokenize,
+)
+
+
+def test_tokenize_is_case_insensitive():
+    assert tokenize("Hello, PDF-World!") == ["hello", "pdf", "world"]
+
+
+def test_search_requires_all_terms_and_matches_prefixes():
+    index = DocumentSearchIndex()
+    index.add_page(
+        1,
+        [
+            ("orig_line_1_0_0", "Transformers are fast"),
+            ("orig_line_1_0_1", "Attention is all you need"),
+        ],
+    )
+    index.add_page(0, [("orig_line_0_0_0", "Attention mechanisms transform text")])
+
+    hits = index.search("attent transform")
+    assert [(hit.page_number, hit.segment_id) for hit in hits] == [
+        (0, "orig_line_0_0_0")
+    ]
+    assert [hit.page_number for hit in index.search("ATTENTION")] == [0, 1]
+    assert index.search("missing") == []
+    assert index.search("  ") == []
+    assert index.indexed_pages == {0, 1}
+
+
+def test_translated_text_is_searchable_and_replaced_per_page():
+    index = DocumentSearchIndex()
+    index.add_page(0, [("orig_line_0_0_0", "Hello world")])
+    index.add_page(0, [("trans_block_0_0", "안녕하세요 세계")], KIND_TRANSLATED)
+
+    hits = index.search("세계")
+    assert [(hit.segment_id, hit.kind) for hit in hits] == [
+        ("trans_block_0_0", KIND_TRANSLATED)
+    ]
+
+    # 같은 페이지의 번역을 다시 색인하면 이전 번역은 검색되지 않습니다.
+    index.add_page(0, [("trans_block_0_0", "반갑습니다 여러분")], KIND_TRANSLATED)
+    assert index.search("세계") == []
+    assert [hit.text for hit in index.search("반갑")] == ["반갑습니다 여러분"]
+    assert len(index) == 2
@@ -0,0 +1,85 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+
+from src.core.use_cases.document_translation_service import (
+    DocumentTranslationService,
+)
+from src.core.use_cases.translation_service import TranslationService
+from src.ui.cli import TranslationResultWriter, build_arg_parser, parse_page_range
+
+
+class DummyTranslationGateway:
+    async def translate(self, text, source, target):
+        return f"{text} (translated)"
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    path = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for page_number in range(5):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {page_number + 1}")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.mark.asyncio
+async def test_translate_document_writes_pages_in_order(sample_pdf, tmp_path):
+    pipeline = DocumentTranslationService(
+        TranslationService(DummyTranslationGateway()),
+        parse_workers=2,
+        translate_concurrency=3,
+        max_pages_ahead=2,
+    )
+    out_path = str(tmp_path / "result.json")
+    page_numbers = [0, 1, 2, 3, 4]
+    with TranslationResultWriter(out_path, {"source": sample_pdf}, page_numbers) as w:
+
+        async def on_page_done(result):
+            w.add(result)
+
+        await pipeline.translate_document(
+            sample_pdf, "en", "ko", on_page_done, page_numbers
+        )
+
+    with open(out_path, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["source"] == sample_pdf
+    assert [p["page_number"] for p in data["pages"]] == [1, 2, 3, 4, 5]
+    first_block = data["pages"][0]["blocks"][0]
+    assert first_block["source"] == "Page 1"
+    assert first_block["translation"] == "Page 1 (translated)"
+    assert data["pages"][0]["missing_blocks"] == []
+
+
+def test_parse_page_range():
+    assert parse_page_range(None, 3) == [0, 1, 2]
+    assert parse_page_range("2-3,1,9", 5) == [1, 2, 0]
+
+
+@pytest.mark.parametrize("pages", ["a-3", "1-", "2,x"])
+def test_bad_page_range_is_a_usage_error(pages, capsys):
+    with pytest.raises(SystemExit) as exited:
+        build_arg_parser().parse_args(["in.pdf", "--out", "out.json", "--pages", pages])
+    assert exited.value.code == 2
+    assert "잘못된 페이지 범위" in capsys.readouterr().err
+
+
+def test_cli_imports_without_qt():
+    # 화면이 없는 서버(libGL 없음)에서도 translate 명령을 쓸 수 있어야 합니다.
+    code = "import sys, src.ui.cli; print('PySide6' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.splitlines()[-1] == "False"
@@ -0,0 +1,138 @@
+import asyncio
+
+import fitz
+import pytest
+
+from src.adapters.gateways.fitz_pdf_parser_gateway import (
+    RENDER_JOBS_PER_WORKER,
+    FitzPdfParserGateway,
+)
+from src.core.use_cases.pdf_parsing_service import PdfParsingService
+from src.infrastructure.pdf_parsing.image_decoder import decode_image
+from src.infrastructure.pdf_parsing.page_renderer import render_page_tile
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    path = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for page_number in range(3):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {page_number + 1}")
+        page.insert_link(
+            {
+                "kind": fitz.LINK_URI,
+                "from": fitz.Rect(70, 60, 200, 80),
+                "uri": "https://example.com",
+            }
+        )
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def test_layout_round_trip_matches_direct_parsing(sample_pdf):
+    with fitz.open(sample_pdf) as doc:
+        direct = PdfParsingService.parse_page(doc[1], 1, doc)
+        layout = PdfParsingService.extract_layout(doc[1], 1)
+    rebuilt = PdfParsingService.build_view_model(layout)
+    assert rebuilt.page_number == direct.page_number == 2
+    assert [
+        (s.segment_id, s.text, s.rect.getRect(), s.link_uri)
+        for s in rebuilt.original_segments_view
+    ] == [
+        (s.segment_id, s.text, s.rect.getRect(), s.link_uri)
+        for s in direct.original_segments_view
+    ]
+    assert layout.lines[0].link_uri == "https://example.com"
+
+
+@pytest.mark.asyncio
+async def test_pages_are_parsed_in_worker_processes(sample_pdf, tmp_path):
+    gateway = FitzPdfParserGateway(workers=1, layout_cache_dir=str(tmp_path / "cache"))
+    # 문서를 지정하기 전에는 백그라운드 파싱을 할 수 없습니다.
+    assert await gateway.parse_layout_async(0) is None
+
+    gateway.open_document(sample_pdf)
+    try:
+        await asyncio.wait_for(asyncio.wrap_future(gateway._warmup), timeout=60)
+        layout = await gateway.parse_layout_async(0)
+        assert layout.page_number == 0
+        assert layout.lines[0].text == "Page 1"
+
+        gateway.prefetch([1, 2])
+        await asyncio.gather(*list(gateway._pending.values()))
+        assert (await gateway.parse_layout_async(2)).lines[0].text == "Page 3"
+    finally:
+        gateway.close()
+
+
+@pytest.mark.asyncio
+async def test_tiles_are_rendered_in_worker_processes(sample_pdf):
+    gateway = FitzPdfParserGateway(workers=1, layout_cache_dir=None)
+    assert await gateway.render_tile_async(0, 1.0, (0, 0, 100, 50)) is None
+
+    gateway.open_document(sample_pdf)
+    try:
+        tile = await asyncio.wait_for(
+            gateway.render_tile_async(0, 2.0, (0, 0, 100, 50)), timeout=60
+        )
+        assert (tile.width, tile.height) == (200, 100)
+        assert len(tile.samples) == tile.stride * tile.height
+        with fitz.open(sample_pdf) as doc:
+            expected = render_page_tile(doc[0], 2.0, (0, 0, 100, 50))
+        assert tile == expected
+    finally:
+        gateway.close()
+
+
+@pytest.mark.asyncio
+async def test_tiles_do_not_queue_ahead_of_page_parsing(sample_pdf):
+    gateway = FitzPdfParserGateway(workers=1, layout_cache_dir=None)
+    gateway.open_document(sample_pdf)
+    try:
+        await asyncio.wait_for(asyncio.wrap_future(gateway._warmup), timeout=60)
+        tiles = [
+            asyncio.ensure_future(
+                gateway.render_tile_async(0, 4.0, (0, 0, 100 + i, 100))
+            )
+            for i in range(10)
+        ]
+        await asyncio.sleep(0.1)
+        # 렌더링 워커에는 제한된 수만 맡기고 나머지는 이벤트 루프에서 기다립니다.
+        assert gateway._render_pool is not gateway._pool
+        assert (
+            len(gateway._render_pool._pending_work_items)
+            <= gateway.render_workers * RENDER_JOBS_PER_WORKER
+        )
+        layout = await asyncio.wait_for(gateway.parse_layout_async(1), timeout=60)
+        assert layout.lines[0].text == "Page 2"
+        rendered = await asyncio.wait_for(asyncio.gather(*tiles), timeout=60)
+        assert [tile.width for tile in rendered] == [4 * (100 + i) for i in range(10)]
+    finally:
+        gateway.close()
+
+
+@pytest.mark.asyncio
+async def test_images_are_decoded_in_worker_processes(tmp_path):
+    path = tmp_path / "images.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    logo = fitz.Pixmap(fitz.csCMYK, fitz.IRect(0, 0, 8, 4), 0)
+    logo.clear_with(128)
+    xref = page.insert_image(fitz.Rect(72, 72, 144, 108), pixmap=logo)
+    doc.save(str(path))
+    doc.close()
+
+    gateway = FitzPdfParserGateway(workers=1, layout_cache_dir=None)
+    assert await gateway.decode_image_async(xref) is None
+
+    gateway.open_document(str(path))
+    try:
+        image = await asyncio.wait_for(gateway.decode_image_async(xref), timeout=60)
+        # Qt가 읽지 못하는 CMYK 이미지는 RGB로 변환됩니다.
+        assert (image.width, image.height, image.format) == (8, 4, "RGB888")
+        with fitz.open(str(path)) as doc:
+            assert image == decode_image(doc, xref)
+    finally:
+        gateway.close()
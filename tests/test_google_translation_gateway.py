@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from benchmarks.translation_stub_server import StubTranslationServer
+from src.adapters.gateways.google_translation_gateway import GoogleTranslationGateway
+from src.infrastructure.translation.resilience import CircuitBreaker, RetryPolicy
+
+
+@pytest.mark.asyncio
+async def test_packed_batch_round_trip_through_stub_server():
+    async with StubTranslationServer(latency=0) as server:
+        gateway = GoogleTranslationGateway(url=server.url)
+        try:
+            texts = ["Hello", "Two\nlines", "Footer"]
+            translated = await gateway.translate_batch(texts, "en", "ko")
+        finally:
+            await gateway.close()
+    assert translated == ["<ko> Hello", "<ko> Two\n<ko> lines", "<ko> Footer"]
+    assert server.requests == 1  # 세 블록이 한 요청으로 묶여 전송됩니다.
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_retried_then_reported_as_missing():
+    async with StubTranslationServer(latency=0, error_rate=1.0) as server:
+        gateway = GoogleTranslationGateway(
+            url=server.url, retry_policy=RetryPolicy(max_attempts=3, base_delay=0)
+        )
+        try:
+            assert await gateway.translate("Hello", "en", "ko") is None
+        finally:
+            await gateway.close()
+    assert server.requests == 3
+    assert server.injected_errors == 3
+
+
+@pytest.mark.asyncio
+async def test_changing_connection_limit_keeps_in_flight_requests():
+    async with StubTranslationServer(latency=0.2) as server:
+        gateway = GoogleTranslationGateway(url=server.url, limit_per_host=4)
+        try:
+            first = asyncio.ensure_future(gateway.translate("Hello", "en", "ko"))
+            await asyncio.sleep(0.05)
+            old_session = gateway.client._session
+            gateway.client.set_limit_per_host(2)
+            second = await gateway.translate("World", "en", "ko")
+            # 기존 풀은 진행 중이던 요청이 끝난 뒤에 닫힙니다.
+            assert await first == "<ko> Hello"
+            assert second == "<ko> World"
+            assert old_session.closed
+            assert gateway.client._session.connector.limit_per_host == 2
+        finally:
+            await gateway.close()
+
+
+@pytest.mark.asyncio
+async def test_rejected_half_open_probe_closes_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    async with StubTranslationServer(latency=0) as server:
+        gateway = GoogleTranslationGateway(
+            url=server.url,
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=breaker,
+        )
+        try:
+            server.forced_status = 503
+            assert await gateway.translate("Hello", "en", "ko") is None
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+            # 시험 요청이 400을 받아도 서버는 응답했으므로 회로를 닫습니다.
+            server.forced_status = 400
+            assert await gateway.translate("Hello", "en", "ko") is None
+            assert breaker.state == CircuitBreaker.CLOSED
+            server.forced_status = None
+            assert await gateway.translate("Hello", "en", "ko") == "<ko> Hello"
+        finally:
+            await gateway.close()
+
+
+@pytest.mark.asyncio
+async def test_non_json_response_is_a_retryable_failure():
+    async with StubTranslationServer(latency=0) as server:
+        server.forced_status = 200
+        server.forced_text = "<html>blocked</html>"
+        gateway = GoogleTranslationGateway(
+            url=server.url, retry_policy=RetryPolicy(max_attempts=2, base_delay=0)
+        )
+        try:
+            assert await gateway.translate("Hello", "en", "ko") is None
+        finally:
+            await gateway.close()
+    assert server.requests == 2
@@ -0,0 +1,170 @@
+import asyncio
+import os
+
+import fitz
+import pytest
+
+from src.adapters.gateways.fitz_pdf_parser_gateway import FitzPdfParserGateway
+from src.core.entities.page_layout import ImageRecord, LineRecord, PageLayout
+from src.infrastructure.persistence import layout_cache as layout_cache_module
+from src.infrastructure.persistence.layout_cache import (
+    LayoutCache,
+    prune_layout_cache,
+)
+
+
+def make_layout(page_number, text="Hello"):
+    return PageLayout(
+        page_number,
+        612.0,
+        792.0,
+        [
+            LineRecord(
+                f"line_{page_number}_0_0",
+                f"block_{page_number}_0",
+                text,
+                (72.0, 60.0, 200.0, 80.0),
+                "Helvetica",
+                11.0,
+                False,
+                False,
+                "https://example.com",
+            )
+        ],
+        [ImageRecord(12, (10.0, 10.0, 50.0, 50.0))],
+    )
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    path = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for page_number in range(3):
+        doc.new_page().insert_text((72, 72), f"Page {page_number + 1}")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def test_layouts_survive_reopening(tmp_path):
+    path = str(tmp_path / "doc.layout")
+    cache = LayoutCache(path, page_count=1000)
+    cache.put(make_layout(999))
+    cache.put(make_layout(3, text="세 번째"))
+    assert cache.get(4) is None
+    cache.close()
+
+    reopened = LayoutCache(path, page_count=1000)
+    try:
+        assert reopened.get(999) == make_layout(999)
+        assert reopened.get(3).lines[0].text == "세 번째"
+        assert isinstance(reopened.get(3).lines[0], LineRecord)
+        assert reopened.get(0) is None
+        assert reopened.get(1000) is None
+    finally:
+        reopened.close()
+
+
+def test_cache_is_recreated_when_pymupdf_version_changes(tmp_path, monkeypatch):
+    path = str(tmp_path / "doc.layout")
+    cache = LayoutCache(path, page_count=2)
+    cache.put(make_layout(0))
+    cache.close()
+
+    monkeypatch.setattr(layout_cache_module, "_pymupdf_version", lambda: "0.0.0")
+    reopened = LayoutCache(path, page_count=2)
+    try:
+        assert reopened.get(0) is None
+    finally:
+        reopened.close()
+
+
+def test_corrupt_entry_is_treated_as_missing(tmp_path):
+    path = str(tmp_path / "doc.layout")
+    cache = LayoutCache(path, page_count=2)
+    cache.put(make_layout(1))
+    cache.close()
+
+    with open(path, "r+b") as f:
+        f.seek(-4, 2)
+        f.write(b"\xff\xff\xff\xff")
+    reopened = LayoutCache(path, page_count=2)
+    try:
+        assert reopened.get(1) is None
+        reopened.put(make_layout(1, text="다시 파싱"))
+        assert reopened.get(1).lines[0].text == "다시 파싱"
+    finally:
+        reopened.close()
+
+
+def test_rewritten_entries_are_compacted_on_reopen(tmp_path, monkeypatch):
+    monkeypatch.setattr(layout_cache_module, "_COMPACT_MIN_DEAD_BYTES", 0)
+    path = str(tmp_path / "doc.layout")
+    cache = LayoutCache(path, page_count=3)
+    for attempt in range(5):
+        cache.put(make_layout(0, text=f"시도 {attempt}"))
+    cache.put(make_layout(2))
+    cache.close()
+    sparse_size = os.path.getsize(path)
+
+    reopened = LayoutCache(path, page_count=3)
+    try:
+        assert os.path.getsize(path) < sparse_size
+        assert reopened.get(0).lines[0].text == "시도 4"
+        assert reopened.get(1) is None
+        assert reopened.get(2) == make_layout(2)
+    finally:
+        reopened.close()
+
+
+def test_prune_removes_least_recently_used_caches(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    paths = []
+    for index, name in enumerate(["a" * 64, "b" * 64, "c" * 64]):
+        path = str(cache_dir / f"{name}.layout")
+        cache = LayoutCache(path, page_count=1)
+        cache.put(make_layout(0))
+        cache.close()
+        os.utime(path, (1000 + index, 1000 + index))  # a가 가장 오래됨
+        (cache_dir / f"key_{name[0]}.key").write_text(name, encoding="ascii")
+        paths.append(path)
+    size = os.path.getsize(paths[0])
+
+    # 가장 오래된 a는 지금 쓰는 캐시이므로 남기고, 그다음으로 오래된 b를 지웁니다.
+    prune_layout_cache(str(cache_dir), max_bytes=size * 2, keep=[paths[0]])
+    assert [os.path.exists(path) for path in paths] == [True, False, True]
+    assert sorted(p.name for p in cache_dir.glob("*.key")) == ["key_a.key", "key_c.key"]
+
+
+@pytest.mark.asyncio
+async def test_reopened_document_is_served_from_disk_without_workers(
+    sample_pdf, tmp_path, monkeypatch
+):
+    cache_dir = str(tmp_path / "cache")
+    gateway = FitzPdfParserGateway(workers=1, layout_cache_dir=cache_dir)
+    gateway.open_document(sample_pdf)
+    opening = gateway._disk_cache_future
+    with fitz.open(sample_pdf) as doc:
+        # 처음 보는 문서의 캐시는 백그라운드에서 열리며, 그 전에 파싱한 페이지도 저장됩니다.
+        gateway.parse_page(doc[2], 2, doc)
+    await asyncio.wrap_future(opening)
+    assert gateway._current_disk_cache().get(2) is not None
+    gateway.close()
+
+    # 같은 파일을 다시 열 때는 내용 해시를 다시 계산하지 않습니다.
+    monkeypatch.setattr(
+        layout_cache_module,
+        "file_content_hash",
+        lambda path: pytest.fail("content hash recomputed"),
+    )
+    reopened = FitzPdfParserGateway(workers=1, layout_cache_dir=cache_dir)
+    reopened.open_document(sample_pdf, page_count=3)
+    try:
+        assert reopened._disk_cache_future is None
+        # 워커가 준비되기 전이라도 디스크에 있는 페이지는 바로 반환됩니다.
+        layout = await reopened.parse_layout_async(2)
+        assert layout is not None
+        assert layout.lines[0].text == "Page 3"
+    finally:
+        reopened.close()
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from src.common.translation_priority import PRIORITY_FAR, PRIORITY_VISIBLE
+from src.core.use_cases.page_translation_jobs import PageTranslationJobs
+from src.core.use_cases.translation_service import TranslationService
+from src.infrastructure.dtos.pdf_view_dtos import SegmentViewData
+
+
+class SlowTranslationGateway:
+    """release 이벤트가 설정될 때까지 응답을 미루고, fail에 있는 텍스트는 실패시킵니다."""
+
+    def __init__(self, fail=()):
+        self.requested = []
+        self.release = asyncio.Event()
+        self.fail = set(fail)
+
+    async def translate(self, text, source, target):
+        self.requested.append(text)
+        await self.release.wait()
+        if text in self.fail:
+            return None
+        return f"{text} (translated)"
+
+
+def make_segment(segment_id, text, block_id):
+    return SegmentViewData(
+        segment_id=segment_id,
+        text=text,
+        rect=(0, 0, 100, 20),
+        font_family="Arial",
+        font_size=10,
+        font_color="#000000",
+        is_bold=False,
+        is_italic=False,
+        is_highlighted=False,
+        block_id=block_id,
+    )
+
+
+SEGMENTS = [
+    make_segment("orig_1", "Hello", "block_0_0"),
+    make_segment("orig_2", "Footer", "block_0_1"),
+]
+KEY = PageTranslationJobs.make_key("doc", 0, "en", "ko")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_job():
+    gateway = SlowTranslationGateway()
+    jobs = PageTranslationJobs(TranslationService(gateway))
+
+    first = jobs.start(KEY, SEGMENTS, "en", "ko")
+    second = jobs.start(KEY, SEGMENTS, "en", "ko")
+    assert first is second
+    assert jobs.in_flight_keys() == [KEY]
+
+    await asyncio.sleep(0)
+    gateway.release.set()
+    results = await asyncio.gather(first.wait(), second.wait())
+    assert (
+        results[0]
+        == results[1]
+        == {
+            "block_0_0": "Hello (translated)",
+            "block_0_1": "Footer (translated)",
+        }
+    )
+    assert sorted(gateway.requested) == ["Footer", "Hello"]
+    assert jobs.in_flight_keys() == []
+
+    # 끝난 작업은 보관되어 다시 요청해도 번역 API를 호출하지 않습니다.
+    assert jobs.start(KEY, SEGMENTS, "en", "ko") is first
+    assert len(gateway.requested) == 2
+
+
+@pytest.mark.asyncio
+async def test_late_subscriber_receives_earlier_results():
+    gateway = SlowTranslationGateway()
+    gateway.release.set()
+    jobs = PageTranslationJobs(TranslationService(gateway))
+    job = jobs.start(KEY, SEGMENTS, "en", "ko")
+    await job.wait()
+
+    streamed = [item async for item in job.stream()]
+    assert dict(streamed) == job.results
+    assert len(streamed) == 2
+
+
+@pytest.mark.asyncio
+async def test_partial_result_requests_only_missing_blocks():
+    gateway = SlowTranslationGateway(fail={"Footer"})
+    gateway.release.set()
+    jobs = PageTranslationJobs(TranslationService(gateway))
+    first = jobs.start(KEY, SEGMENTS, "en", "ko")
+    assert (await first.wait())["block_0_1"] is None
+
+    gateway.fail.clear()
+    gateway.requested.clear()
+    retry = jobs.start(KEY, SEGMENTS, "en", "ko")
+    assert retry is not first
+    assert await retry.wait() == {
+        "block_0_0": "Hello (translated)",
+        "block_0_1": "Footer (translated)",
+    }
+    assert gateway.requested == ["Footer"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_subscriber_does_not_cancel_job():
+    gateway = SlowTranslationGateway()
+    jobs = PageTranslationJobs(TranslationService(gateway))
+    job = jobs.start(KEY, SEGMENTS, "en", "ko")
+
+    async def subscribe():
+        async for _ in job.stream():
+            pass
+
+    subscriber = asyncio.ensure_future(subscribe())
+    await asyncio.sleep(0)
+    subscriber.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await subscriber
+
+    gateway.release.set()
+    assert len(await job.wait()) == 2
+
+
+@pytest.mark.asyncio
+async def test_retain_cancels_jobs_outside_window_and_keeps_partial_results():
+    gateway = SlowTranslationGateway()
+    jobs = PageTranslationJobs(TranslationService(gateway))
+    visible_key = PageTranslationJobs.make_key("doc", 1, "en", "ko")
+    stale_key = PageTranslationJobs.make_key("doc", 5, "en", "ko")
+    visible = jobs.start(visible_key, SEGMENTS, "en", "ko", priority=PRIORITY_FAR)
+    stale = jobs.start(stale_key, SEGMENTS, "en", "ko", priority=PRIORITY_FAR)
+    await asyncio.sleep(0)
+
+    jobs.retain({visible_key: PRIORITY_VISIBLE})
+    assert visible.priority.value == PRIORITY_VISIBLE
+    with pytest.raises(asyncio.CancelledError):
+        await stale.task
+    assert jobs.in_flight_keys() == [visible_key]
+
+    gateway.release.set()
+    assert len(await visible.wait()) == 2
@@ -0,0 +1,149 @@
+import asyncio
+
+import fitz
+import pytest
+
+from src.adapters.controllers.pdf_controller import PdfController
+from src.common.translation_priority import priority_for_distance
+from src.core.use_cases.pdf_parsing_service import PdfParsingService
+from src.core.use_cases.translation_service import TranslationService
+
+
+class DummyTranslationGateway:
+    async def translate(self, text, source, target):
+        return f"{text} (translated)"
+
+
+class BlockingTranslationGateway:
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    async def translate(self, text, source, target):
+        await self.release.wait()
+        return f"{text} (translated)"
+
+
+class CountingParser:
+    def __init__(self):
+        self.parsed = []
+
+    def parse_page(self, page, page_number, pdf_doc):
+        self.parsed.append(page_number)
+        return PdfParsingService.parse_page(page, page_number, pdf_doc)
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    path = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for page_number in range(3):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {page_number + 1}")
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+def make_controller(cache_size=16):
+    parser = CountingParser()
+    controller = PdfController(
+        translation_service=TranslationService(DummyTranslationGateway()),
+        pdf_parser=parser,
+        view_model_cache_size=cache_size,
+    )
+    return controller, parser
+
+
+def test_recently_seen_pages_are_not_parsed_again(sample_pdf):
+    controller, parser = make_controller()
+    controller.open_pdf(sample_pdf)
+
+    first = controller.get_page_view_model(0)
+    controller.get_page_view_model(1)
+    again = controller.get_page_view_model(0)
+    controller.load_page_view_model(1)  # 프리페치도 같은 캐시를 사용합니다.
+
+    assert parser.parsed == [0, 1]
+    assert controller.get_view_model_cache_stats()["hits"] == 2
+    assert controller.get_view_model_cache_stats()["misses"] == 2
+    assert [s.text for s in again.original_segments_view] == [
+        s.text for s in first.original_segments_view
+    ]
+
+    # 화면에서 바꾼 번역 결과와 하이라이트는 캐시에 남지 않고,
+    # 같은 페이지를 다시 꺼내도 이미 화면에 있는 세그먼트는 바뀌지 않습니다.
+    first.translated_segments_view = []
+    first.original_segments_view[0].is_highlighted = True
+    fresh = controller.get_page_view_model(0)
+    assert fresh.translated_segments_view
+    assert not fresh.original_segments_view[0].is_highlighted
+    assert first.original_segments_view[0].is_highlighted
+
+
+def test_view_model_cache_is_bounded(sample_pdf):
+    controller, parser = make_controller(cache_size=2)
+    controller.open_pdf(sample_pdf)
+    for page_number in (0, 1, 2, 0):
+        controller.get_page_view_model(page_number)
+    assert parser.parsed == [0, 1, 2, 0]
+    assert controller.get_view_model_cache_stats()["entries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_search_index_covers_original_and_translated_text(sample_pdf):
+    controller, _parser = make_controller()
+    controller.open_pdf(sample_pdf)
+
+    progress = []
+    await controller.start_document_analysis(
+        lambda indexed, total: progress.append((indexed, total))
+    )
+    assert progress[-1] == (3, 3)
+    assert [hit.page_number for hit in controller.search("page 2")] == [1]
+
+    job = controller.start_page_translation(2, "en", "ko")
+    await job.wait()
+    await asyncio.sleep(0)  # 완료 콜백에서 번역문을 색인합니다.
+    hits = controller.search("translated")
+    assert [(hit.page_number, hit.segment_id[:6]) for hit in hits] == [(2, "trans_")]
+
+
+def test_page_sizes_are_read_without_parsing(sample_pdf):
+    controller, parser = make_controller()
+    controller.open_pdf(sample_pdf)
+    assert controller.get_page_sizes() == [(595.0, 842.0)] * 3
+    assert parser.parsed == []
+
+
+@pytest.mark.asyncio
+async def test_translation_window_keeps_every_visible_page(tmp_path):
+    path = tmp_path / "long.pdf"
+    with fitz.open() as doc:
+        for page_number in range(6):
+            doc.new_page().insert_text((72, 72), f"Page {page_number + 1}")
+        doc.save(str(path))
+    gateway = BlockingTranslationGateway()
+    controller = PdfController(
+        translation_service=TranslationService(gateway), pdf_parser=CountingParser()
+    )
+    controller.open_pdf(str(path))
+    jobs = {
+        page_number: controller.start_page_translation(page_number, "en", "ko")
+        for page_number in range(6)
+    }
+    await asyncio.sleep(0)
+
+    # 연속 스크롤로 2, 3페이지가 함께 보이면 둘 다 현재 페이지로 보고 그 뒤를 미리 번역합니다.
+    controller.update_translation_window(1, 1, "en", "ko", visible_pages=[1, 2])
+    for page_number in (0, 4, 5):
+        with pytest.raises(asyncio.CancelledError):
+            await jobs[page_number].task
+    await asyncio.sleep(0)  # 작업이 끝나면 완료 콜백에서 목록에서 빠집니다.
+    in_flight = controller.translation_jobs.in_flight_keys()
+    assert sorted(key[1] for key in in_flight) == [1, 2, 3]
+    assert jobs[2].priority.value == jobs[1].priority.value == priority_for_distance(0)
+    assert jobs[3].priority.value == priority_for_distance(1)
+
+    gateway.release.set()
+    for page_number in (1, 2, 3):
+        assert len(await jobs[page_number].wait()) == 1
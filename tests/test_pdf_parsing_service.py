@@ -15,3 +15,44 @@ def test_parse_page_returns_view_model():
     assert len(view_model.original_segments_view) > 0
     assert view_model.original_segments_view[0].text == "Hello PDF!"
     doc.close()
+
+
+def test_segments_are_compact_and_translated_view_is_derived():
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Hello PDF!")
+    view_model = PdfParsingService.parse_page(page, 0, doc)
+    seg = view_model.original_segments_view[0]
+    assert not hasattr(seg, "__dict__")
+    # Qt 객체는 처음 접근할 때 만들어집니다.
+    assert seg._rect is None and seg._font_color is None
+    assert seg.rect.width() == seg.bounds[2]
+
+    placeholders = view_model.translated_segments_view
+    assert [s.segment_id for s in placeholders] == ["trans_line_0_0_0"]
+    assert placeholders[0].text == "Hello PDF!"
+    # 한 번 만든 목록을 다시 읽어도 같은 세그먼트이므로 화면 상태가 유지됩니다.
+    placeholders[0].is_highlighted = True
+    assert view_model.translated_segments_view is placeholders
+    assert view_model.translated_segments_view[0].is_highlighted
+    view_model.translated_segments_view = []
+    assert view_model.translated_segments_view == []
+    doc.close()
+
+
+def test_image_placements_include_repeated_xrefs_and_pixel_info():
+    doc = fitz.open()
+    page = doc.new_page()
+    image = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 4), False)
+    image.clear_with(200)
+    xref = page.insert_image(fitz.Rect(10, 10, 50, 30), pixmap=image)
+    page.insert_image(fitz.Rect(100, 200, 140, 220), xref=xref)
+    view_model = PdfParsingService.parse_page(page, 0, doc)
+    images = view_model.image_views
+    assert [img.xref for img in images] == [xref, xref]
+    assert sorted(img.bounds[:2] for img in images) == [(10, 10), (100, 200)]
+    assert all(
+        (img.pixel_width, img.pixel_height, img.colorspace) == (8, 4, 3)
+        for img in images
+    )
+    doc.close()
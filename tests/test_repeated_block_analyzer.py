@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from src.common.translation_priority import (
+    PRIORITY_FAR,
+    PriorityToken,
+    translation_priority,
+)
+from src.core.use_cases.repeated_block_analyzer import (
+    RepeatedBlockAnalyzer,
+    block_template,
+    fill_numbers,
+    needs_translation,
+)
+from src.core.use_cases.translation_service import TranslationService
+from src.infrastructure.dtos.pdf_view_dtos import SegmentViewData
+
+FOOTER_RECT = (250, 760, 100, 12)
+BODY_RECT = (72, 100, 400, 20)
+BODY_TEXTS = ["Install", "Configure", "Connect", "Verify", "Update", "Remove"]
+
+
+class RecordingGateway:
+    def __init__(self):
+        self.requested = []
+
+    async def translate(self, text, source, target):
+        self.requested.append(text)
+        await asyncio.sleep(0.01)
+        return f"<{text}>"
+
+
+def make_segment(page, block, text, rect):
+    return SegmentViewData(
+        segment_id=f"orig_line_{page}_{block}_0",
+        text=text,
+        rect=rect,
+        font_family="Arial",
+        font_size=10,
+        font_color="#000000",
+        is_bold=False,
+        is_italic=False,
+        is_highlighted=False,
+        block_id=f"block_{page}_{block}",
+    )
+
+
+def make_page(page):
+    return [
+        make_segment(page, 0, f"{BODY_TEXTS[page]} the device", BODY_RECT),
+        make_segment(page, 1, f"Page {page + 1} of 40", FOOTER_RECT),
+        make_segment(page, 2, f"- {page + 1} -", (290, 20, 20, 12)),
+    ]
+
+
+def test_templates_mask_numbers_and_whitespace():
+    assert block_template("Page  3 of\n120") == "Page # of #"
+    assert not needs_translation("- 12 -")
+    assert not needs_translation("2024.01.31")
+    assert needs_translation("Chapter 3")
+    assert needs_translation("제 3 장")
+
+
+def test_fill_numbers_reorders_numbers_by_value():
+    assert fill_numbers("Page 3 of 40", "40쪽 중 3쪽", "Page 7 of 40") == "40쪽 중 7쪽"
+    # 번역에서 숫자가 사라졌거나 대응이 모호하면 재사용하지 않습니다.
+    assert fill_numbers("Page 3 of 40", "마지막 쪽", "Page 7 of 40") is None
+    assert fill_numbers("4 of 5", "4 중 5", "3 of 3") == "3 중 3"
+    assert fill_numbers("3 of 3", "3 중 3", "4 of 5") is None
+
+
+def test_blocks_repeated_at_the_same_position_are_detected():
+    analyzer = RepeatedBlockAnalyzer(min_pages=3)
+    for page in range(2):
+        analyzer.add_page_segments(page, make_page(page))
+    footer_bbox = (250, 760, 350, 772)
+    assert not analyzer.is_repeated("Page 9 of 40", footer_bbox)
+    analyzer.add_page_segments(2, make_page(2))
+    assert analyzer.is_repeated("Page 9 of 40", footer_bbox)
+    # 같은 텍스트라도 다른 위치에 있으면 반복 블록이 아닙니다.
+    assert not analyzer.is_repeated("Page 9 of 40", (72, 300, 172, 312))
+    assert analyzer.repeated_templates()["Page # of #"] == 3
+
+
+@pytest.mark.asyncio
+async def test_repeated_blocks_are_translated_once_per_document():
+    analyzer = RepeatedBlockAnalyzer()
+    pages = [make_page(page) for page in range(6)]
+    for page, segments in enumerate(pages):
+        analyzer.add_page_segments(page, segments)
+    gateway = RecordingGateway()
+    service = TranslationService(gateway, repeated_blocks=analyzer)
+
+    # 프리페치처럼 여러 페이지를 동시에 번역해도 꼬리말은 한 번만 요청합니다.
+    results = await asyncio.gather(
+        *(service.translate_segments(segments, "en", "ko") for segments in pages)
+    )
+
+    footers = [text for text in gateway.requested if text.startswith("Page ")]
+    assert len(footers) == 1
+    assert not any(text.startswith("- ") for text in gateway.requested)
+    assert len(gateway.requested) == 7  # 본문 6개 + 꼬리말 1개
+    for page, translated in enumerate(results):
+        assert translated[f"block_{page}_1"] == f"<Page {page + 1} of 40>"
+        assert translated[f"block_{page}_2"] == f"- {page + 1} -"
+
+
+@pytest.mark.asyncio
+async def test_visible_page_does_not_wait_for_background_template_translation():
+    analyzer = RepeatedBlockAnalyzer()
+    pages = [make_page(page) for page in range(4)]
+    for page, segments in enumerate(pages):
+        analyzer.add_page_segments(page, segments)
+    release_far = asyncio.Event()
+
+    class SlowFooterGateway(RecordingGateway):
+        async def translate(self, text, source, target):
+            if text == "Page 4 of 40":
+                await release_far.wait()  # 먼 프리페치 페이지의 꼬리말
+            return await super().translate(text, source, target)
+
+    gateway = SlowFooterGateway()
+    service = TranslationService(gateway, repeated_blocks=analyzer)
+
+    async def translate_far_page():
+        with translation_priority(PriorityToken(PRIORITY_FAR)):
+            return await service.translate_segments(pages[3], "en", "ko")
+
+    far = asyncio.ensure_future(translate_far_page())
+    await asyncio.sleep(0)  # 먼 페이지가 꼬리말 템플릿을 먼저 맡습니다.
+    visible = await asyncio.wait_for(
+        service.translate_segments(pages[1], "en", "ko"), timeout=5
+    )
+    assert visible["block_1_1"] == "<Page 2 of 40>"
+    assert not far.done()
+
+    # 보이는 페이지가 먼저 번역한 결과를 다른 페이지가 재사용합니다.
+    release_far.set()
+    near = await service.translate_segments(pages[2], "en", "ko")
+    assert near["block_2_1"] == "<Page 3 of 40>"
+    assert (await far)["block_3_1"] == "<Page 4 of 40>"
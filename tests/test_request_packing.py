@@ -0,0 +1,34 @@
+from src.infrastructure.translation.request_packing import (
+    encoded_length,
+    join_batch,
+    pack_batches,
+    split_batch,
+)
+
+
+def test_join_and_split_round_trip():
+    texts = ["First block", "Second\nblock with two lines", "Third"]
+    packed = join_batch(texts)
+    assert split_batch(packed, len(texts)) == texts
+
+
+def test_split_tolerates_whitespace_changes_around_markers():
+    translated = "[[ 0 ]] 첫 번째\n\n[[1]]두 번째 블록\n[[2 ]]\n세 번째 "
+    assert split_batch(translated, 3) == ["첫 번째", "두 번째 블록", "세 번째"]
+
+
+def test_split_rejects_damaged_markers():
+    assert split_batch("[[0]]\nA\n[[2]]\nC", 3) is None  # 표지 누락
+    assert split_batch("[[0]]\nA\n[[1]]\n", 2) is None  # 빈 블록
+    assert split_batch("prefix [[0]]\nA", 1) is None  # 첫 표지 앞의 잔여 텍스트
+    assert split_batch(None, 1) is None
+
+
+def test_pack_batches_respects_size_limit_and_order():
+    texts = [f"cell {i}" for i in range(50)] + ["x" * 400]
+    batches = pack_batches(texts, max_encoded_length=200)
+    assert [i for batch in batches for i in batch] == list(range(len(texts)))
+    for batch in batches:
+        packed = join_batch([texts[i] for i in batch])
+        assert len(batch) == 1 or encoded_length(packed) <= 200
+    assert batches[-1] == [50]  # 제한보다 긴 텍스트는 단독 묶음
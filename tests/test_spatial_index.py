@@ -0,0 +1,34 @@
+import random
+
+import fitz
+
+from src.common.spatial_index import GridSpatialIndex
+
+
+def random_rect(rng, page_width=600, page_height=800):
+    x0 = rng.uniform(-20, page_width)
+    y0 = rng.uniform(-20, page_height)
+    return (x0, y0, x0 + rng.uniform(0, 300), y0 + rng.uniform(0, 30))
+
+
+def test_query_matches_brute_force_in_insertion_order():
+    rng = random.Random(7)
+    links = [(random_rect(rng), f"uri_{i}") for i in range(200)]
+    index = GridSpatialIndex.from_items(links, cell_size=40)
+    for _ in range(200):
+        line = random_rect(rng)
+        expected = [
+            uri for rect, uri in links if fitz.Rect(rect).intersects(fitz.Rect(line))
+        ]
+        assert index.query(line) == expected
+        assert index.first(line) == (expected[0] if expected else None)
+
+
+def test_empty_and_oversized_rects():
+    index = GridSpatialIndex(cell_size=10)
+    index.insert((5, 5, 5, 50), "empty")
+    index.insert((-1e6, -1e6, 1e6, 1e6), "whole_page")
+    index.insert((0, 0, 10, 10), "small")
+    assert index.query((1, 1, 2, 2)) == ["whole_page", "small"]
+    assert index.query((3, 3, 3, 3)) == []
+    assert len(index) == 3
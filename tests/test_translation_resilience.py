@@ -0,0 +1,60 @@
+import pytest
+
+from src.infrastructure.translation import resilience
+from src.infrastructure.translation.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    is_retryable_status,
+)
+
+
+def test_retry_delay_is_jittered_within_exponential_cap():
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+    for retry_number, cap in [(0, 0.5), (1, 1.0), (2, 2.0), (5, 4.0)]:
+        delays = [policy.delay(retry_number) for _ in range(50)]
+        assert all(0 <= d <= cap for d in delays)
+
+
+def test_retryable_statuses():
+    assert is_retryable_status(None)
+    assert is_retryable_status(429)
+    assert is_retryable_status(503)
+    assert not is_retryable_status(400)
+
+
+def test_circuit_breaker_opens_and_recovers(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    now[0] += 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()  # 시험 요청 하나만 허용
+    assert not breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    now[0] += 10
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+@pytest.mark.parametrize("cancel_probe", [True, False])
+def test_half_open_probe_released_when_cancelled(monkeypatch, cancel_probe):
+    now = [0.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=1)
+    breaker.record_failure()
+    now[0] += 1
+    assert breaker.allow_request()
+    if cancel_probe:
+        breaker.record_cancelled()
+    assert breaker.allow_request() is cancel_probe
@@ -1,14 +1,37 @@
+import asyncio
+import sys
+
 import pytest
 
 from src.core.use_cases.translation_service import TranslationService
 from src.infrastructure.dtos.pdf_view_dtos import SegmentViewData
+from src.infrastructure.persistence.translation_memory import SqliteTranslationMemory
 
 
 class DummyTranslationGateway:
+    def __init__(self):
+        self.requested = []
+
     async def translate(self, text, source, target):
+        self.requested.append(text)
         return f"{text} (translated)"
 
 
+def make_segment(segment_id, text, block_id=None):
+    return SegmentViewData(
+        segment_id=segment_id,
+        text=text,
+        rect=(0, 0, 100, 20),
+        font_family="Arial",
+        font_size=10,
+        font_color="#000000",
+        is_bold=False,
+        is_italic=False,
+        is_highlighted=False,
+        block_id=block_id,
+    )
+
+
 @pytest.mark.asyncio
 async def test_translate_segments_and_build():
     segs = [
@@ -26,8 +49,139 @@ async def test_translate_segments_and_build():
     ]
     service = TranslationService(DummyTranslationGateway())
     translated = await service.translate_segments(segs, "en", "ko")
-    assert isinstance(translated, list)
+    assert isinstance(translated, dict)
     assert len(translated) == 1
-    assert translated[0].endswith("(translated)")
+    assert translated[None].endswith("(translated)")
     segs2 = service.build_translated_segments(segs, translated)
-    assert segs2[0].text == translated[0]
+    assert segs2[0].text == translated[None]
+
+
+@pytest.mark.asyncio
+async def test_translate_segments_uses_translation_memory(tmp_path):
+    memory = SqliteTranslationMemory(str(tmp_path / "tm.db"))
+    segs = [
+        make_segment("orig_1", "Hello", block_id="block_0_0"),
+        make_segment("orig_2", "world", block_id="block_0_0"),
+        make_segment("orig_3", "Footer", block_id="block_0_1"),
+    ]
+    gateway = DummyTranslationGateway()
+    service = TranslationService(gateway, memory=memory)
+
+    first = await service.translate_segments(segs, "en", "ko")
+    assert first == {
+        "block_0_0": "Hello\nworld (translated)",
+        "block_0_1": "Footer (translated)",
+    }
+    assert len(gateway.requested) == 2
+
+    # 공백만 다른 원문도 같은 키로 조회되어 게이트웨이를 다시 호출하지 않습니다.
+    segs[2].text = "  Footer "
+    second = await service.translate_segments(segs, "en", "ko")
+    assert second == first
+    assert len(gateway.requested) == 2
+    memory.close()
+
+
+def test_translation_memory_evicts_least_recently_used(tmp_path):
+    memory = SqliteTranslationMemory(str(tmp_path / "tm.db"), max_entries=2)
+    memory.put("a", "A", "en", "ko")
+    memory.put("b", "B", "en", "ko")
+    assert memory.get("a", "en", "ko") == "A"  # "a"를 최근 사용으로 갱신
+    memory.put("c", "C", "en", "ko")
+    assert len(memory) == 2
+    assert memory.get("b", "en", "ko") is None
+    assert memory.get("a", "en", "ko") == "A"
+    assert memory.get("a", "en", "ja") is None
+    memory.close()
+
+
+def test_translation_memory_keeps_lookups_across_reopen(tmp_path):
+    path = str(tmp_path / "tm.db")
+    memory = SqliteTranslationMemory(path, max_entries=2)
+    memory.put("a", "A", "en", "ko")
+    memory.put("b", "B", "en", "ko")
+    assert memory.get("a", "en", "ko") == "A"
+    memory.close()  # 모아 둔 사용 시각이 여기서 기록됩니다.
+
+    memory = SqliteTranslationMemory(path, max_entries=2)
+    memory.put("c", "C", "en", "ko")
+    assert memory.get("a", "en", "ko") == "A"
+    assert memory.get("b", "en", "ko") is None
+    memory.close()
+
+
+def test_translation_memory_defaults_to_user_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    memory = SqliteTranslationMemory()
+    assert memory.path == str(tmp_path / "pdf_dual_viewer" / "translation_memory.db")
+    memory.close()
+
+
+class FlakyTranslationGateway(DummyTranslationGateway):
+    def __init__(self, failing_texts):
+        super().__init__()
+        self.failing_texts = set(failing_texts)
+
+    async def translate(self, text, source, target):
+        self.requested.append(text)
+        if text in self.failing_texts:
+            return None
+        return f"{text} (translated)"
+
+
+@pytest.mark.asyncio
+async def test_retranslation_requests_only_missing_blocks():
+    segs = [
+        make_segment("orig_1", "Title", block_id="block_0_0"),
+        make_segment("orig_2", "Body", block_id="block_0_1"),
+    ]
+    gateway = FlakyTranslationGateway(failing_texts={"Body"})
+    service = TranslationService(gateway)
+
+    partial = await service.translate_segments(segs, "en", "ko")
+    assert partial == {"block_0_0": "Title (translated)", "block_0_1": None}
+    assert service.missing_blocks(segs, partial) == ["block_0_1"]
+    assert [s.segment_id for s in service.build_translated_segments(segs, partial)] == [
+        "trans_block_0_0"
+    ]
+
+    gateway.failing_texts.clear()
+    gateway.requested.clear()
+    complete = await service.translate_segments(segs, "en", "ko", previous=partial)
+    assert gateway.requested == ["Body"]
+    assert service.missing_blocks(segs, complete) == []
+
+
+class SlowFirstGateway(DummyTranslationGateway):
+    async def translate(self, text, source, target):
+        self.requested.append(text)
+        if text == "slow":
+            await asyncio.sleep(0.05)
+        return f"{text} (translated)"
+
+
+@pytest.mark.asyncio
+async def test_iter_translations_yields_blocks_as_they_complete(tmp_path):
+    memory = SqliteTranslationMemory(str(tmp_path / "tm.db"))
+    memory.put("cached", "cached (from memory)", "en", "ko")
+    segs = [
+        make_segment("orig_1", "slow", block_id="block_0_0"),
+        make_segment("orig_2", "fast", block_id="block_0_1"),
+        make_segment("orig_3", "cached", block_id="block_0_2"),
+    ]
+    service = TranslationService(SlowFirstGateway(), memory=memory)
+
+    results = [item async for item in service.iter_translations(segs, "en", "ko")]
+    assert results == [
+        ("block_0_2", "cached (from memory)"),
+        ("block_0_1", "fast (translated)"),
+        ("block_0_0", "slow (translated)"),
+    ]
+    # translate_segments는 스트림 결과를 원래 블록 순서로 모읍니다.
+    assert list(await service.translate_segments(segs, "en", "ko")) == [
+        "block_0_0",
+        "block_0_1",
+        "block_0_2",
+    ]
+    memory.close()